@@ -1,11 +1,15 @@
 # agents/dia/graph.py
 from __future__ import annotations
 
+import asyncio
+import contextlib
+import functools
+import re
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, TextIO
 
 import pandas as pd
-import matplotlib.pyplot as plt
 
 from core.agent.reviewer import ReviewSpec, review_execution
 from core.agent.stages import (
@@ -29,9 +33,29 @@ from core.utils.time import ts
 from core.llm.client import LLMClient
 from core.llm.prompts import load_prompt, default_insight_prompt
 from core.llm.validators import ensure_sections
-from core.tools.file_loader import load_file
-
-from agents.dia.report import ReportInputs, build_markdown_report
+from core.tools.file_loader import aload_file, read_csv_header, resolve_loader
+from core.tools.data_analysis import (
+    CrossAnalysis,
+    DataProfile,
+    TimeSeriesProfile,
+    aprofile_csv,
+    cross_analysis,
+    time_series_profile,
+)
+from core.tools.plot_cache import PlotCache
+from core.tools.report_writer import SectionSink, SectionWriter
+from core.tools.plotting import ChartSpec, arender_chart
+
+from agents.dia.report import (
+    charts_section,
+    header_section,
+    insights_section,
+    time_series_section,
+    write_cross_analysis_section,
+    write_describe_section,
+    write_full_stats_section,
+    write_head_section,
+)
 from agents.dia.insights import rule_based_insights
 
 
@@ -39,6 +63,86 @@ def _artifact_dir(settings: Any) -> Path:
     return Path(getattr(settings, "WORKSPACE_DIR", "workspace")) / "artifacts"
 
 
+def _loader_kwargs(settings: Any) -> Dict[str, Any]:
+    """
+    DIA가 load_file()/aload_file()에 넘기는 옵션.
+    - dtype 압축(compact) 항상 사용, PDF 추출 워커 수 = LOAD_CONCURRENCY
+    - 샘플링: DIA_SAMPLE_MODE (stratified인데 기준 컬럼 설정이 없으면 reservoir,
+      설정된 컬럼이 업로드 CSV에 없는 경우는 _analyze_file에서 파일별로 reservoir 대체)
+    - 파싱 캐시: WORKSPACE_DIR/cache/parse (PARSE_CACHE_ENABLED=false면 미사용)
+    """
+    # PDF 페이지 병렬 추출 프로세스 수도 LOAD_CONCURRENCY로 제한(동시 업로드마다 풀이 생기므로)
+    kwargs: Dict[str, Any] = {"compact": True, "pdf_workers": _load_concurrency(settings)}
+
+    sample = str(getattr(settings, "DIA_SAMPLE_MODE", "reservoir") or "head").strip().lower()
+    stratify_by = getattr(settings, "DIA_STRATIFY_BY", None) or None
+    if sample == "stratified" and not stratify_by:
+        sample = "reservoir"
+    kwargs["sample"] = sample
+    if sample == "stratified":
+        kwargs["stratify_by"] = str(stratify_by)
+
+    if bool(getattr(settings, "PARSE_CACHE_ENABLED", True)):
+        cache_dir = Path(getattr(settings, "WORKSPACE_DIR", "workspace")) / "cache" / "parse"
+        max_mb = int(getattr(settings, "PARSE_CACHE_MAX_MB", 512))
+        kwargs.update({"cache_dir": str(cache_dir), "cache_max_bytes": max_mb * 1024 * 1024})
+    return kwargs
+
+
+def _stratify_column_missing(file_path: str, column: str) -> bool:
+    # 층화 기준 컬럼이 CSV 헤더에 없는지(CSV가 아니거나 헤더를 못 읽으면 False → 판단은 로더에 맡김)
+    spec = resolve_loader(Path(file_path))
+    if spec is None or spec.kind != "csv":
+        return False
+    try:
+        return column not in read_csv_header(file_path)
+    except Exception:
+        return False
+
+
+async def _save_time_series_plot(settings: Any, series: Optional[TimeSeriesProfile], title: str) -> Path | None:
+    # 시계열 차트: primary 주기 평균 + 이동 평균/표준편차 밴드(점 수 = 기간 수, 숫자 컬럼 상위 2개)
+    if series is None or not series.numeric_columns:
+        return None
+    cols = series.numeric_columns[:2]
+    stats = [f"{c}_{stat}" for c in cols for stat in ("mean", "std")]
+    plot_df = pd.concat([series.resampled[series.primary][cols], series.rolling[stats]], axis=1)
+
+    out_dir = ensure_dir(_artifact_dir(settings))
+    spec = ChartSpec(kind="timeseries", title=f"{title}_{series.primary}", columns=tuple(cols), dpi=150)
+    out_path = out_dir / f"{ts()}__{safe_filename(spec.title)}.png"
+    return await arender_chart(spec, plot_df, out_path, cache=_plot_cache(settings))
+
+
+def _plot_cache(settings: Any) -> Optional[PlotCache]:
+    # 차트 캐시: WORKSPACE_DIR/cache/plots (PLOT_CACHE_ENABLED=false면 미사용)
+    if not bool(getattr(settings, "PLOT_CACHE_ENABLED", True)):
+        return None
+    return PlotCache(
+        Path(getattr(settings, "WORKSPACE_DIR", "workspace")) / "cache" / "plots",
+        max_entries=int(getattr(settings, "PLOT_CACHE_MAX_ENTRIES", 1024)),
+    )
+
+
+def _report_sink(context: Any) -> Optional[SectionSink]:
+    # UI가 context.meta["on_report_section"]에 async 콜백을 넣으면 보고서 섹션을 실시간 전달
+    meta = getattr(context, "meta", None)
+    if meta is None and isinstance(context, dict):
+        meta = context.get("meta")
+    sink = (meta or {}).get("on_report_section") if isinstance(meta, dict) else None
+    return sink if callable(sink) else None
+
+
+def _open_report(sc: StageContext, title: str) -> SectionWriter:
+    out_dir = ensure_dir(_artifact_dir(sc.settings))
+    out_path = out_dir / f"{ts()}__{safe_filename(title)}.md"
+    return SectionWriter(out_path, name=title, sink=_report_sink(sc.context))
+
+
+def _md_artifact(path: Path) -> ArtifactRef:
+    return ArtifactRef(kind="markdown", name=path.name, path=str(path), mime_type="text/markdown")
+
+
 def _save_artifact_markdown(settings: Any, title: str, body: str) -> Path:
     out_dir = ensure_dir(_artifact_dir(settings))
     filename = f"{ts()}__{safe_filename(title)}.md"
@@ -47,32 +151,131 @@ def _save_artifact_markdown(settings: Any, title: str, body: str) -> Path:
     return out_path
 
 
-def _save_line_plot(settings: Any, df: pd.DataFrame, title: str) -> Path | None:
+async def _save_line_plot(settings: Any, df: pd.DataFrame, title: str) -> Path | None:
     num_df = df.select_dtypes(include="number")
     if num_df.empty:
         return None
 
-    cols = list(num_df.columns)[:2]
-    plot_df = num_df[cols].head(200)
+    # 앞 200행만 그리지 않고 전체 행을 LTTB로 고정 점 수까지 축소해 그림(렌더링 비용 일정)
+    cols = [str(c) for c in list(num_df.columns)[:2]]
+    plot_df = num_df[cols]
 
     out_dir = ensure_dir(_artifact_dir(settings))
     filename = f"{ts()}__{safe_filename(title)}.png"
     out_path = out_dir / filename
 
-    plt.figure()
-    plot_df.plot()
-    plt.title(title)
-    plt.tight_layout()
-    plt.savefig(out_path, dpi=150)
-    plt.close()
-    return out_path
+    # 렌더링은 core.tools.plotting 전용 워커에서(OO Agg API, pyplot 전역 상태 미사용)
+    spec = ChartSpec(kind="line", title=title, columns=tuple(cols), dpi=150, downsample="lttb", max_points=1000)
+    return await arender_chart(spec, plot_df, out_path, cache=_plot_cache(settings))
 
 
-def _summarize_numeric(df: pd.DataFrame) -> str:
-    num = df.select_dtypes(include="number")
-    if num.empty:
+async def _save_distribution_plots(settings: Any, df: pd.DataFrame, title: str) -> List[Path]:
+    """
+    분포/상관 차트: 숫자 컬럼 상위 2개의 히스토그램 + 2개 이상이면 2차원 밀도(hist2d).
+    - NumPy로 먼저 구간 집계 후 집계 결과만 그리므로 행 수와 무관하게 시간/메모리 일정
+    """
+    num_df = df.select_dtypes(include="number")
+    cols = [str(c) for c in list(num_df.columns)[:2]]
+    if not cols:
+        return []
+
+    specs = [
+        ChartSpec(kind="histogram", title=f"{title}_hist{i}_{c}", columns=(c,), dpi=150)
+        for i, c in enumerate(cols, start=1)
+    ]
+    if len(cols) == 2:
+        specs.append(ChartSpec(kind="hist2d", title=f"{title}_density", columns=tuple(cols), dpi=150))
+
+    out_dir = ensure_dir(_artifact_dir(settings))
+    plot_df = num_df[cols]
+    cache = _plot_cache(settings)
+    return list(
+        await asyncio.gather(
+            *(
+                arender_chart(spec, plot_df, out_dir / f"{ts()}__{safe_filename(spec.title)}.png", cache=cache)
+                for spec in specs
+            )
+        )
+    )
+
+
+async def _offload(fn: Any, *args: Any) -> Any:
+    # CPU 작업(프로파일/규칙 기반 인사이트)을 기본 스레드 풀에서 실행(이벤트 루프를 막지 않음)
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, functools.partial(fn, *args))
+
+
+async def _speculate(fn: Any, *args: Any) -> Any:
+    # 추측 실행: 결과가 쓰이지 않을 수도 있으므로 예외는 값으로 돌려주고, 실제로 필요할 때만 raise
+    try:
+        return await _offload(fn, *args)
+    except Exception as e:
+        return e
+
+
+def _write_profile_sections(out: TextIO, profile: DataProfile, full_desc: Optional[pd.DataFrame]) -> None:
+    # 표본 상위 행 + (있으면) 전체 파일 통계 + describe 표(보고서 파일에 바로 씀)
+    write_head_section(out, profile.head)
+    if full_desc is not None:
+        write_full_stats_section(out, full_desc.round(3))
+    write_describe_section(out, profile.describe_all())
+
+
+def _planned_charts(profile: DataProfile, series: Optional[TimeSeriesProfile] = None) -> str:
+    # 프롬프트용 차트 목록(렌더링 완료를 기다리지 않도록 파일명 대신 차트 구성만 기재)
+    cols = profile.numeric_columns[:2]
+    if not cols:
+        return "- (none)"
+    lines = [f"- line: {', '.join(cols)}"]
+    lines += [f"- histogram: {c}" for c in cols]
+    if len(cols) == 2:
+        lines.append(f"- density(hist2d): {cols[0]} x {cols[1]}")
+    if series is not None and series.numeric_columns:
+        lines.append(f"- timeseries({series.primary}, rolling={series.window}): {', '.join(series.numeric_columns[:2])}")
+    return "\n".join(lines)
+
+
+def _summarize_cross(cross: CrossAnalysis) -> str:
+    # 프롬프트용 교차 분석 요약(차원/꼬리 임계값 + 상위 10% 비중이 높은 그룹)
+    lines = [
+        f"- dimensions: {', '.join(cross.dimensions)} / metrics: {', '.join(cross.metrics)}",
+        f"- {cross.tail_metric}: p10={cross.low:.3f}, p90={cross.high:.3f}, overall_top10_share={cross.high_share:.1f}%",
+    ]
+    for dim, level, share, lift in cross.top_groups(3):
+        lines.append(f"- {dim}={level}: top10_share={share:.1f}% (lift x{lift:.2f})")
+    return "\n".join(lines)
+
+
+def _summarize_time_series(series: TimeSeriesProfile) -> str:
+    # 프롬프트용 시계열 요약(기간/주기 + 컬럼별 이동 평균 추세)
+    lines = [
+        f"- time_column: {series.time_column} ({series.start:%Y-%m-%d} ~ {series.end:%Y-%m-%d})",
+        f"- primary: {series.primary}, periods: {len(series.resampled[series.primary])}",
+    ]
+    for col, row in series.trend().iterrows():
+        lines.append(
+            f"- {col}: rolling_mean {row['first']:.3f} -> {row['last']:.3f} ({row['change_pct']:+.1f}%), "
+            f"peak={row['peak']:.3f} @ {row['peak_period']}"
+        )
+    return "\n".join(lines)
+
+
+def _shape_note(df: pd.DataFrame, load_res: Any) -> str:
+    shape = f"{df.shape[0]} x {df.shape[1]}"
+    if not _get_attr(load_res, "truncated", False):
+        return shape
+    rows_total = _get_attr(load_res, "rows_total", None)
+    sample = _get_attr(load_res, "sample", "head")
+    return f"{shape} (sample={sample}, rows_total={rows_total})"
+
+
+def _summarize_numeric(profile: DataProfile) -> str:
+    """
+    숫자 컬럼 요약(프로파일 값 사용). 전체 파일 통계로 채운 프로파일이면 그 값이 들어간다.
+    """
+    if profile.numeric.empty:
         return "(숫자 컬럼 없음)"
-    desc = num.describe().T.round(3)
+    desc = profile.numeric.round(3)
     lines = []
     for col in desc.index:
         row = desc.loc[col]
@@ -83,11 +286,7 @@ def _summarize_numeric(df: pd.DataFrame) -> str:
 
 
 def _coerce_kind(load_res: Any, fallback_path: str) -> str:
-    kind = None
-    if isinstance(load_res, dict):
-        kind = load_res.get("kind")
-    else:
-        kind = getattr(load_res, "kind", None)
+    kind = _get_attr(load_res, "kind", None)
 
     if kind:
         return str(kind).lower()
@@ -101,9 +300,19 @@ def _coerce_kind(load_res: Any, fallback_path: str) -> str:
 
 
 def _get_attr(load_res: Any, key: str, default=None):
+    """
+    dict / ToolResult 모두 대응.
+    ToolResult는 kind/df/text 등을 data dict에 담으므로 속성에 없으면 data에서 찾는다.
+    """
     if isinstance(load_res, dict):
         return load_res.get(key, default)
-    return getattr(load_res, key, default)
+    v = getattr(load_res, key, None)
+    if v is not None:
+        return v
+    data = getattr(load_res, "data", None)
+    if isinstance(data, dict):
+        return data.get(key, default)
+    return default
 
 
 def _get_uploaded_files(context: Any) -> List[Any]:
@@ -154,15 +363,16 @@ def _plan(sc: StageContext) -> tuple[Plan, List[AgentEvent]]:
         notes["first_file_path"] = file_path
         notes["first_file_ext"] = file_ext
         notes["first_file_mime"] = file_mime
+        notes["file_names"] = [_file_name_and_path(f)[0] for f in uploaded_files]
 
     plan = Plan(
         intent="data_inspection",
         assumptions=[
-            "CSV/PDF 입력을 우선 지원",
+            "CSV/XLSX/PDF 입력을 우선 지원",
             "LLM은 설정/네트워크에 따라 비활성 또는 실패할 수 있음",
         ],
         constraints=[
-            "파일 로딩은 load_file() 단일 진입점 사용",
+            "파일 로딩은 load_file()/aload_file() 단일 진입점 사용",
             "LLM 실패는 예외가 아니라 상태로 처리",
         ],
         notes=notes,
@@ -188,8 +398,6 @@ def _plan(sc: StageContext) -> tuple[Plan, List[AgentEvent]]:
 async def _execute(sc: StageContext, plan: Plan) -> tuple[ExecutionResult, List[AgentEvent]]:
     events: List[AgentEvent] = []
     artifacts: List[ArtifactRef] = []
-    llm_used = False
-    error_code: Optional[str] = None
 
     events.append(step_start("executor", "파일 확인 및 분석 실행"))
 
@@ -201,7 +409,7 @@ async def _execute(sc: StageContext, plan: Plan) -> tuple[ExecutionResult, List[
             f"## 요청\n{sc.user_message}\n\n"
             "## 처리\n"
             "첨부된 파일이 없어, 현재 단계에서는 텍스트 기반 안내만 제공합니다.\n"
-            "파일(CSV/PDF)을 첨부하면 분석 결과를 생성합니다.\n"
+            "파일(CSV/XLSX/PDF)을 첨부하면 분석 결과를 생성합니다.\n"
         )
         md_path = _save_artifact_markdown(sc.settings, "dia_no_file_result", body)
         artifacts.append(
@@ -223,20 +431,429 @@ async def _execute(sc: StageContext, plan: Plan) -> tuple[ExecutionResult, List[
             events,
         )
 
-    # MVP: 파일 1개 처리
-    f0 = uploaded_files[0]
+    sem = asyncio.Semaphore(_load_concurrency(sc.settings))
+    outcomes = await asyncio.gather(*[_analyze_file(sc, f, sem) for f in uploaded_files])
 
-    # ✅ dict / UploadedFileRef 모두 대응 (stages.py 헬퍼)
-    file_name, file_path, file_ext, file_mime = _file_name_and_path(f0)
+    for o in outcomes:
+        events.extend(o.events)
+
+    # 파일 1개: 기존과 동일한 단일 보고서
+    if len(outcomes) == 1:
+        o = outcomes[0]
+        md_path = o.report_path or _save_artifact_markdown(sc.settings, o.title, o.body)
+        artifacts.append(_md_artifact(md_path))
+        artifacts.extend(o.extra_artifacts)
+        events.append(step_end("executor", o.end_message))
+        return (
+            ExecutionResult(
+                ok=o.ok,
+                text=o.text,
+                artifacts=artifacts,
+                llm_used=o.llm_used,
+                file_kind=o.kind,
+                error_code=o.error_code,
+                llm_status=o.llm_status,
+                llm_reason=o.llm_reason,
+                llm_model=o.llm_model,
+                debug=o.debug,
+            ),
+            events,
+        )
+
+    # 파일 여러 개: 파일별 결과를 하나의 보고서로 병합
+    report_md = _merge_reports(sc.user_message, outcomes)
+    md_path = _save_artifact_markdown(sc.settings, f"dia_multi_report_{len(outcomes)}files", report_md)
+    artifacts.append(_md_artifact(md_path))
+    for o in outcomes:
+        # 파일별 보고서(섹션 스트리밍으로 이미 저장된 것)도 함께 첨부
+        if o.report_path is not None:
+            artifacts.append(_md_artifact(o.report_path))
+        artifacts.extend(o.extra_artifacts)
+
+    ok_list = [o for o in outcomes if o.ok]
+    kinds = sorted({o.kind for o in outcomes})
+    llm_o = next((o for o in outcomes if o.llm_status is not None), None)
+    events.append(evlog("executor.done", f"다중 파일 처리 완료: ok={len(ok_list)}/{len(outcomes)}"))
+    events.append(step_end("executor", "실행 완료"))
+
+    return (
+        ExecutionResult(
+            ok=bool(ok_list),
+            text=f"{len(outcomes)}개 파일 분석 완료 (성공 {len(ok_list)}개)",
+            artifacts=artifacts,
+            llm_used=any(o.llm_used for o in outcomes),
+            file_kind=kinds[0] if len(kinds) == 1 else "multi",
+            error_code=None if ok_list else next((o.error_code for o in outcomes if o.error_code), None),
+            llm_status=llm_o.llm_status if llm_o else None,
+            llm_reason=llm_o.llm_reason if llm_o else None,
+            llm_model=llm_o.llm_model if llm_o else None,
+            debug={"files": {o.file_name: o.debug for o in outcomes}},
+        ),
+        events,
+    )
+
+
+@dataclass
+class _FileOutcome:
+    """파일 1개의 분석 결과(body: 보고서 본문, report_path가 없으면 호출자가 저장)."""
+
+    file_name: str
+    file_path: str
+    kind: str
+    ok: bool
+    text: str
+    title: str
+    body: str
+    report_path: Optional[Path] = None  # 섹션 스트리밍으로 이미 저장된 보고서(있으면 body 재저장 없음)
+    end_message: str = "실행 완료"
+    events: List[AgentEvent] = field(default_factory=list)
+    extra_artifacts: List[ArtifactRef] = field(default_factory=list)
+    llm_used: bool = False
+    error_code: Optional[str] = None
+    llm_status: Optional[str] = None
+    llm_reason: Optional[str] = None
+    llm_model: Optional[str] = None
+    debug: Dict[str, Any] = field(default_factory=dict)
+
+
+def _load_concurrency(settings: Any) -> int:
+    return max(1, int(getattr(settings, "LOAD_CONCURRENCY", 4) or 1))
+
+
+_HEADING_RE = re.compile(r"^(#{1,5}) ")
+
+
+def _demote_headings(md: str) -> str:
+    # 병합 보고서에서 파일별 본문의 제목 레벨을 한 단계 내림(코드 블록 내부는 제외)
+    out: List[str] = []
+    in_code = False
+    for line in md.splitlines():
+        if line.startswith("```"):
+            in_code = not in_code
+        if not in_code and _HEADING_RE.match(line):
+            line = "#" + line
+        out.append(line)
+    return "\n".join(out)
+
+
+def _merge_reports(user_message: str, outcomes: List[_FileOutcome]) -> str:
+    parts: List[str] = []
+    parts.append(f"# DIA 분석 보고서 ({len(outcomes)}개 파일)\n")
+    parts.append("## 요청\n")
+    parts.append(f"{user_message}\n")
+    parts.append("## 파일별 결과\n")
+    for o in outcomes:
+        parts.append(f"- {o.file_name}: kind={o.kind} / {'성공' if o.ok else '실패'} / {o.text}")
+    for o in outcomes:
+        parts.append("\n---\n")
+        parts.append(_demote_headings(o.body))
+    return "\n".join(parts) + "\n"
+
+
+async def _analyze_frame(
+    sc: StageContext,
+    df: pd.DataFrame,
+    load_res: Any,
+    *,
+    kind: str,
+    file_name: str,
+    file_path: str,
+    sheet: Optional[str] = None,
+    sem: Optional[asyncio.Semaphore] = None,
+) -> _FileOutcome:
+    """
+    표 데이터(CSV 또는 엑셀 시트 1개) 분석: 통계/그래프/인사이트(LLM 또는 규칙 기반) → 보고서 본문.
+    - load_res: truncated/rows_total/sample 등 표본 정보(ToolResult 또는 시트별 dict)
+    - sem: 로드와 같은 세마포어(전체 파일을 다시 읽는 스트리밍 통계 단계도 동시 실행 수 제한)
+    """
+    events: List[AgentEvent] = []
+    stem = Path(file_path).stem + (f"_{sheet}" if sheet else "")
+    label = file_name + (f" [sheet={sheet}]" if sheet else "")
+    summary = _get_attr(load_res, "summary", None)
 
-    load_res = load_file(file_path)
+    chart_title = f"dia_{kind}_plot_{stem}"
+    report_title = f"dia_{kind}_report_{stem}"
+
+    # 보고서는 섹션이 준비되는 즉시 파일에 이어 쓰고 UI로도 전달(헤더 → 프로파일/그래프 → 인사이트)
+    writer = _open_report(sc, report_title)
+    await writer.emit(header_section(sc.user_message, label, file_path, _shape_note(df, load_res)))
+
+    # 실행 단계 의존 그래프(독립 단계는 동시에 실행 → 전체 시간 = 가장 느린 경로):
+    #   [전체 통계(스트리밍)] ┐
+    #   [표본 프로파일]       ┼→ [교차 분석] → [LLM 호출 ∥ 규칙 기반 인사이트(추측 실행)]
+    #   [시계열 집계] ────────┴→ [시계열 차트]
+    #   [차트 렌더링] ─────────────────────────────────────────────────
+    async def _full_stats() -> tuple[Optional[pd.DataFrame], Optional[Dict[str, Any]]]:
+        # 표본만 로드된 경우(truncated) 전체 파일을 스트리밍으로 1회 훑어 정확한 통계 확보
+        if not (kind == "csv" and _get_attr(load_res, "truncated", False)):
+            return None, None
+        try:
+            async with sem if sem is not None else contextlib.nullcontext():
+                full_profile = await aprofile_csv(file_path, encoding=_get_attr(load_res, "encoding", None))
+            full_desc = full_profile.describe()
+            events.append(info("executor.full_profile", f"전체 파일 스트리밍 통계 완료: columns={len(full_desc)}"))
+            return full_desc, full_profile.categorical_summary()
+        except Exception as e:
+            events.append(warn("executor.full_profile_failed", f"전체 파일 통계 실패: {type(e).__name__}: {e}"))
+            return None, None
+
+    async def _time_series() -> Optional[TimeSeriesProfile]:
+        # 날짜 컬럼이 있으면 일/주/월 집계 + 이동 통계(표본 기준, 실패해도 나머지 분석은 계속)
+        try:
+            series = await _offload(time_series_profile, df)
+        except Exception as e:
+            events.append(warn("executor.time_series_failed", f"시계열 집계 실패: {type(e).__name__}: {e}"))
+            return None
+        if series is not None:
+            events.append(
+                info("executor.time_series", f"시계열 감지: column={series.time_column} primary={series.primary}")
+            )
+        return series
+
+    ts_task = asyncio.ensure_future(_time_series())
+
+    async def _ts_chart() -> Optional[Path]:
+        return await _save_time_series_plot(sc.settings, await ts_task, title=chart_title)
+
+    async def _render_charts() -> tuple[Optional[Path], List[Path]]:
+        plot_path, dist_paths, ts_path = await asyncio.gather(
+            _save_line_plot(sc.settings, df, title=chart_title),
+            _save_distribution_plots(sc.settings, df, title=chart_title),
+            _ts_chart(),
+        )
+        extra_paths = dist_paths + ([ts_path] if ts_path is not None else [])
+        await writer.emit(charts_section([p.name for p in ([plot_path] if plot_path else []) + extra_paths]))
+        return plot_path, extra_paths
+
+    async def _cross(profile: DataProfile, series: Optional[TimeSeriesProfile]) -> Optional[CrossAnalysis]:
+        # 저카디널리티 차원 × 변동폭 큰 지표 그룹 집계(같은 데이터면 메모리 캐시에서 즉시 반환)
+        # - 메모 키는 로더가 이미 계산한 파싱 캐시 key(파일 fingerprint+로드 옵션+시트) 기준, 캐시 미사용이면 값 해시
+        exclude = (series.time_column,) if series is not None else ()
+        source_key = _get_attr(load_res, "cache_key", None)
+        try:
+            cross = await _offload(
+                functools.partial(cross_analysis, df, profile, exclude=exclude, source_key=source_key)
+            )
+        except Exception as e:
+            events.append(warn("executor.cross_analysis_failed", f"교차 분석 실패: {type(e).__name__}: {e}"))
+            return None
+        if cross is not None:
+            events.append(
+                info("executor.cross_analysis", f"교차 분석: dims={','.join(cross.dimensions)} metric={cross.tail_metric}")
+            )
+        return cross
+
+    async def _insights() -> tuple[DataProfile, Any, Any]:
+        # 표본 프로파일 1회 계산(CPU 작업은 스레드로) → 보고서/프롬프트/규칙 기반 인사이트가 공유
+        (full_desc, full_cats), profile, series = await asyncio.gather(
+            _full_stats(), _offload(DataProfile.from_frame, df), ts_task
+        )
+        analysis_profile = profile.with_full_stats(full_desc, full_cats)
+        await writer.emit_stream(functools.partial(_write_profile_sections, profile=profile, full_desc=full_desc))
+        if series is not None:
+            await writer.emit(await _offload(time_series_section, series))
+        cross = await _cross(analysis_profile, series)
+        if cross is not None:
+            await writer.emit_stream(functools.partial(write_cross_analysis_section, cross=cross))
+
+        llm_client = LLMClient(sc.settings)
+        prompt_path = "agents/dia/prompts/insight.md"
+        try:
+            system_prompt = load_prompt(prompt_path)
+        except Exception:
+            system_prompt = default_insight_prompt()
+
+        numeric_summary = _summarize_numeric(analysis_profile)
+        user_prompt = (
+            f"[사용자 요청]\n{sc.user_message}\n\n"
+            f"[데이터 개요]\n"
+            f"- file: {label}\n"
+            f"- shape: {profile.rows} x {len(profile.columns)}\n"
+            f"- columns: {', '.join(profile.columns)}\n\n"
+            f"[숫자 컬럼 요약]\n{numeric_summary}\n\n"
+            f"[상위 10행]\n{profile.head.to_csv(index=False)}\n\n"
+            f"[그래프]\n{_planned_charts(profile, series)}\n"
+            + (f"\n[시계열 요약]\n{_summarize_time_series(series)}\n" if series is not None else "")
+            + (f"\n[교차 분석]\n{_summarize_cross(cross)}\n" if cross is not None else "")
+        )
+
+        # LLM 왕복 동안 규칙 기반 인사이트를 미리 계산(폴백 시 추가 지연 없음, 성공 시 결과만 버림)
+        llm_res, rule_md = await asyncio.gather(
+            llm_client.generate(system_prompt=system_prompt, user_prompt=user_prompt),
+            _speculate(rule_based_insights, analysis_profile, series, cross),
+        )
+        return analysis_profile, llm_res, rule_md
+
+    (plot_path, extra_paths), (analysis_profile, llm_res, rule_md) = await asyncio.gather(
+        _render_charts(), _insights()
+    )
+    llm_used, llm_status, llm_reason, llm_model = _normalize_llm_meta(llm_res, sc.settings)
+    llm_hint_line = ""
+    llm_debug_line = ""
+    error_code: Optional[str] = None
+
+    if llm_used:
+        events.append(info("executor.llm.used", "LLM 인사이트 생성 완료"))
+        llm_section = ensure_sections(llm_res.content)
+        llm_hint_line = "- LLM: 적용됨"
+    else:
+        error_code = llm_reason  # meta의 error_code에 반영하고 싶다면 유지
+        events.append(warn("executor.llm.skipped", f"{llm_res.content} ({llm_reason})"))
+        if isinstance(rule_md, BaseException):
+            raise rule_md
+        llm_section = rule_md
+
+        if llm_reason == "network_unreachable":
+            llm_hint_line = "- LLM: 미적용 (폐쇄망/네트워크 제한)"
+        elif llm_reason == "llm_disabled":
+            llm_hint_line = "- LLM: 미적용 (LLM_ENABLED=false)"
+        elif llm_reason == "missing_api_key":
+            llm_hint_line = "- LLM: 미적용 (API Key 미설정)"
+        else:
+            llm_hint_line = "- LLM: 미적용 (호출 실패)"
+
+    await writer.emit(insights_section(llm_hint_line + "\n\n" + llm_section + llm_debug_line))
+
+    extra_artifacts: List[ArtifactRef] = []
+    for p in ([plot_path] if plot_path is not None else []) + extra_paths:
+        extra_artifacts.append(ArtifactRef(kind="image", name=p.name, path=str(p), mime_type="image/png"))
+
+    events.append(evlog("executor.done", f"{kind.upper()} 처리 완료({label}): 보고서/그래프 생성"))
+
+    return _FileOutcome(
+        file_name=file_name,
+        file_path=file_path,
+        kind=kind,
+        ok=True,
+        text=f"{kind.upper()} 분석 완료",
+        title=report_title,
+        body=writer.read_text(),
+        report_path=writer.path,
+        events=events,
+        extra_artifacts=extra_artifacts,
+        llm_used=llm_used,
+        error_code=error_code,
+        llm_status=llm_status,
+        llm_reason=llm_reason,
+        llm_model=llm_model,
+        debug={
+            "loader_summary": summary,
+            "llm_last_error": getattr(llm_res, "last_error", None),
+        },
+    )
+
+
+def _prepend_events(events: List[AgentEvent], outcome: _FileOutcome) -> _FileOutcome:
+    outcome.events = events + outcome.events
+    return outcome
+
+
+async def _analyze_workbook(sc: StageContext, load_res: Any, *, file_name: str, file_path: str) -> _FileOutcome:
+    """
+    엑셀 파일: 로더가 준 시트별 DataFrame을 각각 분석한다(시트끼리 동시 실행).
+    - 시트가 1개면 그 결과를 그대로, 여러 개면 시트별 섹션으로 합친 본문을 반환
+    """
+    summary = _get_attr(load_res, "summary", None)
+    sheets = [
+        s
+        for s in (_get_attr(load_res, "sheets", None) or [])
+        if isinstance(s.get("df"), pd.DataFrame) and not s["df"].empty
+    ]
+    if not sheets:
+        return _FileOutcome(
+            file_name=file_name,
+            file_path=file_path,
+            kind="excel",
+            ok=False,
+            text="엑셀 시트에 데이터 없음",
+            title=f"dia_excel_empty_{Path(file_path).stem}",
+            body=(
+                "# DIA 결과\n\n"
+                f"## 요청\n{sc.user_message}\n\n"
+                f"## 파일\n- name: {file_name}\n- path: {file_path}\n\n"
+                "## 처리\n- 모든 시트가 비어 있습니다.\n"
+                f"- loader_summary: {summary}\n"
+            ),
+            end_message="실행 완료(빈 엑셀)",
+            error_code="empty_workbook",
+        )
+
+    outcomes = await asyncio.gather(
+        *[
+            _analyze_frame(
+                sc,
+                s["df"],
+                {**s, "summary": summary},
+                kind="excel",
+                file_name=file_name,
+                file_path=file_path,
+                sheet=s["name"] if len(sheets) > 1 else None,
+            )
+            for s in sheets
+        ]
+    )
+    if len(outcomes) == 1:
+        return outcomes[0]
+
+    parts = [f"# DIA 분석 보고서 ({file_name}, {len(outcomes)}개 시트)\n"]
+    parts.extend(_demote_headings(o.body) for o in outcomes)
+    first = outcomes[0]
+    return _FileOutcome(
+        file_name=file_name,
+        file_path=file_path,
+        kind="excel",
+        ok=True,
+        text=f"엑셀 {len(outcomes)}개 시트 분석 완료",
+        title=f"dia_excel_report_{Path(file_path).stem}",
+        body="\n\n---\n\n".join(parts) + "\n",
+        events=[e for o in outcomes for e in o.events],
+        extra_artifacts=[
+            a
+            for o in outcomes
+            for a in ([_md_artifact(o.report_path)] if o.report_path is not None else []) + o.extra_artifacts
+        ],
+        llm_used=any(o.llm_used for o in outcomes),
+        error_code=first.error_code,
+        llm_status=first.llm_status,
+        llm_reason=first.llm_reason,
+        llm_model=first.llm_model,
+        debug={"sheets": {o.title: o.debug for o in outcomes}},
+    )
+
+
+async def _analyze_file(sc: StageContext, f: Any, sem: asyncio.Semaphore) -> _FileOutcome:
+    """
+    업로드 파일 1개를 로드/분석한다.
+    - 로드와 전체 파일 스트리밍 통계(aprofile_csv)는 같은 세마포어로 동시 실행 수를 제한
+      (대용량 파일 N개를 올려도 전체 파일 패스는 LOAD_CONCURRENCY개까지만 동시에 실행)
+    - 표 데이터 보고서는 섹션 단위로 바로 저장(report_path), 그 외 본문 저장은 호출자(_execute)가 담당
+    """
+    events: List[AgentEvent] = []
+
+    # ✅ dict / UploadedFileRef 모두 대응 (stages.py 헬퍼)
+    file_name, file_path, file_ext, file_mime = _file_name_and_path(f)
+
+    load_kwargs = _loader_kwargs(sc.settings)
+    async with sem:
+        stratify_by = load_kwargs.get("stratify_by")
+        if stratify_by and await _offload(_stratify_column_missing, file_path, stratify_by):
+            # 설정된 층화 기준 컬럼이 이 파일에 없으면 분석을 실패시키지 않고 균등 표본으로 대체
+            load_kwargs.pop("stratify_by")
+            load_kwargs["sample"] = "reservoir"
+            events.append(
+                warn(
+                    "executor.stratify_fallback",
+                    f"층화 기준 컬럼 '{stratify_by}'이(가) 없어 reservoir 표본으로 대체합니다({file_name})",
+                )
+            )
+        load_res = await aload_file(file_path, **load_kwargs)
     ok = bool(_get_attr(load_res, "ok", False))
     kind = _coerce_kind(load_res, file_path)
     summary = _get_attr(load_res, "summary", None)
     error = _get_attr(load_res, "error", None)
 
     if not ok:
-        events.append(warn("executor.file_load_failed", f"파일 로드 실패: {error or 'unknown_error'}"))
+        events.append(warn("executor.file_load_failed", f"파일 로드 실패({file_name}): {error or 'unknown_error'}"))
         body = (
             f"# DIA 결과\n\n"
             f"## 요청\n{sc.user_message}\n\n"
@@ -247,25 +864,20 @@ async def _execute(sc: StageContext, plan: Plan) -> tuple[ExecutionResult, List[
             f"- summary: {summary}\n\n"
             f"### 권장 액션\n"
             f"- 파일이 열려있다면 닫고 다시 업로드\n"
-            f"- CSV 인코딩(UTF-8/CP949) 확인\n"
+            f"- CSV 구분자/따옴표 형식 확인(인코딩 UTF-8/CP949는 자동 판별)\n"
             f"- 파일 크기가 매우 크면 일부만 샘플로 줄여 업로드\n"
         )
-        md_path = _save_artifact_markdown(sc.settings, "dia_file_load_failed", body)
-        artifacts.append(
-            ArtifactRef(kind="markdown", name=md_path.name, path=str(md_path), mime_type="text/markdown")
-        )
-
-        events.append(step_end("executor", "실행 완료(로드 실패 안내)"))
-        return (
-            ExecutionResult(
-                ok=False,
-                text="파일 로드 실패 안내",
-                artifacts=artifacts,
-                llm_used=False,
-                file_kind=kind,
-                error_code="file_load_failed",
-            ),
-            events,
+        return _FileOutcome(
+            file_name=file_name,
+            file_path=file_path,
+            kind=kind,
+            ok=False,
+            text="파일 로드 실패 안내",
+            title="dia_file_load_failed",
+            body=body,
+            end_message="실행 완료(로드 실패 안내)",
+            events=events,
+            error_code="file_load_failed",
         )
 
     events.append(info("executor.file_loaded", f"파일 로드 성공: kind={kind} / {summary or ''}".strip()))
@@ -283,183 +895,74 @@ async def _execute(sc: StageContext, plan: Plan) -> tuple[ExecutionResult, List[
             events.append(
                 warn("executor.csv_no_dataframe", "CSV로 인식되었으나 DataFrame이 없어 preview 기반으로 처리합니다.")
             )
-
-            md_path = _save_artifact_markdown(
-                sc.settings,
-                "dia_csv_preview_only",
-                (
+            return _FileOutcome(
+                file_name=file_name,
+                file_path=file_path,
+                kind="csv",
+                ok=True,
+                text="CSV preview 처리 완료",
+                title="dia_csv_preview_only",
+                body=(
                     "# DIA 결과 (CSV Preview)\n\n"
                     f"## 요청\n{sc.user_message}\n\n"
                     f"## 파일\n- name: {file_name}\n- path: {file_path}\n\n"
                     f"## Preview\n\n```csv\n{preview_csv}\n```\n"
                 ),
+                end_message="실행 완료(CSV preview)",
+                events=events,
             )
-            artifacts.append(
-                ArtifactRef(kind="markdown", name=md_path.name, path=str(md_path), mime_type="text/markdown")
-            )
-            events.append(step_end("executor", "실행 완료(CSV preview)"))
-            return (
-                ExecutionResult(
-                    ok=True,
-                    text="CSV preview 처리 완료",
-                    artifacts=artifacts,
-                    llm_used=False,
-                    file_kind="csv",
-                ),
-                events,
-            )
-
-        head = df.head(10).to_markdown(index=False)
-        desc_md = df.describe(include="all").to_markdown()
-        plot_path = _save_line_plot(sc.settings, df, title=f"dia_csv_plot_{Path(file_path).stem}")
 
-        llm_client = LLMClient(sc.settings)
-        prompt_path = "agents/dia/prompts/insight.md"
-        try:
-            system_prompt = load_prompt(prompt_path)
-        except Exception:
-            system_prompt = default_insight_prompt()
-
-        numeric_summary = _summarize_numeric(df)
-        user_prompt = (
-            f"[사용자 요청]\n{sc.user_message}\n\n"
-            f"[데이터 개요]\n"
-            f"- file: {file_name}\n"
-            f"- shape: {df.shape[0]} x {df.shape[1]}\n"
-            f"- columns: {', '.join(map(str, df.columns.tolist()))}\n\n"
-            f"[숫자 컬럼 요약]\n{numeric_summary}\n\n"
-            f"[상위 10행]\n{df.head(10).to_csv(index=False)}\n\n"
-            f"[그래프]\n- plot_file: {plot_path.name if plot_path else '(none)'}\n"
-        )
-
-        llm_res = await llm_client.generate(system_prompt=system_prompt, user_prompt=user_prompt)
-        llm_used, llm_status, llm_reason, llm_model = _normalize_llm_meta(llm_res, sc.settings)
-        llm_hint_line = ""
-        llm_debug_line = ""
-        error_code: Optional[str] = None
-
-        if llm_used:
-            events.append(info("executor.llm.used", "LLM 인사이트 생성 완료"))
-            llm_section = ensure_sections(llm_res.content)
-            llm_hint_line = "- LLM: 적용됨"
-        else:
-            error_code = llm_reason  # meta의 error_code에 반영하고 싶다면 유지
-            events.append(warn("executor.llm.skipped", f"{llm_res.content} ({llm_reason})"))
-            llm_section = rule_based_insights(df)
-
-            if llm_reason == "network_unreachable":
-                llm_hint_line = "- LLM: 미적용 (폐쇄망/네트워크 제한)"
-            elif llm_reason == "llm_disabled":
-                llm_hint_line = "- LLM: 미적용 (LLM_ENABLED=false)"
-            elif llm_reason == "missing_api_key":
-                llm_hint_line = "- LLM: 미적용 (API Key 미설정)"
-            else:
-                llm_hint_line = "- LLM: 미적용 (호출 실패)"
-
-        report_md = build_markdown_report(
-            ReportInputs(
-                user_request=sc.user_message,
-                file_name=file_name,
-                file_path=file_path,
-                shape=f"{df.shape[0]} x {df.shape[1]}",
-                head_md=head,
-                describe_md=desc_md,
-                plot_file=(plot_path.name if plot_path else None),
-                llm_insights_md=(llm_hint_line + "\n\n" + llm_section + llm_debug_line),
-            )
-        )
-
-        md_path = _save_artifact_markdown(sc.settings, f"dia_csv_report_{Path(file_path).stem}", report_md)
-        artifacts.append(
-            ArtifactRef(kind="markdown", name=md_path.name, path=str(md_path), mime_type="text/markdown")
-        )
-
-        if plot_path is not None:
-            artifacts.append(ArtifactRef(kind="image", name=plot_path.name, path=str(plot_path), mime_type="image/png"))
-
-        events.append(evlog("executor.done", "CSV 처리 완료: 보고서/그래프 생성"))
-        events.append(step_end("executor", "실행 완료"))
-
-        return (
-            ExecutionResult(
-                ok=True,
-                text="CSV 분석 완료",
-                artifacts=artifacts,
-                llm_used=llm_used,
-                file_kind="csv",
-                error_code=error_code,
-                llm_status=llm_status,
-                llm_reason=llm_reason,
-                llm_model=llm_model,
-                debug={
-                    "loader_summary": summary,
-                    "llm_last_error": getattr(llm_res, "last_error", None),
-                }
-            ),
+        return _prepend_events(
             events,
+            await _analyze_frame(sc, df, load_res, kind="csv", file_name=file_name, file_path=file_path, sem=sem),
         )
 
+    if kind == "excel":
+        return _prepend_events(events, await _analyze_workbook(sc, load_res, file_name=file_name, file_path=file_path))
+
     if kind == "pdf":
         text = _get_attr(load_res, "text", "") or _get_attr(load_res, "content", "") or ""
         text = str(text).strip() if text else ""
         if not text:
             text = "(텍스트 추출 실패: 스캔 PDF 가능)"
 
-        md_path = _save_artifact_markdown(
-            sc.settings,
-            f"dia_pdf_extract_{Path(file_path).stem}",
-            (
+        return _FileOutcome(
+            file_name=file_name,
+            file_path=file_path,
+            kind="pdf",
+            ok=True,
+            text="PDF 처리 완료",
+            title=f"dia_pdf_extract_{Path(file_path).stem}",
+            body=(
                 "# DIA 분석 결과 (PDF)\n\n"
                 f"## 요청\n{sc.user_message}\n\n"
                 f"## 파일\n- name: {file_name}\n- path: {file_path}\n\n"
                 "## 텍스트(발췌)\n\n"
                 f"{text}\n"
             ),
-        )
-        artifacts.append(
-            ArtifactRef(kind="markdown", name=md_path.name, path=str(md_path), mime_type="text/markdown")
-        )
-        events.append(step_end("executor", "실행 완료(PDF 처리)"))
-
-        return (
-            ExecutionResult(
-                ok=True,
-                text="PDF 처리 완료",
-                artifacts=artifacts,
-                llm_used=False,
-                file_kind="pdf",
-            ),
-            events,
+            end_message="실행 완료(PDF 처리)",
+            events=events,
         )
 
     # unsupported
-    md_path = _save_artifact_markdown(
-        sc.settings,
-        "dia_unsupported_file",
-        (
+    return _FileOutcome(
+        file_name=file_name,
+        file_path=file_path,
+        kind=kind,
+        ok=False,
+        text="미지원 형식 안내",
+        title="dia_unsupported_file",
+        body=(
             "# DIA 결과\n\n"
             f"## 요청\n{sc.user_message}\n\n"
             f"## 파일\n- name: {file_name}\n- path: {file_path}\n\n"
-            "## 처리\n지원하지 않는 파일 형식입니다. (CSV/PDF만 지원)\n"
+            "## 처리\n지원하지 않는 파일 형식입니다. (CSV/XLSX/PDF만 지원)\n"
             f"- detected_kind: {kind}\n"
             f"- loader_summary: {summary}\n"
         ),
-    )
-    artifacts.append(
-        ArtifactRef(kind="markdown", name=md_path.name, path=str(md_path), mime_type="text/markdown")
-    )
-    events.append(step_end("executor", "실행 완료(미지원 형식)"))
-
-    return (
-        ExecutionResult(
-            ok=False,
-            text="미지원 형식 안내",
-            artifacts=artifacts,
-            llm_used=False,
-            file_kind=kind,
-            error_code="unsupported_file_kind",
-        ),
-        events,
+        end_message="실행 완료(미지원 형식)",
+        events=events,
+        error_code="unsupported_file_kind",
     )
 
 
@@ -1,31 +1,30 @@
 from __future__ import annotations
 
-import pandas as pd
+from typing import Optional
 
+from core.tools.data_analysis import CATEGORY_MAX_UNIQ_RATIO, CrossAnalysis, DataProfile, TimeSeriesProfile
 
-def _top_k_share(s: pd.Series, k: int = 3) -> list[tuple[str, int, float]]:
-    vc = s.value_counts(dropna=False)
-    total = int(vc.sum())
-    out = []
-    for val, cnt in vc.head(k).items():
-        share = (float(cnt) / float(total) * 100.0) if total else 0.0
-        out.append((str(val), int(cnt), round(share, 1)))
-    return out
 
-
-def rule_based_insights(df: pd.DataFrame) -> str:
+def rule_based_insights(
+    profile: DataProfile,
+    ts: Optional[TimeSeriesProfile] = None,
+    cross: Optional[CrossAnalysis] = None,
+) -> str:
     """
     LLM 없이도 의미 있는 '요약/인사이트/액션/주의사항'을 생성.
     반환은 Markdown 섹션(## 포함) 형태.
+    - profile: DataProfile(표본 1회 프로파일). approximate=True면 전체 파일 스트리밍 통계 기반
+    - ts: 날짜 컬럼이 있으면 시계열 요약(기간별 이동 평균 추세/최고 기간)
+    - cross: 교차 분석 결과가 있으면 상위 10% 비중이 높은 그룹을 인사이트로, 없으면 피벗을 권장 액션으로
     """
     insights: list[str] = []
     actions: list[str] = []
     cautions: list[str] = []
 
     # 1) 숫자 컬럼 분석
-    num = df.select_dtypes(include="number")
-    if not num.empty:
-        desc = num.describe().T
+    desc = profile.numeric.copy() if not profile.numeric.empty else None
+
+    if desc is not None:
         desc["range"] = desc["max"] - desc["min"]
         desc = desc.sort_values("range", ascending=False)
 
@@ -38,35 +37,53 @@ def rule_based_insights(df: pd.DataFrame) -> str:
 
         # 이상치 후보 안내(상/하위 10%)
         col0 = desc.index[0]
-        low = num[col0].quantile(0.1)
-        high = num[col0].quantile(0.9)
+        low, high = desc.loc[col0, "10%"], desc.loc[col0, "90%"]
         insights.append(f"- `{col0}` 기준 상/하위 10% 임계값: <= {low:.3f}, >= {high:.3f}. 해당 구간 레코드 원인 점검을 권장합니다.")
-        actions.append(f"- `{col0}` 상/하위 10% 레코드를 추출하여 `department/owner/status`와 교차분석(피벗)하세요.")
+        if cross is not None and cross.tail_metric == col0:
+            for dim, level, share, lift in cross.top_groups(2):
+                insights.append(
+                    f"- `{col0}` 상위 10% 비중이 높은 그룹: `{dim}={level}` {share:.1f}% "
+                    f"(전체 {cross.high_share:.1f}%, lift x{lift:.2f})."
+                )
+            actions.append(f"- 교차 분석 표에서 `{col0}` high_lift가 큰 `{'/'.join(cross.dimensions)}` 그룹부터 원인을 점검하세요.")
+        else:
+            actions.append(f"- `{col0}` 상/하위 10% 레코드를 추출하여 `department/owner/status`와 교차분석(피벗)하세요.")
     else:
         insights.append("- 숫자형 지표가 없어 정량 인사이트 생성이 제한됩니다.")
         actions.append("- 범주형 컬럼의 빈도/추세(날짜) 분석 위주로 보고서를 구성하세요.")
 
-    # 2) 범주형 컬럼 분석: “유니크 비율”이 낮은 컬럼만 선택
-    cat = df.select_dtypes(exclude="number")
-    if not cat.empty:
-        n = len(df)
-        candidate_cols = []
-        for col in cat.columns:
-            uniq = df[col].nunique(dropna=False)
-            uniq_ratio = (uniq / n) if n else 1.0
-            # 유니크 비율이 너무 높으면(예: record_id/date) 제외
-            if uniq_ratio <= 0.5:
-                candidate_cols.append(col)
+    # 1-1) 시계열: 변화율이 큰 지표 1~2개의 추세/최고 기간
+    if ts is not None:
+        trend = ts.trend()
+        if not trend.empty:
+            trend = trend.reindex(trend["change_pct"].abs().sort_values(ascending=False).index)
+            for col in trend.index[:2]:
+                row = trend.loc[col]
+                insights.append(
+                    f"- `{col}` {ts.primary} 이동 평균 추세({ts.time_column} 기준): "
+                    f"{row['first']:.3f} → {row['last']:.3f} ({row['change_pct']:+.1f}%), "
+                    f"최고 기간 {row['peak_period']} ({row['peak']:.3f})."
+                )
+            actions.append(f"- `{trend.index[0]}` 추세가 꺾이는 기간과 최고 기간 전후의 운영 이벤트(배포/장애/정책 변경)를 확인하세요.")
+
+    # 2) 범주형 컬럼 분석: “유니크 비율”이 낮은 컬럼만 선택(예: record_id/date 제외)
+    candidate_cols = []
+    for col, st in profile.categorical.items():
+        n = int(st.get("count", 0))
+        uniq_ratio = (st.get("distinct", 0) / n) if n else 1.0
+        if uniq_ratio <= CATEGORY_MAX_UNIQ_RATIO:
+            candidate_cols.append(col)
 
-        for col in candidate_cols[:3]:
-            top3 = _top_k_share(df[col], k=3)
-            if top3:
-                formatted = ", ".join([f"`{v}` {c}건({p}%)" for v, c, p in top3])
-                insights.append(f"- `{col}` 분포 상위: {formatted}.")
+    scope = "(전체 파일, 근사)" if profile.approximate else ""
+    for col in candidate_cols[:3]:
+        top3 = profile.categorical[col].get("top") or []
+        if top3:
+            formatted = ", ".join([f"`{v}` {c}건({p}%)" for v, c, p in top3])
+            insights.append(f"- `{col}` 분포 상위{scope}: {formatted}.")
 
-        # 대표 권장 액션
-        if candidate_cols:
-            actions.append(f"- `{candidate_cols[0]}` 기준으로 주요 지표(성공률/지연/사고건수)의 그룹별 평균을 비교하세요.")
+    # 대표 권장 액션
+    if candidate_cols:
+        actions.append(f"- `{candidate_cols[0]}` 기준으로 주요 지표(성공률/지연/사고건수)의 그룹별 평균을 비교하세요.")
 
     # 3) 요약/주의사항
     summary = [
@@ -80,7 +97,7 @@ def rule_based_insights(df: pd.DataFrame) -> str:
 
     md = []
     md.append("## 요약\n" + "\n".join(summary))
-    md.append("\n## 인사이트\n" + "\n".join(insights[:6]))
+    md.append("\n## 인사이트\n" + "\n".join(insights[:10]))
     md.append("\n## 권장 액션\n" + "\n".join(actions[:4] if actions else ["- 추가 분석 항목을 정의하세요."]))
     md.append("\n## 주의사항\n" + "\n".join(cautions))
     return "\n".join(md)
@@ -1,47 +1,85 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Optional
-
-
-@dataclass(frozen=True)
-class ReportInputs:
-    user_request: str
-    file_name: str
-    file_path: str
-    shape: Optional[str] = None
-    head_md: Optional[str] = None
-    describe_md: Optional[str] = None
-    plot_file: Optional[str] = None
-    llm_insights_md: Optional[str] = None
-
-
-def build_markdown_report(inp: ReportInputs) -> str:
-    parts: list[str] = []
-    parts.append("# DIA 분석 보고서\n")
-    parts.append("## 요청\n")
-    parts.append(f"{inp.user_request}\n")
-
-    parts.append("## 입력 파일\n")
-    parts.append(f"- name: {inp.file_name}\n- path: {inp.file_path}\n")
-    if inp.shape:
-        parts.append(f"- shape: {inp.shape}\n")
-    if inp.plot_file:
-        parts.append(f"- plot: {inp.plot_file}\n")
-
-    if inp.llm_insights_md:
-        parts.append("\n---\n")
-        parts.append("## 자동 인사이트(LLM)\n")
-        parts.append(inp.llm_insights_md.strip() + "\n")
-
-    if inp.head_md:
-        parts.append("\n---\n")
-        parts.append("## 상위 10행\n")
-        parts.append(inp.head_md + "\n")
-
-    if inp.describe_md:
-        parts.append("\n---\n")
-        parts.append("## describe()\n")
-        parts.append(inp.describe_md + "\n")
-
-    return "\n".join(parts)
+from typing import Optional, Sequence, TextIO
+
+import pandas as pd
+
+from core.tools.data_analysis import CrossAnalysis, TimeSeriesProfile
+from core.tools.report_writer import render_table, write_table
+
+
+# 보고서는 섹션 단위로 만든다(각 섹션은 완결된 Markdown).
+# - 짧은 섹션(*_section)은 문자열을 반환 → SectionWriter.emit()
+# - 큰 표 섹션(write_*_section)은 파일 핸들에 write_table로 바로 씀 → SectionWriter.emit_stream()
+# - 섹션 순서는 DIA 실행기(_analyze_frame)가 결정하고, 준비되는 즉시 파일/UI에 이어 씀
+
+
+def header_section(user_request: str, file_name: str, file_path: str, shape: Optional[str] = None) -> str:
+    parts = ["# DIA 분석 보고서\n", "## 요청\n", f"{user_request}\n", "## 입력 파일\n"]
+    parts.append(f"- name: {file_name}\n- path: {file_path}")
+    if shape:
+        parts[-1] += f"\n- shape: {shape}"
+    return "\n".join(parts) + "\n"
+
+
+def charts_section(plot_files: Sequence[str]) -> str:
+    lines = [f"- plot: {name}" for name in plot_files] or ["- (숫자 컬럼 없음)"]
+    return "\n---\n\n## 그래프\n\n" + "\n".join(lines) + "\n"
+
+
+def insights_section(insights_md: str) -> str:
+    return "\n---\n\n## 자동 인사이트(LLM)\n\n" + insights_md.strip() + "\n"
+
+
+def write_head_section(out: TextIO, head_df: pd.DataFrame) -> None:
+    out.write("\n---\n\n## 상위 10행\n\n")
+    write_table(out, head_df, index=False)
+
+
+def write_full_stats_section(out: TextIO, full_stats_df: pd.DataFrame) -> None:
+    out.write("\n---\n\n## 전체 파일 통계(스트리밍, 분위수는 근사)\n\n")
+    write_table(out, full_stats_df)
+
+
+def write_describe_section(out: TextIO, describe_df: pd.DataFrame) -> None:
+    out.write("\n---\n\n## describe()\n\n")
+    write_table(out, describe_df)
+
+
+_TS_TABLE_PERIODS = 24  # 기간별 표는 최근 N개 기간만
+
+
+def time_series_section(ts: TimeSeriesProfile) -> str:
+    parts = [
+        f"\n---\n\n## 시계열 ({ts.time_column}, {ts.primary} 기준)\n",
+        f"- 기간: {ts.start:%Y-%m-%d %H:%M} ~ {ts.end:%Y-%m-%d %H:%M}",
+        "- 기간 수: " + ", ".join(f"{label}={len(frame)}" for label, frame in ts.resampled.items()),
+        f"- 이동 통계 창: {ts.window}개 기간 (표본 기준)\n",
+    ]
+    trend = ts.trend()
+    if not trend.empty:
+        parts.append("### 추세 요약\n")
+        parts.append(render_table(trend.round(3)) + "\n")
+    recent = ts.resampled[ts.primary].tail(_TS_TABLE_PERIODS).round(3)
+    recent.index = recent.index.strftime("%Y-%m-%d")
+    parts.append(f"### 기간별 평균(최근 {len(recent)}개 {ts.primary})\n")
+    parts.append(render_table(recent))
+    return "\n".join(parts) + "\n"
+
+
+_CROSS_TABLE_ROWS = 10  # 차원별 표는 행 수 상위 N개 값만
+
+
+def write_cross_analysis_section(out: TextIO, cross: CrossAnalysis) -> None:
+    out.write("\n---\n\n## 교차 분석(피벗)\n\n")
+    out.write(f"- 차원: {', '.join(cross.dimensions)} / 지표: {', '.join(cross.metrics)}\n")
+    out.write(
+        f"- `{cross.tail_metric}` 하위 10% <= {cross.low:.3f}, 상위 10% >= {cross.high:.3f} "
+        f"(전체 상위 10% 비중 {cross.high_share:.1f}%, high_lift = 그룹 비중 / 전체 비중)\n"
+    )
+    for dim, table in cross.marginals.items():
+        out.write(f"\n### {dim}별\n\n")
+        write_table(out, table.round(3), max_rows=_CROSS_TABLE_ROWS)
+    if cross.pivot is not None:
+        out.write(f"\n### {cross.dimensions[0]} × {cross.dimensions[1]} (`{cross.tail_metric}` 평균)\n\n")
+        write_table(out, cross.pivot.round(3), max_rows=_CROSS_TABLE_ROWS)
@@ -1,6 +1,8 @@
 # agents/logcop/graph.py
 from __future__ import annotations
 
+import asyncio
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
@@ -24,7 +26,15 @@ from core.utils.time import ts
 
 from core.llm.client import LLMClient
 from core.llm.prompts import load_prompt
-from core.tools.file_loader import load_file
+from core.tools.file_loader import LOG_SCAN_KEYWORDS, aload_file, ascan_log_file
+
+
+# 전체 스캔 결과 중 프롬프트/보고서에 싣는 최대 라인 수
+_SCAN_PROMPT_LINES = 50
+
+# 로그 tail 텍스트 총 예산(여러 파일이면 파일 수로 나눠 배분)
+_TEXT_BUDGET_CHARS = 20000
+_MIN_TEXT_CHARS_PER_FILE = 2000
 
 
 def _artifact_dir(settings: Any) -> Path:
@@ -44,11 +54,23 @@ def _get_data(load_res: Any) -> dict:
     return data if isinstance(data, dict) else {}
 
 
-def _rule_based_log_insights(text: str) -> str:
+def _format_scan_lines(scan: dict, limit: int = _SCAN_PROMPT_LINES) -> str:
+    matches = scan.get("matches") or []
+    if not matches:
+        return "(매칭 라인 없음)"
+    lines = [f"- @{m.get('offset')}: {m.get('line')}" for m in matches[:limit]]
+    rest = int(scan.get("lines_matched", 0)) - len(lines)
+    if rest > 0:
+        lines.append(f"- ... 외 {rest}라인")
+    return "\n".join(lines)
+
+
+def _rule_based_log_insights(text: str, scan: Optional[dict] = None) -> str:
     lowered = (text or "").lower()
+    scan_counts = (scan or {}).get("keyword_counts") or {}
     hits = []
-    for k in ["exception", "error", "stacktrace", "traceback", "caused by", "timeout", "pkix", "ssl", "connection"]:
-        if k in lowered:
+    for k in LOG_SCAN_KEYWORDS:
+        if k in lowered or scan_counts.get(k, 0) > 0:
             hits.append(k)
 
     lines: List[str] = []
@@ -58,6 +80,12 @@ def _rule_based_log_insights(text: str) -> str:
         lines.append(f"- 탐지 키워드: {', '.join(hits)}")
     else:
         lines.append("- 명확한 오류 키워드는 탐지되지 않았습니다.")
+    if scan:
+        counted = ", ".join([f"{k}={v}" for k, v in scan_counts.items() if v])
+        lines.append(
+            f"- 전체 파일 스캔: 매칭 라인 {scan.get('lines_matched', 0)}개"
+            + (f" ({counted})" if counted else "")
+        )
 
     lines.append("\n## 권장 액션")
     lines.append("- 에러 발생 시각/요청 단위로 주변 로그(전후 200~500라인)를 확보하세요.")
@@ -106,12 +134,13 @@ def _plan(sc: StageContext) -> tuple[Plan, List[AgentEvent]]:
             "LLM은 환경/설정에 따라 비활성 또는 실패할 수 있음",
         ],
         constraints=[
-            "파일 로딩은 load_file() 단일 진입점 사용",
+            "파일 로딩은 load_file()/aload_file() 단일 진입점 사용",
             "LLM 실패는 예외가 아니라 상태로 처리",
         ],
         notes={
             "has_file": has_file,
             "uploaded_files_count": len(uploaded_files),
+            "file_names": [_file_name_and_path(f)[0] for f in uploaded_files],
         },
     )
 
@@ -132,6 +161,84 @@ def _plan(sc: StageContext) -> tuple[Plan, List[AgentEvent]]:
     return plan, events
 
 
+@dataclass
+class _LogSource:
+    """업로드 파일 1개의 로드/스캔 결과."""
+
+    name: str
+    path: str
+    kind: str
+    summary: Optional[str]
+    text: str
+    scan: Optional[dict] = None
+    events: List[AgentEvent] = field(default_factory=list)
+
+
+def _load_concurrency(settings: Any) -> int:
+    return max(1, int(getattr(settings, "LOAD_CONCURRENCY", 4) or 1))
+
+
+async def _collect_source(f: Any, sem: asyncio.Semaphore, *, text_max_chars: int) -> _LogSource:
+    events: List[AgentEvent] = []
+    name, path, ext, mime = _file_name_and_path(f)
+
+    async with sem:
+        load_res = await aload_file(path, text_max_chars=text_max_chars)
+    ok = bool(getattr(load_res, "ok", False))
+    summary = getattr(load_res, "summary", None)
+    error = getattr(load_res, "error", None)
+
+    data = _get_data(load_res)
+    file_kind = str(data.get("kind", "unknown")).lower()
+
+    if not ok:
+        events.append(warn("executor.file_load_failed", f"파일 로드 실패({name}): error={error}"))
+        return _LogSource(name=name, path=path, kind=file_kind, summary=summary, text="", events=events)
+
+    text = data.get("text") or data.get("content") or ""
+    if not str(text).strip():
+        # text 없으면 preview라도 사용
+        text = data.get("preview_csv", "") or ""
+    events.append(info("executor.file_loaded", f"파일 로드 성공({name}): kind={file_kind}"))
+
+    # tail 밖의 오류도 놓치지 않도록 파일 전체를 mmap 스캔
+    scan: Optional[dict] = None
+    if file_kind == "text":
+        async with sem:
+            scan_res = await ascan_log_file(path, encoding=data.get("encoding"))
+        if getattr(scan_res, "ok", False):
+            scan = _get_data(scan_res)
+            events.append(info("executor.log_scanned", f"전체 로그 스캔 완료({name}): {scan_res.summary}"))
+        else:
+            events.append(warn("executor.log_scan_failed", f"전체 로그 스캔 실패({name}): {scan_res.error}"))
+
+    return _LogSource(
+        name=name, path=path, kind=file_kind, summary=summary, text=str(text).strip(), scan=scan, events=events
+    )
+
+
+def _merge_scans(scans: List[dict]) -> Optional[dict]:
+    # 규칙 기반 요약용: 파일별 키워드 카운트/매칭 라인 수 합산
+    if not scans:
+        return None
+    counts: Dict[str, int] = {}
+    for s in scans:
+        for k, v in (s.get("keyword_counts") or {}).items():
+            counts[k] = counts.get(k, 0) + int(v)
+    return {
+        "keyword_counts": counts,
+        "lines_matched": sum(int(s.get("lines_matched", 0)) for s in scans),
+    }
+
+
+def _format_scan_section(scanned: List[_LogSource]) -> str:
+    if len(scanned) == 1:
+        return _format_scan_lines(scanned[0].scan or {})
+    # 파일이 여러 개면 라인 예산을 나눠 파일별 소제목으로 표시
+    limit = max(5, _SCAN_PROMPT_LINES // len(scanned))
+    return "\n\n".join(f"### {s.name}\n{_format_scan_lines(s.scan or {}, limit)}" for s in scanned)
+
+
 async def _execute(sc: StageContext, plan: Plan) -> tuple[ExecutionResult, List[AgentEvent]]:
     events: List[AgentEvent] = []
     artifacts: List[ArtifactRef] = []
@@ -143,58 +250,54 @@ async def _execute(sc: StageContext, plan: Plan) -> tuple[ExecutionResult, List[
     log_text = ""
     source_note = ""
     file_kind = "text"
+    summary: Optional[str] = None
+    sources: List[_LogSource] = []
 
-    # 1) 파일 우선
+    # 1) 파일 우선: 여러 파일은 세마포어로 동시 로드/스캔, 텍스트 예산은 파일 수로 분배
     if uploaded_files:
-        f0 = uploaded_files[0]
-        name, path, ext, mime = _file_name_and_path(f0)
-
-        load_res = load_file(path)
-        ok = bool(getattr(load_res, "ok", False))
-        summary = getattr(load_res, "summary", None)
-        error = getattr(load_res, "error", None)
-
-        data = _get_data(load_res)
-        file_kind = str(data.get("kind", "unknown")).lower()
-
-        source_note = (
-            f"- file: {name}\n"
-            f"- path: {path}\n"
-            f"- loader_kind: {file_kind}\n"
-            f"- loader_summary: {summary}\n"
+        sem = asyncio.Semaphore(_load_concurrency(sc.settings))
+        text_max_chars = max(_MIN_TEXT_CHARS_PER_FILE, _TEXT_BUDGET_CHARS // len(uploaded_files))
+        sources = list(
+            await asyncio.gather(*[_collect_source(f, sem, text_max_chars=text_max_chars) for f in uploaded_files])
         )
 
-        if not ok:
+        notes: List[str] = []
+        texts: List[str] = []
+        for s in sources:
+            events.extend(s.events)
+            notes.append(
+                f"- file: {s.name}\n"
+                f"- path: {s.path}\n"
+                f"- loader_kind: {s.kind}\n"
+                f"- loader_summary: {s.summary}\n"
+                + (f"- full_scan: lines_matched={s.scan.get('lines_matched', 0)}\n" if s.scan else "")
+            )
+            if s.text:
+                texts.append(f"### {s.name}\n{s.text}" if len(sources) > 1 else s.text)
+        source_note = "\n".join(notes)
+        log_text = "\n\n".join(texts)
+
+        kinds = sorted({s.kind for s in sources})
+        file_kind = kinds[0] if len(kinds) == 1 else "multi"
+        summary = sources[0].summary if len(sources) == 1 else f"{len(sources)} files"
+
+        if not log_text:
             events.append(
                 warn(
-                    "executor.file_load_failed",
-                    f"파일 로드 실패 → user_message 기반으로 진행 (error={error})",
+                    "executor.no_text_from_loader",
+                    "로더 결과에 사용 가능한 텍스트가 없어 user_message로 대체합니다.",
                 )
             )
             log_text = sc.user_message
-        else:
-            text = data.get("text") or data.get("content") or ""
-            if not str(text).strip():
-                # text 없으면 preview라도 사용
-                preview_csv = data.get("preview_csv", "")
-                if preview_csv:
-                    text = preview_csv
-            log_text = str(text).strip()
-            if not log_text:
-                events.append(
-                    warn(
-                        "executor.no_text_from_loader",
-                        "로더 결과에 사용 가능한 텍스트가 없어 user_message로 대체합니다.",
-                    )
-                )
-                log_text = sc.user_message
-            events.append(info("executor.file_loaded", f"파일 로드 성공: kind={file_kind}"))
     else:
         source_note = "- file: (none)\n- source: user_message\n"
         log_text = sc.user_message
         file_kind = "text"
         events.append(info("executor.no_file", "파일 미첨부 → user_message를 로그 텍스트로 처리"))
 
+    scanned = [s for s in sources if s.scan]
+    scan = scanned[0].scan if len(scanned) == 1 else _merge_scans([s.scan for s in scanned])
+
     # 2) LLM 시도 (실패 시 rule-based)
     llm_client = LLMClient(sc.settings)
     try:
@@ -210,6 +313,8 @@ async def _execute(sc: StageContext, plan: Plan) -> tuple[ExecutionResult, List[
         f"[입력]\n{source_note}\n"
         f"[로그(일부)]\n{log_text}\n"
     )
+    if scanned:
+        user_prompt += f"\n[전체 파일 스캔(오류 키워드 라인, @byte offset)]\n{_format_scan_section(scanned)}\n"
 
     llm_res = await llm_client.generate(system_prompt=system_prompt, user_prompt=user_prompt)
     llm_used, llm_status, llm_reason, llm_model = _normalize_llm_meta(llm_res, sc.settings)
@@ -224,7 +329,7 @@ async def _execute(sc: StageContext, plan: Plan) -> tuple[ExecutionResult, List[
     else:
         error_code = llm_res.error
         events.append(warn("executor.llm.skipped", f"{llm_res.content} ({llm_res.error})"))
-        body = _rule_based_log_insights(log_text) + "\n\n" + llm_res.content
+        body = _rule_based_log_insights(log_text, scan) + "\n\n" + llm_res.content
 
         if llm_res.error == "network_unreachable":
             llm_hint_line = "- LLM: 미적용 (네트워크 불가)"
@@ -246,6 +351,8 @@ async def _execute(sc: StageContext, plan: Plan) -> tuple[ExecutionResult, List[
         f"{body}\n"
         f"{llm_debug_line}\n"
     )
+    if scanned:
+        report += f"\n---\n\n## 전체 파일 스캔 결과\n{_format_scan_section(scanned)}\n"
 
     out_path = _save_markdown(sc.settings, "logcop_report", report)
     artifacts.append(ArtifactRef(kind="markdown", name=out_path.name, path=str(out_path), mime_type="text/markdown"))
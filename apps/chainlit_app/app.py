@@ -19,7 +19,7 @@ from core.agent.runner import AgentRunner
 from core.logging.logger import setup_logging, get_logger, set_trace_id
 
 from apps.chainlit_app.ui.upload import handle_uploads
-from apps.chainlit_app.ui.render import render_result
+from apps.chainlit_app.ui.render import render_report_section, render_result
 
 from agents.dia.agent import DIAAgent
 from agents.logcop.agent import LogCopAgent
@@ -146,6 +146,8 @@ async def on_message(message: cl.Message):
     context = {
         "session_id": str(session_id),
         "uploaded_files": uploaded_files,
+        # 보고서 섹션을 완성되는 대로 UI에 표시(LLM 대기 전 첫 결과 노출)
+        "meta": {"on_report_section": render_report_section},
     }
 
     # 2) 실행
@@ -189,6 +189,18 @@ def _to_elements(artifacts: List[ArtifactRef]) -> List[cl.Element]:
     return elements
 
 
+# ----------------------------
+# Streaming report sections
+# ----------------------------
+async def render_report_section(report_name: str, section_md: str) -> None:
+    """
+    실행 중 완료된 보고서 섹션을 바로 메시지로 보낸다(core.tools.report_writer.SectionWriter의 sink).
+    - 최종 결과(render_result) 전에 헤더/프로파일 등 먼저 끝난 섹션부터 표시
+    """
+    if isinstance(section_md, str) and section_md.strip():
+        await cl.Message(content=section_md, author=report_name).send()
+
+
 # ----------------------------
 # Render final result
 # ----------------------------
@@ -26,6 +26,21 @@ class Settings(BaseSettings):
     LLM_TEMPERATURE: float = 0.2
     LLM_ENABLED: bool = False  # 폐쇄망/데모 안정성: 기본 OFF 권장
 
+    # Parse cache (CSV/XLSX → WORKSPACE_DIR/cache/parse/*.parquet)
+    PARSE_CACHE_ENABLED: bool = True
+    PARSE_CACHE_MAX_MB: int = 512
+
+    # Plot cache (데이터 해시 + 차트 사양 → 기존 PNG 아티팩트 재사용, WORKSPACE_DIR/cache/plots)
+    PLOT_CACHE_ENABLED: bool = True
+    PLOT_CACHE_MAX_ENTRIES: int = 1024
+
+    # DIA CSV sampling (행 수가 max_rows를 넘을 때): head | reservoir | stratified
+    DIA_SAMPLE_MODE: str = "reservoir"
+    DIA_STRATIFY_BY: str | None = None
+
+    # 다중 업로드 파일 동시 로드/분석 수(asyncio 세마포어)
+    LOAD_CONCURRENCY: int = 4
+
 
     # OpenRouter Optional headers
     OPENROUTER_APP_TITLE: str = "dia-agent-platform"
@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import tempfile
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from core.tools.data_analysis import (
+    DataProfile,
+    HyperLogLog,
+    MisraGries,
+    StreamingProfile,
+    compact_dataframe,
+    cross_analysis,
+    detect_datetime_columns,
+    profile_csv,
+    time_series_profile,
+)
+
+
+FIX_DIR = Path(__file__).resolve().parents[2] / "tests" / "fixtures"
+
+
+def smoke_data_analysis() -> None:
+    csv_path = FIX_DIR / "sample_utf8bom.csv"
+    assert csv_path.exists(), f"fixture missing: {csv_path}"
+    df = pd.read_csv(csv_path)
+
+    # 1) dtype 압축: 값은 그대로, 메모리는 같거나 감소
+    compacted, stats = compact_dataframe(df)
+    assert stats["bytes_after"] <= stats["bytes_before"], f"compact increased memory: {stats}"
+    assert (compacted["amount"].astype("int64") == df["amount"]).all(), "compact changed values"
+
+    # 2) 스트리밍 프로파일: count/mean/std/min/max는 pandas describe와 일치
+    prof = profile_csv(str(csv_path), chunksize=2)
+    desc = prof.describe()
+    ref = df.select_dtypes(include="number").describe().T
+    for col in ref.index:
+        for k in ["count", "mean", "std", "min", "max"]:
+            assert np.isclose(desc.loc[col, k], ref.loc[col, k]), f"profile {col}.{k} mismatch: {desc.loc[col, k]}"
+
+    # 3) 병합: 두 부분 프로파일 merge == 전체 프로파일
+    a = StreamingProfile()
+    a.update(df.iloc[:1])
+    b = StreamingProfile()
+    b.update(df.iloc[1:])
+    a.merge(b)
+    merged = a.describe()
+    assert np.isclose(merged.loc["amount", "std"], ref.loc["amount", "std"]), "merged std mismatch"
+    assert a.rows == len(df), f"merged rows mismatch: {a.rows}"
+
+    # 4) 범주형 스케치: 작은 입력에서는 고유값 수/상위 빈도가 정확해야 함
+    cats = prof.categorical_summary()
+    assert cats["name"]["distinct"] == df["name"].nunique(), f"hll distinct mismatch: {cats['name']}"
+    assert cats["created_at"]["top"][0][1] == len(df), f"heavy hitter mismatch: {cats['created_at']}"
+
+    hll = HyperLogLog()
+    hll.update(np.arange(50_000).astype(str))
+    assert abs(hll.estimate() - 50_000) < 50_000 * 0.05, f"hll estimate off: {hll.estimate()}"
+
+    mg = MisraGries(k=2)
+    mg.update(pd.Series(["a"] * 50 + ["b"] * 30 + list("cdefghij")))
+    assert mg.top(1)[0][0] == "a", f"misra-gries top mismatch: {mg.top(2)}"
+
+    # 5) DataProfile: 1회 프로파일로 조립한 표가 describe(include="all")과 동일
+    dp = DataProfile.from_frame(df)
+    assert dp.describe_all().to_markdown() == df.describe(include="all").to_markdown(), "describe_all mismatch"
+    assert dp.categorical["name"]["distinct"] == df["name"].nunique(), f"profile distinct mismatch: {dp.categorical}"
+
+    # 6) 시계열: 문자열 날짜 컬럼 감지 → 일/주/월 집계(기간 수 = 날짜 범위 기준) + 이동 평균
+    days = pd.date_range("2025-01-01", "2025-02-28", freq="D")
+    tsdf = pd.DataFrame({"day": days.strftime("%Y/%m/%d"), "value": np.arange(1, len(days) + 1, dtype="float64")})
+    assert detect_datetime_columns(tsdf) == {"day": "%Y/%m/%d"}, f"date detect mismatch: {detect_datetime_columns(tsdf)}"
+    tsp = time_series_profile(tsdf.sample(frac=1.0, random_state=0))
+    assert tsp is not None and tsp.primary == "daily" and len(tsp.resampled["daily"]) == 59, "daily resample mismatch"
+    assert list(tsp.resampled["monthly"]["value"].round(1)) == [16.0, 45.5], "monthly mean mismatch"
+    assert tsp.trend().loc["value", "change_pct"] > 0, "rising series should have positive trend"
+    assert time_series_profile(df.drop(columns=["created_at"])) is None, "non-date frame should have no time series"
+
+    # 7) 교차 분석: 다중 키 groupby 1회에서 도출한 차원별 평균 == 직접 groupby, 같은 데이터는 캐시 재사용
+    rng = np.random.default_rng(0)
+    xdf = pd.DataFrame(
+        {
+            "team": rng.choice(["a", "b", "c"], size=3000),
+            "status": rng.choice(["ok", "fail"], size=3000),
+            "latency": rng.exponential(10.0, size=3000),
+        }
+    )
+    xp = DataProfile.from_frame(xdf)
+    cross = cross_analysis(xdf, xp)
+    assert cross is not None and cross.dimensions == ["team", "status"], f"cross dims mismatch: {cross}"
+    ref_mean = xdf.groupby("team")["latency"].mean()
+    got_mean = cross.marginals["team"]["latency_mean"].reindex(ref_mean.index)
+    assert np.allclose(got_mean, ref_mean), "cross marginal mean mismatch"
+    assert cross.pivot is not None and cross.pivot.shape == (3, 2), f"pivot shape mismatch: {cross.pivot}"
+    assert cross_analysis(xdf.copy(), xp) is cross, "cross analysis should be memoized per data fingerprint"
+    keyed = cross_analysis(xdf, xp, source_key="file-a")
+    assert cross_analysis(xdf.copy(), xp, source_key="file-a") is keyed, "cross memo should reuse source_key hit"
+    assert cross_analysis(xdf, xp, source_key="file-b") is not keyed, "cross memo should separate source keys"
+
+    # 8) 바이트 구간 병렬 프로파일(workers>1)도 비 UTF-8(cp949) 인코딩을 그대로 적용
+    kdf = pd.DataFrame({"이름": ["가나다", "라마바", "사아자"] * 2000, "값": np.arange(6000, dtype="int64")})
+    with tempfile.TemporaryDirectory() as tmp:
+        kpath = Path(tmp) / "k.csv"
+        kdf.to_csv(kpath, index=False, encoding="cp949")
+        kprof = profile_csv(str(kpath), chunksize=500, workers=2, encoding="cp949")
+    assert kprof.rows == len(kdf), f"cp949 parallel rows mismatch: {kprof.rows}"
+    assert np.isclose(kprof.describe().loc["값", "mean"], kdf["값"].mean()), "cp949 parallel mean mismatch"
+    assert kprof.categorical_summary()["이름"]["distinct"] == 3, f"cp949 distinct mismatch: {kprof.categorical_summary()}"
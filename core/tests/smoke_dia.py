@@ -0,0 +1,113 @@
+# core/tests/smoke_dia.py
+from __future__ import annotations
+
+import asyncio
+import tempfile
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+import agents.dia.graph as dia_graph
+from agents.dia.graph import run_dia
+from core.config.settings import Settings
+from core.context import normalize_context
+
+
+FIX_DIR = Path(__file__).resolve().parents[2] / "tests" / "fixtures"
+
+
+def _write_csv(path: Path, rows: int, seed: int) -> Path:
+    rng = np.random.default_rng(seed)
+    pd.DataFrame(
+        {
+            "team": rng.choice(["a", "b", "c"], size=rows),
+            "latency": rng.exponential(10.0, size=rows),
+            "count": rng.integers(0, 100, size=rows),
+        }
+    ).to_csv(path, index=False)
+    return path
+
+
+def _run(files: list[Path], settings: Settings, meta: Optional[dict] = None):
+    ctx = normalize_context(
+        {
+            "session_id": "S-DIA",
+            "uploaded_files": [{"name": p.name, "path": str(p), "mime": "text/csv"} for p in files],
+            "meta": meta or {},
+        }
+    )
+    return asyncio.run(run_dia("분석해줘", ctx, settings))
+
+
+def smoke_dia() -> None:
+    with tempfile.TemporaryDirectory() as d:
+        root = Path(d)
+
+        # 1) 단일 CSV(run_dia, LLM 비활성): 보고서 파일 = UI로 스트리밍된 섹션을 순서대로 이어 붙인 것
+        streamed: list[str] = []
+
+        async def _sink(name: str, section_md: str) -> None:
+            streamed.append(section_md)
+
+        settings = Settings(WORKSPACE_DIR=str(root / "ws1"), LLM_ENABLED=False)
+        res = _run([FIX_DIR / "sample_utf8bom.csv"], settings, meta={"on_report_section": _sink})
+        report = next(Path(a.path) for a in res.artifacts if a.name.endswith(".md"))
+        body = report.read_text(encoding="utf-8")
+        assert body == "".join(s if s.endswith("\n") else s + "\n" for s in streamed), "report differs from streamed sections"
+        assert streamed[0].startswith("# DIA 분석 보고서") and "## 자동 인사이트(LLM)" in streamed[-1], (
+            f"section order invalid: {[s.strip().splitlines()[0] for s in streamed]}"
+        )
+        order = [body.find(h) for h in ("# DIA 분석 보고서", "## 상위 10행", "## describe()", "## 자동 인사이트(LLM)")]
+        assert -1 not in order and order == sorted(order), f"report section order invalid: {order}"
+        assert "## 그래프" in body, "report missing charts section"
+
+        # 2) 다중 파일(_execute): 파일별 보고서 + 병합 보고서, 전체 파일 스트리밍 통계는 LOAD_CONCURRENCY개까지만 동시 실행
+        files = [_write_csv(root / f"big{i}.csv", 6000, seed=i) for i in range(3)]
+        settings = Settings(WORKSPACE_DIR=str(root / "ws"), LLM_ENABLED=False, LOAD_CONCURRENCY=1)
+
+        active = peak = calls = 0
+        original = dia_graph.aprofile_csv
+
+        async def _tracked(path: str, **kwargs):
+            nonlocal active, peak, calls
+            active += 1
+            calls += 1
+            peak = max(peak, active)
+            try:
+                await asyncio.sleep(0.05)  # 다른 파일의 프로파일 단계가 겹칠 기회를 줌
+                return await original(path, **kwargs)
+            finally:
+                active -= 1
+
+        dia_graph.aprofile_csv = _tracked
+        try:
+            res = _run(files, settings)
+        finally:
+            dia_graph.aprofile_csv = original
+
+        names = [e["name"] for e in res.events]
+        assert names.count("executor.file_loaded") == len(files), f"multi-file load failed: {names}"
+        assert calls == len(files) and peak == 1, f"full-profile concurrency not bounded: calls={calls} peak={peak}"
+        reports = [a.name for a in res.artifacts if a.name.endswith(".md")]
+        assert len(reports) == len(files) + 1 and "multi_report" in reports[0], f"multi-file reports invalid: {reports}"
+
+        # 3) DIA_STRATIFY_BY 컬럼이 CSV에 없으면 분석을 실패시키지 않고 reservoir 표본 + 경고 이벤트
+        settings = Settings(
+            WORKSPACE_DIR=str(root / "ws3"), LLM_ENABLED=False, DIA_SAMPLE_MODE="stratified", DIA_STRATIFY_BY="region"
+        )
+        res = _run(files[:1], settings)
+        names = [e["name"] for e in res.events]
+        assert "executor.stratify_fallback" in names and "executor.file_loaded" in names, f"stratify fallback: {names}"
+
+        # 4) 같은 데이터를 다른 업로드 경로(파일명)로 다시 분석하면 차트는 캐시 hit(기존 PNG 재사용)
+        settings = Settings(WORKSPACE_DIR=str(root / "ws4"), LLM_ENABLED=False)
+        renamed = root / "reupload" / "renamed.csv"
+        renamed.parent.mkdir()
+        renamed.write_bytes(files[0].read_bytes())
+        charts = []
+        for path in (files[0], renamed):
+            res = _run([path], settings)
+            charts.append(sorted(a.path for a in res.artifacts if a.name.endswith(".png")))
+        assert charts[0] and charts[1] == charts[0], f"re-upload missed plot cache: {charts}"
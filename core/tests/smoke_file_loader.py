@@ -1,11 +1,20 @@
 # core/tests/smoke_file_loader.py
 from __future__ import annotations
 
+import asyncio
+import gzip
+import subprocess
+import sys
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import pandas as pd
 
-from core.tools.file_loader import load_file
+from core.tools import file_loader
+from core.tools.base import ToolResult
+from core.tools.file_loader import aload_file, load_file, register_loader, resolve_loader, scan_log_file
+from core.tools.parse_cache import ParseCache
 
 
 FIX_DIR = Path(__file__).resolve().parents[2] / "tests" / "fixtures"
@@ -22,6 +31,23 @@ def _get_data(load_res) -> dict:
     return data if isinstance(data, dict) else {}
 
 
+def _write_pages_pdf(path: Path, pages: int) -> Path:
+    # 페이지마다 "page N" 텍스트 1줄(TrueType 임베드 → pdfplumber로 추출 가능)
+    import matplotlib
+
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+    from matplotlib.backends.backend_pdf import PdfPages
+
+    with matplotlib.rc_context({"pdf.fonttype": 42}), PdfPages(path) as pdf:
+        for i in range(1, pages + 1):
+            fig = plt.figure(figsize=(3, 2))
+            fig.text(0.1, 0.5, f"page {i}")
+            pdf.savefig(fig)
+            plt.close(fig)
+    return path
+
+
 def smoke_file_loader() -> None:
     # 1) CSV
     csv_path = FIX_DIR / "sample_utf8bom.csv"
@@ -38,6 +64,112 @@ def smoke_file_loader() -> None:
     # 최소 shape 고정(샘플 파일에 맞게 조정 가능)
     assert df.shape[0] > 0 and df.shape[1] > 0, f"csv df shape invalid: {df.shape}"
 
+    # 1-1) CSV max_rows 절단: 파싱은 max_rows까지만, rows_total은 전체 기준
+    r = load_file(str(csv_path), max_rows=1)
+    data = _get_data(r)
+    assert data.get("truncated") is True, f"csv expected truncated=True but got {data.get('truncated')!r}"
+    assert data.get("shape", [0])[0] == 1, f"csv expected 1 row but got shape={data.get('shape')}"
+    assert data.get("rows_total") == df.shape[0], (
+        f"csv rows_total expected {df.shape[0]} but got {data.get('rows_total')!r}"
+    )
+    with tempfile.TemporaryDirectory() as d:
+        blank_path = Path(d) / "blank_tail.csv"
+        blank_path.write_text("a,b\n1,2\n3,4\n\n \n\n", encoding="utf-8")
+        data = _get_data(load_file(str(blank_path), max_rows=2))
+        assert data.get("rows_total") == 2 and data.get("truncated") is False, f"blank lines counted as rows: {data}"
+
+    # 1-2) CSV 표본 추출(reservoir): 전체 행 기준 rows_total, 원래 행 순서 유지
+    r = load_file(str(csv_path), max_rows=2, sample="reservoir")
+    data = _get_data(r)
+    sampled = data.get("df")
+    assert data.get("truncated") is True and data.get("rows_total") == df.shape[0], f"reservoir sample invalid: {data}"
+    assert isinstance(sampled, pd.DataFrame) and len(sampled) == 2, "reservoir sample expected 2 rows"
+    assert sampled["id"].is_monotonic_increasing, "reservoir sample should keep original row order"
+
+    # 1-2-1) 층화 표본: 작은 층이 많아도(최소 1행 보장) 표본 크기는 max_rows를 넘지 않음
+    with tempfile.TemporaryDirectory() as d:
+        strata_path = Path(d) / "strata.csv"
+        groups = ["big"] * 1000 + [f"tiny{i}" for i in range(8)]
+        pd.DataFrame({"g": groups, "v": range(len(groups))}).to_csv(strata_path, index=False)
+        sampled = _get_data(load_file(str(strata_path), max_rows=10, sample="stratified", stratify_by="g"))["df"]
+        assert len(sampled) == 10 and sampled["g"].nunique() == 9, f"stratified sample invalid: {sampled['g'].tolist()}"
+
+    # 1-3) 압축 CSV(.gz): 청크 리더가 스트림을 직접 읽음
+    with tempfile.TemporaryDirectory() as d:
+        gz_path = Path(d) / "sample.csv.gz"
+        gz_path.write_bytes(gzip.compress(csv_path.read_bytes()))
+        r = load_file(str(gz_path), max_rows=1)
+        data = _get_data(r)
+        assert data.get("kind") == "csv" and data.get("rows_total") == df.shape[0], f"gz csv load failed: {r}"
+
+    # 1-4) CP949(한국어 Windows 내보내기) CSV: 인코딩 자동 판별
+    with tempfile.TemporaryDirectory() as d:
+        cp949_path = Path(d) / "cp949.csv"
+        cp949_path.write_bytes("부서,값\n개발,1\n운영,2\n".encode("cp949"))
+        r = load_file(str(cp949_path))
+        data = _get_data(r)
+        assert data.get("encoding") == "cp949", f"cp949 expected but got {data.get('encoding')!r}"
+        assert data["df"].columns.tolist() == ["부서", "값"], f"cp949 columns invalid: {data['df'].columns.tolist()}"
+
+        # UTF-16 LE BOM(Excel "유니코드 텍스트"): CSV는 utf-16으로 디코딩, tail/mmap 텍스트 경로는 명시적 오류
+        u16_path = Path(d) / "u16.csv"
+        u16_path.write_bytes("부서,값\n개발,1\n운영,2\n".encode("utf-16"))
+        r = load_file(str(u16_path), max_rows=1)
+        data = _get_data(r)
+        assert data.get("encoding") == "utf-16", f"utf-16 expected but got {data.get('encoding')!r}"
+        assert data["df"].columns.tolist() == ["부서", "값"] and data.get("rows_total") == 2, f"utf-16 csv invalid: {data}"
+        u16_log = Path(d) / "u16.log"
+        u16_log.write_bytes("ERROR 실패\n".encode("utf-16"))
+        for res in (load_file(str(u16_log)), scan_log_file(str(u16_log))):
+            assert _get_attr(res, "error") == "unsupported_encoding", f"utf-16 log expected error but got {res}"
+
+    # 1-5) XLSX: read-only 스트리밍, 전체 시트 제공(시트별 max_rows 절단)
+    try:
+        import openpyxl
+    except Exception:  # pragma: no cover
+        openpyxl = None
+    if openpyxl is not None:
+        with tempfile.TemporaryDirectory() as d:
+            xlsx_path = Path(d) / "multi.xlsx"
+            with pd.ExcelWriter(xlsx_path) as w:
+                df.to_excel(w, sheet_name="first", index=False)
+                df.head(1).to_excel(w, sheet_name="second", index=False)
+            r = load_file(str(xlsx_path), max_rows=2)
+            sheets = _get_data(r).get("sheets") or []
+            assert [s["name"] for s in sheets] == ["first", "second"], f"xlsx sheets invalid: {sheets!r}"
+            assert sheets[0]["shape"][0] == 2 and sheets[0]["rows_total"] == df.shape[0], f"xlsx truncation: {sheets[0]}"
+            assert sheets[0]["truncated"] is True and sheets[1]["truncated"] is False, "xlsx truncated flags invalid"
+            assert sheets[0]["df"].equals(df.head(2)), "xlsx first sheet differs from csv head"
+
+    # 1-6) 파싱 캐시(Parquet sidecar): 두 번째 로드는 hit
+    with tempfile.TemporaryDirectory() as cache_dir:
+        if ParseCache(cache_dir).available:
+            r1 = load_file(str(csv_path), cache_dir=cache_dir)
+            r2 = load_file(str(csv_path), cache_dir=cache_dir)
+            assert _get_data(r1).get("cache") == "miss", f"cache expected miss but got {_get_data(r1).get('cache')!r}"
+            assert _get_data(r2).get("cache") == "hit", f"cache expected hit but got {_get_data(r2).get('cache')!r}"
+            assert _get_data(r2)["df"].equals(df), "cache hit df differs from parsed df"
+            assert _get_data(r1)["cache_key"] and _get_data(r2)["cache_key"] == _get_data(r1)["cache_key"], (
+                "cache key not exposed for reuse"
+            )
+
+            # 같은 key 동시 쓰기: 작성자마다 고유 임시 파일 → 결과는 읽을 수 있고 임시 파일은 남지 않음
+            cache = ParseCache(cache_dir)
+            with ThreadPoolExecutor(max_workers=4) as ex:
+                list(ex.map(lambda _: cache.put("race", df, {"n": len(df)}), range(8)))
+            hit = cache.get("race")
+            assert hit is not None and hit[0].equals(df), "concurrent cache put corrupted the entry"
+            assert not list(Path(cache_dir).glob("*.tmp")), "cache put left temp files behind"
+
+    # 1-7) 캐시를 끄면 파싱 캐시 모듈(pyarrow.parquet)은 import되지 않음(별도 프로세스에서 확인)
+    probe = (
+        "import sys; from core.tools.file_loader import load_file; "
+        f"load_file({str(csv_path)!r}); "
+        "print(any(m in sys.modules for m in ('core.tools.parse_cache', 'pyarrow.parquet')))"
+    )
+    out = subprocess.run([sys.executable, "-c", probe], capture_output=True, text=True, cwd=FIX_DIR.parents[1])
+    assert out.returncode == 0 and out.stdout.strip() == "False", f"cache-off load imported parse cache: {out}"
+
     # 2) LOG(TEXT)
     log_path = FIX_DIR / "sample.log"
     assert log_path.exists(), f"fixture missing: {log_path}"
@@ -50,6 +182,28 @@ def smoke_file_loader() -> None:
     data = _get_data(r)
     text = (data.get("text") or data.get("content") or "").strip()
     assert len(text) > 0, "log expected data.text/content not empty"
+    assert data.get("file_size") == log_path.stat().st_size, f"log file_size mismatch: {data.get('file_size')!r}"
+
+    # 2-1) LOG 전체 스캔(mmap)
+    r = scan_log_file(str(log_path))
+    assert bool(_get_attr(r, "ok", False)) is True, f"log scan failed: {_get_attr(r, 'last_error', None)}"
+    data = _get_data(r)
+    matches = data.get("matches") or []
+    assert matches and "ERROR" in matches[0]["line"], f"log scan expected ERROR line but got {matches!r}"
+    with log_path.open("rb") as f:
+        f.seek(matches[0]["offset"])
+        assert f.readline().startswith(matches[0]["line"].encode("utf-8")), "log scan offset mismatch"
+
+    # 2-2) 압축 로그(.gz): 디스크에 풀지 않고 tail/스캔, 결과는 원본과 동일
+    with tempfile.TemporaryDirectory() as d:
+        gz_path = Path(d) / "sample.log.1.gz"
+        gz_path.write_bytes(gzip.compress(log_path.read_bytes()))
+        r = load_file(str(gz_path))
+        data = _get_data(r)
+        assert data.get("kind") == "text" and data.get("compression") == "gzip", f"gz log load failed: {r}"
+        assert data.get("text") == _get_data(load_file(str(log_path))).get("text"), "gz log text mismatch"
+        gz_scan = _get_data(scan_log_file(str(gz_path)))
+        assert gz_scan.get("matches") == matches, f"gz log scan mismatch: {gz_scan.get('matches')!r}"
 
     # 3) TXT(TEXT)
     txt_path = FIX_DIR / "sample.txt"
@@ -75,3 +229,41 @@ def smoke_file_loader() -> None:
         data = _get_data(r)
         text = (data.get("text") or data.get("content") or "").strip()
         assert len(text) > 0, "pdf expected extracted text not empty (use a text-based sample.pdf)"
+
+    # 4-1) 다중 페이지 PDF(aload_file): 프로세스 풀 병렬 추출이어도 페이지 순서 유지
+    try:
+        import pdfplumber
+    except Exception:  # pragma: no cover
+        pdfplumber = None
+    if pdfplumber is not None:
+        with tempfile.TemporaryDirectory() as d:
+            pages_path = _write_pages_pdf(Path(d) / "pages.pdf", 10)
+            min_bytes = file_loader._PARALLEL_MIN_FILE_BYTES
+            file_loader._PARALLEL_MIN_FILE_BYTES = 0  # 작은 파일도 병렬 경로를 타도록
+            try:
+                r = asyncio.run(aload_file(str(pages_path), pdf_max_pages=None, pdf_workers=3))
+            finally:
+                file_loader._PARALLEL_MIN_FILE_BYTES = min_bytes
+            data = _get_data(r)
+            assert data.get("parallel") is True, f"pdf expected parallel extraction: {_get_attr(r, 'summary')}"
+            expected = [f"page {i}" for i in range(1, 11)]
+            assert [t.strip() for t in data.get("page_texts", [])] == expected, f"pdf page order: {data.get('page_texts')}"
+
+    # 5) 로더 레지스트리: 새 확장자는 load_file 수정 없이 등록만으로 지원
+    @register_loader("smoke", extensions=(".smoke",))
+    def _load_smoke(p, ext, opts):
+        return ToolResult(ok=True, summary="loaded smoke", data={"kind": "smoke", "path": str(p)})
+
+    with tempfile.TemporaryDirectory() as d:
+        smoke_path = Path(d) / "a.smoke"
+        smoke_path.write_text("x", encoding="utf-8")
+        r = load_file(str(smoke_path))
+        assert _get_data(r).get("kind") == "smoke", f"registered loader not used: {r}"
+
+    # 5-1) 확장자가 없어도 매직 바이트로 PDF 판별
+    if pdf_path.exists():
+        with tempfile.TemporaryDirectory() as d:
+            noext = Path(d) / "upload"
+            noext.write_bytes(pdf_path.read_bytes())
+            spec = resolve_loader(noext)
+            assert spec is not None and spec.kind == "pdf", f"magic sniff expected pdf but got {spec}"
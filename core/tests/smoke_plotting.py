@@ -0,0 +1,71 @@
+# core/tests/smoke_plotting.py
+from __future__ import annotations
+
+import asyncio
+import tempfile
+from dataclasses import replace
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from core.tools.plot_cache import PlotCache
+from core.tools.plotting import ChartSpec, arender_chart, lttb_indices, minmax_indices, render_chart
+
+
+def smoke_plotting() -> None:
+    frames = [pd.DataFrame({"a": np.sin(np.arange(200) / (i + 1)), "b": np.arange(200) * i}) for i in range(4)]
+    specs = [ChartSpec(kind="line", title=f"chart_{i}", columns=("a", "b")) for i in range(4)]
+
+    with tempfile.TemporaryDirectory() as d:
+        # 1) 동기 렌더링: PNG 생성
+        ref = [render_chart(s, f, Path(d) / f"ref_{i}.png").read_bytes() for i, (s, f) in enumerate(zip(specs, frames))]
+        assert all(b.startswith(b"\x89PNG") for b in ref), "render_chart expected PNG output"
+
+        # 2) 동시 렌더링: 같은 입력이면 순차 렌더링과 바이트 단위로 동일(차트끼리 상태가 섞이지 않음)
+        async def _render_all():
+            return await asyncio.gather(
+                *[arender_chart(s, f, Path(d) / f"async_{i}.png") for i, (s, f) in enumerate(zip(specs, frames))]
+            )
+
+        outs = asyncio.run(_render_all())
+        assert [o.read_bytes() for o in outs] == ref, "concurrent charts differ from sequential renders"
+
+    # 3) 다운샘플링: 고정 점 수, 양 끝점/스파이크 보존, 순서 유지
+    y = np.sin(np.arange(100_000) / 1000.0)
+    y[54_321] = 10.0
+    for idx in (lttb_indices(np.arange(len(y)), y, 500), minmax_indices(y, 500)):
+        assert len(idx) <= 502 and idx[0] == 0 and idx[-1] == len(y) - 1, f"downsample bounds invalid: {idx[:3]}"
+        assert 54_321 in idx and bool(np.all(np.diff(idx) > 0)), "downsample lost spike or order"
+
+    # 4) 집계형 차트(histogram/hist2d/quantile_bands): 결측이 섞인 대용량 열도 PNG 1장
+    rng = np.random.default_rng(0)
+    big = pd.DataFrame({"x": rng.normal(size=200_000), "y": rng.normal(size=200_000)})
+    big.loc[::97, "y"] = np.nan
+    with tempfile.TemporaryDirectory() as d:
+        for kind, cols in (("histogram", ("x",)), ("hist2d", ("x", "y")), ("quantile_bands", ("y",))):
+            out = render_chart(ChartSpec(kind=kind, title=kind, columns=cols, bins=40), big, Path(d) / f"{kind}.png")
+            assert out.read_bytes().startswith(b"\x89PNG"), f"{kind} expected PNG output"
+
+    # 5) 차트 캐시: 같은 데이터/사양이면 기존 경로 재사용, 데이터나 사양이 바뀌면 새로 렌더링
+    with tempfile.TemporaryDirectory() as d:
+        cache = PlotCache(Path(d) / "cache")
+        spec = ChartSpec(kind="line", title="cached", columns=("a", "b"))
+        first = render_chart(spec, frames[0], Path(d) / "first.png", cache=cache)
+        again = render_chart(spec, frames[0].copy(), Path(d) / "again.png", cache=cache)
+        assert again == first and not (Path(d) / "again.png").exists(), "plot cache miss on identical chart"
+        changed = frames[0].assign(a=frames[0]["a"] + 1)
+        assert render_chart(spec, changed, Path(d) / "data.png", cache=cache).name == "data.png", "stale hit on new data"
+        assert render_chart(replace(spec, dpi=100), frames[0], Path(d) / "dpi.png", cache=cache).name == "dpi.png", (
+            "stale hit on new spec"
+        )
+        for _ in range(8):
+            cache.put("race", first)
+        assert cache.get("race") == first and not list(cache.cache_dir.glob("*.tmp")), "plot cache put left temp files"
+        renamed = render_chart(replace(spec, title="other upload"), frames[0], Path(d) / "renamed.png", cache=cache)
+        assert renamed == first, "plot cache keyed on title"
+
+        small = PlotCache(Path(d) / "small", max_entries=2)
+        for i in range(4):
+            small.put(f"k{i}", first)
+        assert sorted(e.stem for e in small.cache_dir.glob("*.json")) == ["k2", "k3"], "plot cache not bounded"
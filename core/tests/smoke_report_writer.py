@@ -0,0 +1,64 @@
+# core/tests/smoke_report_writer.py
+from __future__ import annotations
+
+import asyncio
+import tempfile
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from core.tools.report_writer import SectionWriter, render_table, write_table
+
+
+def smoke_report_writer() -> None:
+    # 1) 기본 표: 숫자 우측 정렬, 결측은 빈 칸, 파이프/줄바꿈 이스케이프
+    df = pd.DataFrame({"x": [1.5, np.nan], "s": ["a|b", "c\nd"], "n": [1, 2]})
+    lines = render_table(df, index=False).splitlines()
+    assert lines[0] == "| x | s | n |" and lines[1] == "|---:|:---|---:|", f"header invalid: {lines[:2]}"
+    assert lines[2] == "| 1.5 | a\\|b | 1 |" and lines[3] == "|  | c d | 2 |", f"rows invalid: {lines[2:]}"
+
+    # 2) 넓은 표: max_cols개씩 페이지 분할 + max_pages 초과 컬럼은 생략 안내
+    wide = pd.DataFrame(np.arange(3 * 50).reshape(3, 50), columns=[f"c{i}" for i in range(50)])
+    out = render_table(wide, index=False, max_cols=10, max_pages=2)
+    aligns = [ln for ln in out.splitlines() if ln.startswith(("|---", "|:---"))]
+    assert len(aligns) == 2, f"expected 2 column pages: {len(aligns)}"
+    assert "c19" in out and "c20" not in out and "나머지 30개 컬럼 생략" in out, "column cap not applied"
+
+    # 3) 섹션 스트리밍: emit마다 파일에 바로 이어 쓰고 sink에도 같은 순서로 전달(sink 실패는 무시)
+    received: list[tuple[str, str]] = []
+
+    async def _sink(name: str, md: str) -> None:
+        received.append((name, md))
+        if len(received) == 2:
+            raise RuntimeError("ui closed")
+
+    async def _write(path: Path) -> list[str]:
+        w = SectionWriter(path, name="r", sink=_sink)
+        seen = []
+        for md in ("# head\n", "## a\n", "## b"):
+            await w.emit(md)
+            seen.append(path.read_text(encoding="utf-8"))
+        return seen
+
+    with tempfile.TemporaryDirectory() as d:
+        seen = asyncio.run(_write(Path(d) / "r.md"))
+        assert seen == ["# head\n", "# head\n## a\n", "# head\n## a\n## b\n"], f"sections not appended: {seen}"
+        assert [md for _, md in received] == ["# head\n", "## a\n", "## b"], f"sink order invalid: {received}"
+
+    # 4) 큰 표 섹션: emit_stream(write)가 파일 핸들에 write_table로 바로 쓰고, sink는 같은 구간을 받음
+    streamed: list[str] = []
+
+    async def _collect(name: str, md: str) -> None:
+        streamed.append(md)
+
+    async def _write_stream(path: Path) -> None:
+        w = SectionWriter(path, name="r", sink=_collect)
+        await w.emit("# head\n")
+        await w.emit_stream(lambda fh: (fh.write("## 표\n\n"), write_table(fh, wide, index=False)))
+
+    with tempfile.TemporaryDirectory() as d:
+        asyncio.run(_write_stream(Path(d) / "s.md"))
+        body = (Path(d) / "s.md").read_text(encoding="utf-8")
+        assert streamed[1] == "## 표\n\n" + render_table(wide, index=False) + "\n", "streamed table section invalid"
+        assert body == "".join(streamed), "report file differs from streamed sections"
@@ -1,5 +1,5 @@
 # core/tools/__init__.py
 from .base import ToolResult
-from .file_loader import load_file
+from .file_loader import aload_file, ascan_log_file, load_file, register_loader, scan_log_file
 
-__all__ = ["ToolResult", "load_file"]
+__all__ = ["ToolResult", "load_file", "aload_file", "scan_log_file", "ascan_log_file", "register_loader"]
@@ -0,0 +1,86 @@
+# core/tools/compression.py
+from __future__ import annotations
+
+import bz2
+import gzip
+import zipfile
+from contextlib import contextmanager
+from pathlib import Path
+from typing import BinaryIO, Iterator, Optional
+
+
+# 압축 형식 판별: 확장자 우선, 없으면 매직 바이트
+# (zip은 xlsx와 매직(PK)이 같으므로 확장자로만 판별)
+_COMPRESSION_BY_EXT = {".gz": "gzip", ".gzip": "gzip", ".bz2": "bz2", ".zip": "zip"}
+_GZIP_MAGIC = b"\x1f\x8b"
+_BZ2_MAGIC = b"BZh"
+
+
+def detect_compression(path: str | Path) -> Optional[str]:
+    """
+    압축 파일이면 "gzip" | "bz2" | "zip", 아니면 None.
+    - 확장자가 없거나 다르더라도 gzip/bz2 매직 바이트면 압축으로 판별
+    """
+    p = Path(path)
+    method = _COMPRESSION_BY_EXT.get(p.suffix.lower())
+    if method is not None:
+        return method
+
+    try:
+        with p.open("rb") as f:
+            head = f.read(4)
+    except OSError:
+        return None
+    if head.startswith(_GZIP_MAGIC):
+        return "gzip"
+    # "BZh" + 블록 크기('1'~'9')까지 확인해 텍스트 오판을 피함
+    if head.startswith(_BZ2_MAGIC) and head[3:4].isdigit() and head[3:4] != b"0":
+        return "bz2"
+    return None
+
+
+def _zip_member(zf: zipfile.ZipFile) -> str:
+    # 디렉터리/macOS 메타데이터를 제외한 첫 번째 파일(1파일 압축 가정)
+    for info in zf.infolist():
+        if info.is_dir() or info.filename.startswith("__MACOSX/"):
+            continue
+        return info.filename
+    raise ValueError("zip archive has no file member")
+
+
+def inner_name(path: str | Path, method: str) -> str:
+    """
+    압축을 풀었을 때의 파일명(로더 판별용).
+    - gzip/bz2: 압축 확장자만 제거("app.log.gz" → "app.log")
+    - zip: 첫 번째 파일 멤버 이름
+    """
+    p = Path(path)
+    if method == "zip":
+        with zipfile.ZipFile(p) as zf:
+            return Path(_zip_member(zf)).name
+    if p.suffix.lower() in _COMPRESSION_BY_EXT:
+        return p.stem
+    return p.name
+
+
+@contextmanager
+def open_stream(path: str | Path) -> Iterator[BinaryIO]:
+    """
+    파일을 바이너리 스트림으로 연다(압축이면 투명하게 스트리밍 해제).
+    - 해제된 내용을 디스크에 쓰거나 메모리에 통째로 올리지 않음(read(n) 단위로 풀림)
+    - seek은 보장하지 않으므로 순차 읽기 용도로만 사용
+    """
+    p = Path(path)
+    method = detect_compression(p)
+    if method == "gzip":
+        with gzip.open(p, "rb") as f:
+            yield f
+    elif method == "bz2":
+        with bz2.open(p, "rb") as f:
+            yield f
+    elif method == "zip":
+        with zipfile.ZipFile(p) as zf, zf.open(_zip_member(zf)) as f:
+            yield f
+    else:
+        with p.open("rb") as f:
+            yield f
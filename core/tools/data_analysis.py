@@ -0,0 +1,957 @@
+# core/tools/data_analysis.py
+from __future__ import annotations
+
+import asyncio
+import functools
+import hashlib
+import io
+import re
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field, replace
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Optional
+
+import numpy as np
+import pandas as pd
+
+from core.tools.compression import detect_compression, open_stream
+from core.tools.encoding import is_ascii_compatible
+from core.tools.file_loader import _get_loader_executor, _process_pool
+
+
+# 유니크 비율이 이 값 이하인 문자열 컬럼만 category로 변환
+# (agents/dia/insights.rule_based_insights의 범주형 후보 기준과 동일)
+CATEGORY_MAX_UNIQ_RATIO = 0.5
+
+
+def _downcast_float(s: pd.Series) -> pd.Series:
+    # float32로 값이 정확히 보존될 때만 변환(보고서 수치가 바뀌지 않도록)
+    s32 = s.astype("float32")
+    same = (s32.astype("float64") == s) | (s.isna() & s32.isna())
+    return s32 if bool(same.all()) else s
+
+
+def compact_dataframe(
+    df: pd.DataFrame,
+    *,
+    max_uniq_ratio: float = CATEGORY_MAX_UNIQ_RATIO,
+) -> tuple[pd.DataFrame, dict[str, Any]]:
+    """
+    DataFrame 메모리를 줄이는 dtype 압축.
+    - 정수: 값 범위에 맞는 가장 작은 signed 정수형으로 downcast
+    - 실수: float32로 손실 없이 표현되는 컬럼만 downcast
+    - 문자열(object): 유니크 비율이 낮은 컬럼은 category로 변환
+    반환: (압축된 df, {"bytes_before", "bytes_after", "bytes_saved", "converted"})
+    """
+    bytes_before = int(df.memory_usage(deep=True).sum())
+    out = df.copy()
+    converted: dict[str, str] = {}
+    n = len(out)
+
+    for col in out.columns:
+        s = out[col]
+        if pd.api.types.is_bool_dtype(s):
+            continue
+
+        if pd.api.types.is_integer_dtype(s):
+            new = pd.to_numeric(s, downcast="integer")
+        elif pd.api.types.is_float_dtype(s):
+            new = _downcast_float(s)
+        elif pd.api.types.is_object_dtype(s) and n:
+            uniq_ratio = s.nunique(dropna=False) / n
+            new = s.astype("category") if uniq_ratio <= max_uniq_ratio else s
+        else:
+            continue
+
+        if new.dtype != s.dtype:
+            out[col] = new
+            converted[str(col)] = str(new.dtype)
+
+    bytes_after = int(out.memory_usage(deep=True).sum())
+    return out, {
+        "bytes_before": bytes_before,
+        "bytes_after": bytes_after,
+        "bytes_saved": bytes_before - bytes_after,
+        "converted": converted,
+    }
+
+
+# ----------------------------
+# Streaming statistics (one pass, mergeable)
+# ----------------------------
+_PROFILE_CHUNK_ROWS = 100_000
+_PROFILE_QUANTILES = (0.1, 0.25, 0.5, 0.75, 0.9)
+
+
+def _k_scale(q: np.ndarray, compression: float) -> np.ndarray:
+    # t-digest k1 스케일: 꼬리(q→0,1)일수록 centroid를 잘게 유지
+    return compression / (2.0 * np.pi) * np.arcsin(2.0 * np.clip(q, 0.0, 1.0) - 1.0)
+
+
+@dataclass
+class TDigest:
+    """
+    근사 분위수용 merging t-digest (NumPy 벡터화 구현).
+    - centroid(평균, 가중치)만 유지하므로 메모리는 compression에 비례(데이터 크기와 무관)
+    - 두 digest는 centroid를 합쳐 다시 압축하는 것으로 병합(청크/워커 결과 병합 가능)
+    """
+
+    compression: float = 200.0
+    means: np.ndarray = field(default_factory=lambda: np.empty(0))
+    weights: np.ndarray = field(default_factory=lambda: np.empty(0))
+
+    @property
+    def total(self) -> float:
+        return float(self.weights.sum())
+
+    def _compress(self, means: np.ndarray, weights: np.ndarray) -> None:
+        order = np.argsort(means, kind="mergesort")
+        means, weights = means[order], weights[order]
+        total = weights.sum()
+        if total <= 0:
+            self.means, self.weights = np.empty(0), np.empty(0)
+            return
+
+        # centroid 중심의 누적 분위수로 k-스케일 버킷(폭 1)을 정해 같은 버킷끼리 합친다
+        q_mid = (np.cumsum(weights) - weights / 2.0) / total
+        bucket = np.floor(_k_scale(q_mid, self.compression)).astype(np.int64)
+        _, idx = np.unique(bucket, return_inverse=True)
+        w = np.bincount(idx, weights=weights)
+        m = np.bincount(idx, weights=means * weights) / w
+        self.means, self.weights = m, w
+
+    def update(self, values: np.ndarray) -> None:
+        values = np.asarray(values, dtype="float64")
+        values = values[~np.isnan(values)]
+        if values.size == 0:
+            return
+        self._compress(
+            np.concatenate([self.means, values]),
+            np.concatenate([self.weights, np.ones(values.size)]),
+        )
+
+    def merge(self, other: "TDigest") -> None:
+        if other.weights.size == 0:
+            return
+        self._compress(
+            np.concatenate([self.means, other.means]),
+            np.concatenate([self.weights, other.weights]),
+        )
+
+    def quantile(self, q: float) -> float:
+        if self.weights.size == 0:
+            return float("nan")
+        if self.weights.size == 1:
+            return float(self.means[0])
+        centers = np.cumsum(self.weights) - self.weights / 2.0
+        return float(np.interp(q * self.total, centers, self.means))
+
+
+@dataclass
+class NumericStats:
+    """
+    숫자 컬럼 1개의 스트리밍 통계.
+    - count/mean/std는 Chan 병렬 분산 공식(M2)으로 정확히 병합
+    - min/max 정확, 분위수는 TDigest 근사
+    """
+
+    count: int = 0
+    missing: int = 0
+    mean: float = 0.0
+    m2: float = 0.0
+    min: float = float("inf")
+    max: float = float("-inf")
+    digest: TDigest = field(default_factory=TDigest)
+
+    def update(self, values: np.ndarray) -> None:
+        values = np.asarray(values, dtype="float64")
+        nan_mask = np.isnan(values)
+        self.missing += int(nan_mask.sum())
+        values = values[~nan_mask]
+        if values.size == 0:
+            return
+
+        other = NumericStats(
+            count=int(values.size),
+            mean=float(values.mean()),
+            m2=float(((values - values.mean()) ** 2).sum()),
+            min=float(values.min()),
+            max=float(values.max()),
+        )
+        other.digest.compression = self.digest.compression
+        other.digest.update(values)
+        self.merge(other, include_missing=False)
+
+    def merge(self, other: "NumericStats", *, include_missing: bool = True) -> None:
+        if include_missing:
+            self.missing += other.missing
+        if other.count == 0:
+            return
+        n = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / n
+        self.m2 += other.m2 + delta * delta * self.count * other.count / n
+        self.count = n
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self.digest.merge(other.digest)
+
+    @property
+    def std(self) -> float:
+        # pandas describe()와 같은 표본 표준편차(ddof=1)
+        return float(np.sqrt(self.m2 / (self.count - 1))) if self.count > 1 else float("nan")
+
+
+def _bit_length_u64(x: np.ndarray) -> np.ndarray:
+    # uint64 배열의 bit length (float log2는 2^53 이상에서 부정확하므로 이진 탐색)
+    x = x.copy()
+    n = np.zeros(x.shape, dtype=np.int64)
+    for shift in (32, 16, 8, 4, 2, 1):
+        big = x >= (np.uint64(1) << np.uint64(shift))
+        n[big] += shift
+        x[big] >>= np.uint64(shift)
+    return n + (x > 0)
+
+
+@dataclass
+class HyperLogLog:
+    """
+    근사 고유값 수(cardinality) 스케치.
+    - 레지스터 2^p개(uint8)만 유지: p=12면 4 KiB, 표준오차 약 1.6%
+    - 병합은 레지스터별 max
+    """
+
+    p: int = 12
+    registers: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=np.uint8))
+
+    def __post_init__(self) -> None:
+        if self.registers.size == 0:
+            self.registers = np.zeros(1 << self.p, dtype=np.uint8)
+
+    def update(self, values: np.ndarray) -> None:
+        if len(values) == 0:
+            return
+        h = pd.util.hash_array(np.asarray(values, dtype=object))
+        idx = (h >> np.uint64(64 - self.p)).astype(np.int64)
+        rest = h & np.uint64((1 << (64 - self.p)) - 1)
+        rank = ((64 - self.p) - _bit_length_u64(rest) + 1).astype(np.uint8)
+        np.maximum.at(self.registers, idx, rank)
+
+    def merge(self, other: "HyperLogLog") -> None:
+        np.maximum(self.registers, other.registers, out=self.registers)
+
+    def estimate(self) -> int:
+        m = float(self.registers.size)
+        alpha = 0.7213 / (1.0 + 1.079 / m)
+        est = alpha * m * m / float(np.sum(np.power(2.0, -self.registers.astype("float64"))))
+        zeros = int((self.registers == 0).sum())
+        if est <= 2.5 * m and zeros:
+            # 작은 범위 보정(linear counting)
+            est = m * np.log(m / zeros)
+        return int(round(est))
+
+
+@dataclass
+class MisraGries:
+    """
+    빈도 상위(heavy hitter) 스케치.
+    - 카운터를 최대 k개만 유지, 추정 빈도는 실제보다 최대 N/(k+1) 작을 수 있음(과대추정 없음)
+    - 청크 단위로 value_counts 후 병합(mergeable summary 방식)
+    """
+
+    k: int = 64
+    counters: dict[str, int] = field(default_factory=dict)
+
+    def _absorb(self, counts: pd.Series) -> None:
+        merged = counts.astype("int64")
+        if self.counters:
+            merged = pd.Series(self.counters, dtype="int64").add(merged, fill_value=0).astype("int64")
+        if len(merged) > self.k:
+            cut = int(merged.nlargest(self.k + 1).iloc[-1])
+            merged = merged[merged > cut] - cut
+        self.counters = {str(key): int(c) for key, c in merged.items()}
+
+    def update(self, values: pd.Series) -> None:
+        self._absorb(values.value_counts(dropna=False))
+
+    def merge(self, other: "MisraGries") -> None:
+        if other.counters:
+            self._absorb(pd.Series(other.counters, dtype="int64"))
+
+    def top(self, n: int) -> list[tuple[str, int]]:
+        return sorted(self.counters.items(), key=lambda x: x[1], reverse=True)[:n]
+
+
+@dataclass
+class CategoricalStats:
+    """범주형(비숫자) 컬럼 1개의 스트리밍 스케치: 근사 고유값 수 + 상위 빈도."""
+
+    count: int = 0
+    hll: HyperLogLog = field(default_factory=HyperLogLog)
+    heavy: MisraGries = field(default_factory=MisraGries)
+
+    def update(self, values: pd.Series) -> None:
+        # 청크마다 추론 dtype이 달라도 같은 키가 되도록 문자열로 통일(NaN → "nan")
+        values = values.astype(str)
+        self.count += int(len(values))
+        self.hll.update(values.to_numpy())
+        self.heavy.update(values)
+
+    def merge(self, other: "CategoricalStats") -> None:
+        self.count += other.count
+        self.hll.merge(other.hll)
+        self.heavy.merge(other.heavy)
+
+
+@dataclass
+class StreamingProfile:
+    """
+    표 데이터의 1-pass 스트리밍 프로파일.
+    - update(chunk)로 청크를 순서대로 흡수, merge(other)로 다른 워커 결과를 병합
+    - numeric_columns를 지정하면 해당 컬럼은 청크마다 숫자로 강제 변환(비숫자 값은 missing)
+    - 나머지(비숫자) 컬럼은 HyperLogLog/Misra-Gries 스케치로 고유값 수와 상위 빈도를 추적
+    """
+
+    numeric_columns: Optional[list[str]] = None
+    categorical_columns: Optional[list[str]] = None
+    rows: int = 0
+    numeric: dict[str, NumericStats] = field(default_factory=dict)
+    categorical: dict[str, CategoricalStats] = field(default_factory=dict)
+
+    def update(self, chunk: pd.DataFrame) -> None:
+        self.rows += int(len(chunk))
+        if self.numeric_columns is None:
+            cols = [str(c) for c in chunk.select_dtypes(include="number").columns]
+            self.numeric_columns = cols
+        if self.categorical_columns is None:
+            self.categorical_columns = [str(c) for c in chunk.columns if str(c) not in self.numeric_columns]
+
+        for col in self.numeric_columns:
+            if col not in chunk.columns:
+                continue
+            values = pd.to_numeric(chunk[col], errors="coerce").to_numpy(dtype="float64", na_value=np.nan)
+            self.numeric.setdefault(col, NumericStats()).update(values)
+
+        for col in self.categorical_columns:
+            if col not in chunk.columns:
+                continue
+            self.categorical.setdefault(col, CategoricalStats()).update(chunk[col])
+
+    def merge(self, other: "StreamingProfile") -> None:
+        self.rows += other.rows
+        if self.numeric_columns is None:
+            self.numeric_columns = other.numeric_columns
+        if self.categorical_columns is None:
+            self.categorical_columns = other.categorical_columns
+        for col, st in other.numeric.items():
+            if col in self.numeric:
+                self.numeric[col].merge(st)
+            else:
+                self.numeric[col] = st
+        for col, cst in other.categorical.items():
+            if col in self.categorical:
+                self.categorical[col].merge(cst)
+            else:
+                self.categorical[col] = cst
+
+    def categorical_summary(self, top_k: int = 3) -> dict[str, dict[str, Any]]:
+        """
+        범주형 컬럼별 {"count", "distinct", "top": [(값, 건수, 비율%)]}.
+        distinct는 HyperLogLog 근사, 건수는 Misra-Gries 하한 추정.
+        """
+        out: dict[str, dict[str, Any]] = {}
+        for col in self.categorical_columns or []:
+            cst = self.categorical.get(col)
+            if cst is None or cst.count == 0:
+                continue
+            top = [(v, c, round(c / cst.count * 100.0, 1)) for v, c in cst.heavy.top(top_k)]
+            out[col] = {"count": cst.count, "distinct": cst.hll.estimate(), "top": top}
+        return out
+
+    def describe(self) -> pd.DataFrame:
+        """
+        pandas `describe().T`와 같은 모양의 통계표(index=컬럼).
+        count/mean/std/min/max는 정확값, 분위수(10%~90%)는 근사값.
+        """
+        rows = {}
+        for col in self.numeric_columns or []:
+            st = self.numeric.get(col)
+            if st is None or st.count == 0:
+                continue
+            row = {"count": float(st.count), "mean": st.mean, "std": st.std, "min": st.min}
+            for q in _PROFILE_QUANTILES:
+                row[f"{int(q * 100)}%"] = min(max(st.digest.quantile(q), st.min), st.max)
+            row["max"] = st.max
+            row["missing"] = float(st.missing)
+            rows[col] = row
+        return pd.DataFrame.from_dict(rows, orient="index")
+
+
+# ----------------------------
+# In-memory profile (DataFrame 1회 프로파일, 소비자 공유)
+# ----------------------------
+_DESCRIBE_NUM_ROWS = ("mean", "std", "min", "25%", "50%", "75%", "max")
+_DESCRIBE_CAT_ROWS = ("unique", "top", "freq")
+
+
+@dataclass
+class DataProfile:
+    """
+    DataFrame 1개의 프로파일(통계표/범주 분포/상위 행)을 한 번에 계산해 보관한다.
+    - numeric: StreamingProfile.describe()와 같은 모양(index=컬럼, 10%~90% + missing)
+    - categorical: StreamingProfile.categorical_summary()와 같은 모양 + unique/top_value/freq(describe용)
+    - approximate=True면 전체 파일 스트리밍 통계로 채운 프로파일(분위수/분포는 근사)
+    보고서/프롬프트/규칙 기반 인사이트가 모두 이 객체를 읽으므로 df를 다시 훑지 않는다.
+    """
+
+    rows: int
+    columns: list[str]
+    numeric_columns: list[str]
+    categorical_columns: list[str]
+    numeric: pd.DataFrame
+    categorical: dict[str, dict[str, Any]]
+    head: pd.DataFrame
+    approximate: bool = False
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame, *, head_rows: int = 10, top_k: int = 3) -> "DataProfile":
+        num = df.select_dtypes(include="number")
+        numeric_columns = [str(c) for c in num.columns]
+        categorical_columns = [str(c) for c in df.columns if str(c) not in set(numeric_columns)]
+
+        # 숫자: 컬럼 단위 집계를 한 번씩(분위수는 5개를 한 번에) 벡터 연산
+        if numeric_columns:
+            q = num.quantile(list(_PROFILE_QUANTILES)).T
+            q.columns = [f"{int(x * 100)}%" for x in _PROFILE_QUANTILES]
+            numeric = pd.concat(
+                [
+                    pd.DataFrame({"count": num.count(), "mean": num.mean(), "std": num.std(), "min": num.min()}),
+                    q,
+                    pd.DataFrame({"max": num.max(), "missing": num.isna().sum()}),
+                ],
+                axis=1,
+            ).astype("float64")
+            numeric.index = numeric_columns
+        else:
+            numeric = pd.DataFrame()
+
+        # 범주: 컬럼마다 value_counts(dropna=False) 1회로 distinct/top-k/describe 값을 모두 도출
+        rows = int(len(df))
+        categorical: dict[str, dict[str, Any]] = {}
+        for col in df.columns:
+            if str(col) in set(numeric_columns):
+                continue
+            vc = df[col].value_counts(dropna=False)
+            vc = vc[vc > 0]
+            non_null = vc[vc.index.notna()]
+            categorical[str(col)] = {
+                "count": rows,
+                "distinct": int(len(vc)),
+                "top": [
+                    (str(v), int(c), round(float(c) / rows * 100.0, 1) if rows else 0.0)
+                    for v, c in vc.head(top_k).items()
+                ],
+                "non_null": int(non_null.sum()),
+                "unique": int(len(non_null)),
+                "top_value": non_null.index[0] if len(non_null) else None,
+                "freq": int(non_null.iloc[0]) if len(non_null) else None,
+            }
+
+        return cls(
+            rows=rows,
+            columns=[str(c) for c in df.columns],
+            numeric_columns=numeric_columns,
+            categorical_columns=categorical_columns,
+            numeric=numeric,
+            categorical=categorical,
+            head=df.head(head_rows),
+        )
+
+    def with_full_stats(
+        self,
+        numeric: Optional[pd.DataFrame] = None,
+        categorical: Optional[dict[str, dict[str, Any]]] = None,
+    ) -> "DataProfile":
+        """전체 파일 스트리밍 통계가 있으면 그것으로 대체한 프로파일(표본 head/컬럼 정보는 유지)."""
+        if numeric is None and categorical is None:
+            return self
+        return replace(
+            self,
+            numeric=numeric if numeric is not None else self.numeric,
+            categorical=categorical if categorical is not None else self.categorical,
+            approximate=True,
+        )
+
+    def describe_all(self) -> pd.DataFrame:
+        """`df.describe(include="all")`과 같은 모양의 표(프로파일 값으로 조립, df 재계산 없음)."""
+        index = ["count"]
+        if self.categorical_columns:
+            index += list(_DESCRIBE_CAT_ROWS)
+        if self.numeric_columns:
+            index += list(_DESCRIBE_NUM_ROWS)
+
+        cols: dict[str, list[Any]] = {}
+        for col in self.columns:
+            if col in self.categorical:
+                st = self.categorical[col]
+                values = {"count": st["non_null"], "unique": st["unique"], "top": st["top_value"], "freq": st["freq"]}
+            else:
+                row = self.numeric.loc[col]
+                values = {k: row[k] for k in ("count",) + _DESCRIBE_NUM_ROWS}
+            cols[col] = [values.get(k, np.nan) for k in index]
+        return pd.DataFrame(cols, index=index)
+
+
+# ----------------------------
+# Time series (날짜 컬럼 감지 → 기간별 집계/이동 통계, 크기는 행 수가 아니라 기간 수에 비례)
+# ----------------------------
+_DATE_SAMPLE_ROWS = 200
+_DATE_MIN_PARSE_RATIO = 0.9
+_DATE_FORMATS = (
+    "%Y-%m-%d %H:%M:%S",
+    "%Y-%m-%dT%H:%M:%S",
+    "%Y-%m-%d %H:%M",
+    "%Y-%m-%d",
+    "%Y/%m/%d %H:%M:%S",
+    "%Y/%m/%d %H:%M",
+    "%Y/%m/%d",
+    "%Y.%m.%d %H:%M:%S",
+    "%Y.%m.%d",
+    "%Y%m%d",
+    "%d/%m/%Y %H:%M:%S",
+    "%m/%d/%Y %H:%M:%S",
+    "%d/%m/%Y",
+    "%m/%d/%Y",
+    "%Y-%m",
+)
+# 형식 후보 판별용 기준 시각(각 필드가 2자리가 되도록) / 값의 "모양"(숫자 → 9)
+_SIGNATURE_PROBE = datetime(2001, 11, 12, 13, 14, 15)
+_DIGIT_RE = re.compile(r"\d")
+
+# (resample 규칙, 라벨, 이동 통계 창 크기, 기간 1개의 대략적 일수)
+_TS_FREQS = (("D", "daily", 7, 1), ("W", "weekly", 4, 7), ("MS", "monthly", 3, 30))
+_TS_MAX_PERIODS = 400  # 차트/이동 통계 기준 주기의 기간 수 상한
+_TS_MAX_RESAMPLE_PERIODS = 100_000  # 이보다 기간이 많아지는 주기는 집계하지 않음(비정상 날짜 범위 방어)
+
+
+@functools.lru_cache(maxsize=256)
+def _format_candidates(signature: str) -> tuple[str, ...]:
+    # 값의 모양(예: "9999-99-99 99:99:99")과 같은 모양을 만드는 형식만 후보로(모양별 1회 계산 후 캐시)
+    matched = tuple(f for f in _DATE_FORMATS if _DIGIT_RE.sub("9", _SIGNATURE_PROBE.strftime(f)) == signature)
+    return matched or _DATE_FORMATS + ("ISO8601",)
+
+
+def _parse_dates(values: pd.Series, fmt: str) -> pd.Series:
+    if fmt == "datetime64":
+        out = values
+    else:
+        try:
+            out = pd.to_datetime(values, format=fmt, errors="coerce")
+        except (ValueError, TypeError):
+            return pd.Series(pd.NaT, index=values.index, dtype="datetime64[ns]")
+    if getattr(out.dt, "tz", None) is not None:
+        out = out.dt.tz_convert(None)
+    return out
+
+
+def detect_datetime_columns(df: pd.DataFrame, *, sample_rows: int = _DATE_SAMPLE_ROWS) -> dict[str, str]:
+    """
+    날짜/시간 컬럼 감지: {컬럼: 형식}(datetime dtype 컬럼은 "datetime64").
+    - 문자열 컬럼은 표본 sample_rows개만 파싱해 판별(전체 행을 훑지 않음)
+    - 표본 첫 값의 모양으로 형식 후보를 좁히고(캐시), 표본 파싱 성공률이 90% 이상인 첫 형식으로 확정
+    """
+    found: dict[str, str] = {}
+    for col in df.columns:
+        s = df[col]
+        if s.dtype.kind == "M":
+            found[str(col)] = "datetime64"
+            continue
+        if not (s.dtype == object or isinstance(s.dtype, pd.CategoricalDtype) or pd.api.types.is_string_dtype(s.dtype)):
+            continue
+        sample = s.head(sample_rows * 4).dropna().head(sample_rows).astype(str).str.strip()
+        if sample.empty:
+            continue
+        signature = _DIGIT_RE.sub("9", sample.iloc[0])
+        if "9" not in signature:
+            continue
+        for fmt in _format_candidates(signature):
+            if _parse_dates(sample, fmt).notna().mean() >= _DATE_MIN_PARSE_RATIO:
+                found[str(col)] = fmt
+                break
+    return found
+
+
+@dataclass
+class TimeSeriesProfile:
+    """
+    날짜 컬럼 기준 시계열 요약(기간 수에 비례하는 크기, 행 수와 무관).
+    - resampled: {"daily"|"weekly"|"monthly": 기간별 평균(index=기간 시작) + "rows"(기간별 행 수)}
+    - primary: 차트/이동 통계 기준 주기(기간 수가 max_periods 이하인 가장 촘촘한 주기)
+    - rolling: primary 주기 평균의 이동 평균/표준편차(컬럼 "{col}_mean", "{col}_std")
+    """
+
+    time_column: str
+    time_format: str
+    start: pd.Timestamp
+    end: pd.Timestamp
+    numeric_columns: list[str]
+    resampled: dict[str, pd.DataFrame]
+    primary: str
+    window: int
+    rolling: pd.DataFrame
+
+    def trend(self) -> pd.DataFrame:
+        """컬럼별 추세 요약(primary 주기): 처음/마지막 이동 평균, 변화율(%), 최고 기간과 값."""
+        base = self.resampled[self.primary]
+        rows: dict[str, dict[str, Any]] = {}
+        for col in self.numeric_columns:
+            rm = self.rolling[f"{col}_mean"].dropna()
+            per = base[col].dropna()
+            if rm.empty or per.empty:
+                continue
+            first, last = float(rm.iloc[0]), float(rm.iloc[-1])
+            rows[col] = {
+                "first": first,
+                "last": last,
+                "change_pct": (last - first) / abs(first) * 100.0 if first else np.nan,
+                "peak_period": per.idxmax().strftime("%Y-%m-%d"),
+                "peak": float(per.max()),
+            }
+        return pd.DataFrame.from_dict(rows, orient="index")
+
+
+def time_series_profile(
+    df: pd.DataFrame,
+    *,
+    time_column: Optional[str] = None,
+    max_periods: int = _TS_MAX_PERIODS,
+) -> Optional[TimeSeriesProfile]:
+    """
+    날짜 컬럼이 있으면 일/주/월 단위 평균(resample)과 이동 평균/표준편차(rolling)를 벡터 연산으로 계산한다.
+    - time_column 미지정 시 detect_datetime_columns()의 첫 컬럼 사용
+    - 날짜 컬럼이 없거나 유효한 시각이 2개 미만(또는 모두 같은 시각)이면 None
+    """
+    formats = detect_datetime_columns(df)
+    if not formats:
+        return None
+    col = time_column if time_column in formats else next(iter(formats))
+    fmt = formats[col]
+    src = df[col]
+    ts = _parse_dates(src if fmt == "datetime64" else src.astype(str).str.strip(), fmt)
+
+    mask = ts.notna().to_numpy()
+    if int(mask.sum()) < 2:
+        return None
+    num = df.select_dtypes(include="number")
+    num = num.drop(columns=[c for c in num.columns if str(c) == col])
+    frame = num.loc[mask].astype("float64")
+    frame.columns = [str(c) for c in frame.columns]
+    frame.index = pd.DatetimeIndex(ts[mask].to_numpy())
+    frame = frame.sort_index()
+    start, end = frame.index[0], frame.index[-1]
+    if start == end:
+        return None
+
+    span_days = max(1.0, (end - start) / pd.Timedelta(days=1))
+    resampled: dict[str, pd.DataFrame] = {}
+    windows: dict[str, int] = {}
+    for rule, label, window, days in _TS_FREQS:
+        if span_days / days > _TS_MAX_RESAMPLE_PERIODS:
+            continue
+        r = frame.resample(rule)
+        agg = r.mean()
+        agg.insert(0, "rows", r.size())
+        resampled[label] = agg
+        windows[label] = window
+    if not resampled:
+        return None
+
+    labels = list(resampled)
+    primary = next((lb for lb in labels if 2 <= len(resampled[lb]) <= max_periods), labels[-1])
+    window = windows[primary]
+    base = resampled[primary][list(frame.columns)]
+    roll = base.rolling(window, min_periods=1)
+    rolling = pd.concat([roll.mean().add_suffix("_mean"), roll.std().add_suffix("_std")], axis=1)
+
+    return TimeSeriesProfile(
+        time_column=col,
+        time_format=fmt,
+        start=start,
+        end=end,
+        numeric_columns=list(frame.columns),
+        resampled=resampled,
+        primary=primary,
+        window=window,
+        rolling=rolling,
+    )
+
+
+# ----------------------------
+# Cross analysis (저카디널리티 차원 × 고변동 지표 그룹 집계, 데이터 fingerprint별 메모이즈)
+# ----------------------------
+_CROSS_MAX_DIMS = 3
+_CROSS_MAX_LEVELS = 20
+_CROSS_MAX_METRICS = 2
+_CROSS_CACHE_SIZE = 32
+_cross_cache: "OrderedDict[str, CrossAnalysis]" = OrderedDict()
+_cross_lock = threading.Lock()
+
+
+@dataclass
+class CrossAnalysis:
+    """
+    교차 분석 결과(피벗).
+    - dimensions: 그룹 기준 범주 컬럼(고유값 2~max_levels개), metrics: 변동폭(max - min)이 큰 숫자 컬럼
+    - tail_metric의 하위 low / 상위 high(10%/90%) 임계값 기준으로 그룹별 꼬리 구간 비중을 계산
+    - marginals: {차원: index=값, rows/share/{metric}_mean/low_share/high_share/high_lift}
+    - pivot: 앞의 두 차원 × tail_metric 평균(차원이 1개면 None)
+    """
+
+    fingerprint: str
+    dimensions: list[str]
+    metrics: list[str]
+    tail_metric: str
+    low: float
+    high: float
+    rows: int
+    high_share: float
+    marginals: dict[str, pd.DataFrame]
+    pivot: Optional[pd.DataFrame]
+
+    def top_groups(self, n: int = 3) -> list[tuple[str, str, float, float]]:
+        """상위 10% 비중이 전체보다 큰 그룹(차원, 값, high_share, high_lift) — lift 내림차순."""
+        found = []
+        for dim, m in self.marginals.items():
+            for level, row in m[m["high_lift"] > 1.0].iterrows():
+                found.append((dim, str(level), float(row["high_share"]), float(row["high_lift"])))
+        return sorted(found, key=lambda x: x[3], reverse=True)[:n]
+
+
+def _cross_dimensions(profile: DataProfile, *, exclude: tuple[str, ...], max_dims: int, max_levels: int) -> list[str]:
+    dims = []
+    for col, st in profile.categorical.items():
+        n = int(st.get("count", 0))
+        distinct = int(st.get("distinct", 0))
+        if col in exclude or not n or not (2 <= distinct <= max_levels):
+            continue
+        if distinct / n <= CATEGORY_MAX_UNIQ_RATIO:
+            dims.append(col)
+    return dims[:max_dims]
+
+
+def _cross_metrics(profile: DataProfile, *, max_metrics: int) -> list[str]:
+    if profile.numeric.empty:
+        return []
+    # 변동폭(max - min) 내림차순: rule_based_insights가 상/하위 10% 점검을 권하는 지표와 같은 기준
+    num = profile.numeric
+    spread = (num["max"] - num["min"])[num["std"] > 0].sort_values(ascending=False)
+    return [str(c) for c in spread.index[:max_metrics]]
+
+
+def cross_analysis(
+    df: pd.DataFrame,
+    profile: DataProfile,
+    *,
+    exclude: tuple[str, ...] = (),
+    max_dims: int = _CROSS_MAX_DIMS,
+    max_levels: int = _CROSS_MAX_LEVELS,
+    max_metrics: int = _CROSS_MAX_METRICS,
+    source_key: Optional[str] = None,
+) -> Optional[CrossAnalysis]:
+    """
+    프로파일로 차원/지표를 고르고, 다중 키 groupby 1회로 그룹별 합계를 구한 뒤 차원별 집계/피벗은 그 결과에서 도출한다.
+    - 꼬리 구간 임계값은 profile.numeric의 10%/90%(전체 파일 통계가 있으면 그것)
+    - 같은 데이터+같은 선택이면 메모리 캐시에서 즉시 반환
+    - source_key: df를 식별하는 키(파싱 캐시 key = 파일 fingerprint+로드 옵션). 주어지면 값 해시(groupby와
+      비슷한 비용)를 건너뛰고 이 키로 메모, 없으면 df[dims+metrics] 값 해시
+    - 차원 또는 지표가 없으면 None
+    """
+    dims = _cross_dimensions(profile, exclude=exclude, max_dims=max_dims, max_levels=max_levels)
+    metrics = _cross_metrics(profile, max_metrics=max_metrics)
+    dims = [d for d in dims if d in df.columns]
+    metrics = [m for m in metrics if m in df.columns]
+    if not dims or not metrics:
+        return None
+
+    tail = metrics[0]
+    low, high = float(profile.numeric.loc[tail, "10%"]), float(profile.numeric.loc[tail, "90%"])
+
+    h = hashlib.blake2b(digest_size=16)
+    h.update(repr((dims, metrics, low, high)).encode("utf-8"))
+    if source_key:
+        h.update(f"src:{source_key}".encode("utf-8"))
+    else:
+        h.update(pd.util.hash_pandas_object(df[dims + metrics], index=False).to_numpy().tobytes())
+    key = h.hexdigest()
+    with _cross_lock:
+        hit = _cross_cache.get(key)
+        if hit is not None:
+            _cross_cache.move_to_end(key)
+            return hit
+
+    # 합산 가능한 열만 만들어 두면 groupby(...).sum() 한 번으로 모든 그룹 통계가 나옴
+    work = pd.DataFrame({"rows": np.ones(len(df), dtype="int64")}, index=df.index)
+    for m in metrics:
+        values = pd.to_numeric(df[m], errors="coerce").astype("float64")
+        work[f"{m}__sum"] = values.fillna(0.0)
+        work[f"{m}__n"] = values.notna().astype("int64")
+    tv = pd.to_numeric(df[tail], errors="coerce")
+    work["low"] = (tv <= low).astype("int64")
+    work["high"] = (tv >= high).astype("int64")
+    keys = [df[d].astype("object").where(df[d].notna(), "(missing)").rename(d) for d in dims]
+    grouped = work.groupby(keys, sort=False).sum()
+
+    rows = int(len(df))
+    overall_high = float(work["high"].sum()) / rows * 100.0 if rows else 0.0
+
+    def _finish(g: pd.DataFrame) -> pd.DataFrame:
+        out = pd.DataFrame({"rows": g["rows"], "share": g["rows"] / rows * 100.0})
+        for m in metrics:
+            out[f"{m}_mean"] = g[f"{m}__sum"] / g[f"{m}__n"].replace(0, np.nan)
+        out["low_share"] = g["low"] / g["rows"] * 100.0
+        out["high_share"] = g["high"] / g["rows"] * 100.0
+        out["high_lift"] = out["high_share"] / overall_high if overall_high else np.nan
+        return out
+
+    marginals: dict[str, pd.DataFrame] = {}
+    for d in dims:
+        g = grouped.groupby(level=d, sort=False).sum() if len(dims) > 1 else grouped
+        marginals[d] = _finish(g).sort_values("rows", ascending=False)
+
+    pivot = None
+    if len(dims) >= 2:
+        g2 = grouped.groupby(level=[dims[0], dims[1]], sort=False).sum()
+        pivot = (g2[f"{tail}__sum"] / g2[f"{tail}__n"].replace(0, np.nan)).unstack(dims[1])
+
+    result = CrossAnalysis(
+        fingerprint=key,
+        dimensions=dims,
+        metrics=metrics,
+        tail_metric=tail,
+        low=low,
+        high=high,
+        rows=rows,
+        high_share=overall_high,
+        marginals=marginals,
+        pivot=pivot,
+    )
+    with _cross_lock:
+        _cross_cache[key] = result
+        while len(_cross_cache) > _CROSS_CACHE_SIZE:
+            _cross_cache.popitem(last=False)
+    return result
+
+
+class _RangeReader(io.RawIOBase):
+    """파일의 [start, end) 바이트 구간만 읽히는 raw 스트림(TextIOWrapper로 감싸 pd.read_csv 입력용)."""
+
+    def __init__(self, f, start: int, end: int):
+        self._f = f
+        self._f.seek(start)
+        self._left = end - start
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, b) -> int:
+        if self._left <= 0:
+            return 0
+        data = self._f.read(min(len(b), self._left))
+        n = len(data)
+        b[:n] = data
+        self._left -= n
+        return n
+
+
+def _split_ranges(path: Path, n: int, data_start: int) -> list[tuple[int, int]]:
+    # 데이터 영역을 n등분하고 각 경계를 다음 개행 직후로 맞춘다
+    size = path.stat().st_size
+    bounds = [data_start]
+    with path.open("rb") as f:
+        for i in range(1, n):
+            f.seek(max(data_start, data_start + (size - data_start) * i // n))
+            f.readline()
+            bounds.append(max(bounds[-1], f.tell()))
+    bounds.append(size)
+    return [(a, b) for a, b in zip(bounds, bounds[1:]) if b > a]
+
+
+def _profile_csv_range(
+    path: str,
+    start: int,
+    end: int,
+    columns: list[str],
+    numeric_columns: list[str],
+    chunksize: int,
+    encoding: Optional[str] = None,
+) -> StreamingProfile:
+    prof = StreamingProfile(
+        numeric_columns=list(numeric_columns),
+        categorical_columns=[c for c in columns if c not in numeric_columns],
+    )
+    # 구간 경계는 개행 직후이므로 구간마다 독립적으로 디코딩 가능(cp949 등 ASCII 호환 인코딩)
+    with open(path, "rb") as f:
+        text = io.TextIOWrapper(io.BufferedReader(_RangeReader(f, start, end)), encoding=encoding or "utf-8", newline="")
+        reader = pd.read_csv(text, header=None, names=columns, chunksize=chunksize)
+        for chunk in reader:
+            prof.update(chunk)
+    return prof
+
+
+def profile_csv(
+    path: str,
+    *,
+    chunksize: int = _PROFILE_CHUNK_ROWS,
+    workers: int = 1,
+    encoding: Optional[str] = None,
+) -> StreamingProfile:
+    """
+    CSV 전체를 청크 단위로 1회 읽어 StreamingProfile을 만든다(메모리 = 청크 크기).
+    - 숫자/범주형 컬럼 구분은 앞부분 샘플로 결정해 모든 청크/워커에 동일하게 적용
+    - workers>1이면 파일을 개행 경계 바이트 구간으로 나눠 프로세스(spawn) 병렬 처리 후 merge
+      (따옴표 안 개행이 있는 CSV는 구간 경계가 어긋날 수 있으므로 workers=1 권장)
+    - 압축 파일(.gz/.bz2/.zip)과 ASCII 비호환 인코딩(UTF-16 등)은 구간 분할이 불가하므로
+      workers와 무관하게 단일 스트림으로 처리
+    """
+    p = Path(path)
+    with open_stream(p) as f:
+        head = pd.read_csv(f, nrows=1000, encoding=encoding)
+    columns = [str(c) for c in head.columns]
+    numeric_columns = [str(c) for c in head.select_dtypes(include="number").columns]
+
+    categorical_columns = [c for c in columns if c not in numeric_columns]
+
+    splittable = detect_compression(p) is None and (not encoding or is_ascii_compatible(encoding))
+    if workers <= 1 or not splittable:
+        prof = StreamingProfile(numeric_columns=numeric_columns, categorical_columns=categorical_columns)
+        with open_stream(p) as f:
+            for chunk in pd.read_csv(f, chunksize=chunksize, encoding=encoding):
+                prof.update(chunk)
+        return prof
+
+    with p.open("rb") as f:
+        f.readline()
+        data_start = f.tell()
+
+    ranges = _split_ranges(p, workers, data_start)
+    prof = StreamingProfile(numeric_columns=numeric_columns, categorical_columns=categorical_columns)
+    with _process_pool(workers) as ex:
+        futures = [
+            ex.submit(_profile_csv_range, str(p), a, b, columns, numeric_columns, chunksize, encoding)
+            for a, b in ranges
+        ]
+        for fut in futures:
+            prof.merge(fut.result())
+    return prof
+
+
+async def aprofile_csv(path: str, **kwargs: Any) -> StreamingProfile:
+    """
+    profile_csv()의 비동기 버전.
+    - 로더와 같은 공유 스레드 풀에서 실행(전체 파일 패스도 로더 동시 실행 상한을 따름)
+    - workers>1의 프로세스 풀은 spawn(스레드에서 fork하지 않음)
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_get_loader_executor(), functools.partial(profile_csv, path, **kwargs))
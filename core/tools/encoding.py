@@ -0,0 +1,63 @@
+# core/tools/encoding.py
+from __future__ import annotations
+
+import codecs
+from pathlib import Path
+
+from core.tools.compression import open_stream
+
+
+# 인코딩 판별에 사용하는 앞부분 바이트 수(파일 전체를 읽지 않음)
+_SNIFF_BYTES = 256 * 1024
+
+# 판별 순서: BOM(UTF-8/UTF-16) → UTF-8 유효성 → CP949(EUC-KR 상위 호환) → latin-1(항상 성공)
+_FALLBACK_ENCODING = "latin-1"
+
+
+def _decodes(sample: bytes, codec: str, *, final: bool) -> bool:
+    # 증분 디코더: 샘플 끝에서 잘린 멀티바이트 문자는 오류로 보지 않음(final=False)
+    try:
+        codecs.getincrementaldecoder(codec)().decode(sample, final=final)
+        return True
+    except UnicodeDecodeError:
+        return False
+
+
+def sniff_encoding(sample: bytes, *, final: bool = False) -> str:
+    """
+    바이트 샘플로 텍스트 인코딩을 추정한다.
+    - final: 샘플이 파일 전체인지 여부(False면 끝에서 잘린 문자를 허용)
+    반환: "utf-8-sig" | "utf-16" | "utf-8" | "cp949" | "latin-1"
+    - UTF-16 LE/BE BOM(Excel "유니코드 텍스트" 내보내기)은 "utf-16"(디코더가 BOM으로 바이트 순서 결정)
+    """
+    if sample.startswith(codecs.BOM_UTF8):
+        return "utf-8-sig"
+    if sample.startswith((codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE)):
+        return "utf-16"
+    if sample.isascii() or _decodes(sample, "utf-8", final=final):
+        return "utf-8"
+    if _decodes(sample, "cp949", final=final):
+        return "cp949"
+    return _FALLBACK_ENCODING
+
+
+def is_ascii_compatible(encoding: str) -> bool:
+    """
+    ASCII 바이트(개행/구분자 등)가 그대로 1바이트로 인코딩되는지 여부.
+    - False(UTF-16 등)면 바이트 단위 개행 탐색(tail seek/mmap 스캔/구간 분할)을 쓸 수 없음
+    """
+    try:
+        return b"a,\n".decode(encoding) == "a,\n"
+    except (LookupError, UnicodeDecodeError):
+        return False
+
+
+def detect_encoding(path: str | Path, *, sample_bytes: int = _SNIFF_BYTES) -> str:
+    """
+    파일 앞부분(sample_bytes)만 읽어 인코딩을 추정한다(압축 파일은 해제된 앞부분 기준).
+    - 한국어 Windows에서 내보낸 CSV(CP949/EUC-KR)도 파서 재시도 없이 한 번에 읽도록 사용
+    """
+    with open_stream(path) as f:
+        sample = f.read(sample_bytes + 1)
+    final = len(sample) <= sample_bytes
+    return sniff_encoding(sample[:sample_bytes], final=final)
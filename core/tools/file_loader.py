@@ -1,144 +1,1107 @@
 # core/tools/file_loader.py
 from __future__ import annotations
 
+import asyncio
+import functools
+import importlib
+import io
+import mmap
+import multiprocessing
+import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
+from types import ModuleType
+from typing import TYPE_CHECKING, Any, Callable, Iterator, Optional
 
-import pandas as pd
+from core.tools.base import ToolResult
+from core.tools.compression import detect_compression, inner_name, open_stream
+from core.tools.encoding import detect_encoding, is_ascii_compatible
+from core.tools.fingerprint import file_fingerprint
 
-try:
-    import pdfplumber
-except Exception:  # pragma: no cover
-    pdfplumber = None
+if TYPE_CHECKING:  # pragma: no cover
+    import pandas as pd
 
-from core.tools.base import ToolResult
+    from core.tools.parse_cache import ParseCache
+
+# NOTE: pandas/numpy/pdfplumber/pyarrow 등 무거운 의존성은 각 로더가 처음 쓰일 때 import 한다.
+#       (로그만 다루는 워커 프로세스는 이 모듈을 import 해도 pandas를 로드하지 않음)
+#       (파싱 캐시 모듈(pyarrow.parquet)은 cache_dir가 주어졌을 때만 import)
+
+_COUNT_BLOCK_BYTES = 1 << 20  # 1 MiB
+
+# 행 수 카운트에서 제외하는 빈 줄(공백 문자만 있는 줄)
+_BLANK_LINE_RE = re.compile(rb"^[ \t\r\f\v]*\n", re.MULTILINE)
+
+# 압축 스트림 스캔에서 개행 없이 이어지는 라인을 강제로 끊는 길이(메모리 상한)
+_SCAN_MAX_CARRY_BYTES = 8 << 20  # 8 MiB
+
+# 샘플링 모드에서 CSV를 읽는 청크 크기(행). 메모리는 max_rows + 청크 크기로 제한
+_SAMPLE_CHUNK_ROWS = 100_000
+_SAMPLE_MODES = {"head", "reservoir", "stratified"}
 
+# 프로세스 풀(PDF 페이지/엑셀 시트 병렬 파싱)은 파일이 이 크기 이상이고,
+# PDF는 이 페이지 수 이상일 때만 사용(작은 파일은 프로세스 기동 비용이 파싱보다 큼)
+_PARALLEL_MIN_FILE_BYTES = 4 << 20  # 4 MiB
+_PDF_PARALLEL_MIN_PAGES = 8
 
-def _read_tail_text(p: Path, *, max_chars: int = 20000) -> tuple[str, bool]:
+# aload_file 등 비동기 래퍼가 공유하는 로더 스레드 수(동시 파싱 상한)
+_LOADER_MAX_WORKERS = 4
+_loader_executor: Optional[ThreadPoolExecutor] = None
+
+# 전체 로그 스캔 기본 키워드(LogCop 규칙 기반 분석과 동일 계열)
+LOG_SCAN_KEYWORDS = ["exception", "error", "stacktrace", "traceback", "caused by", "timeout", "pkix", "ssl", "connection"]
+
+
+@functools.lru_cache(maxsize=None)
+def _optional_module(name: str) -> Optional[ModuleType]:
+    """선택 의존성을 첫 사용 시점에 import (없으면 None)."""
+    try:
+        return importlib.import_module(name)
+    except Exception:  # pragma: no cover
+        return None
+
+
+def _read_tail_text(p: Path, *, max_chars: int = 20000, encoding: str = "utf-8") -> tuple[str, bool, dict]:
     """
     텍스트 파일(.log/.txt/.out)을 tail 방식으로 읽는다.
-    반환: (text, truncated)
+    - 파일 끝에서 역방향 seek하여 마지막 max_chars*4 바이트(UTF-8 최대 폭)만 읽음
+    - 잘린 앞부분의 UTF-8 continuation 바이트는 버려 문자 경계에서 디코딩
+      (CP949 등은 바이트만으로 문자 경계를 알 수 없으므로 첫 개행 이후부터 디코딩)
+    - 압축 파일(.gz/.bz2/.zip)은 seek이 불가하므로 끝까지 스트리밍 해제하며 마지막 window 바이트만 유지
+    반환: (text, truncated, stats)
+    - stats: file_size(bytes, 압축이면 해제 후 크기), lines_estimate(tail 구간의 줄 밀도로 외삽한 전체 줄 수)
     """
-    data = p.read_text(encoding="utf-8", errors="replace")
-    if len(data) <= max_chars:
-        return data, False
-    return data[-max_chars:], True
+    window = max(0, max_chars) * 4
+    if detect_compression(p) is not None:
+        raw, file_size, newlines_total = _read_tail_stream(p, window=window)
+        start = file_size - len(raw)
+    else:
+        newlines_total = None
+        file_size = p.stat().st_size
+        window = min(file_size, window)
+        start = file_size - window
 
+        with p.open("rb") as f:
+            f.seek(start)
+            raw = f.read(window)
 
-def load_file(
+    codec = encoding
+    if start > 0:
+        if encoding.startswith("utf-8"):
+            # 멀티바이트 문자 중간에서 잘렸으면 다음 문자 시작 바이트까지 건너뛴다
+            i = 0
+            while i < len(raw) and i < 3 and (raw[i] & 0xC0) == 0x80:
+                i += 1
+            raw = raw[i:]
+            codec = "utf-8"  # BOM은 파일 맨 앞에만 있음
+        else:
+            raw = raw[raw.find(b"\n") + 1 :]
+
+    data = raw.decode(codec, errors="replace")
+    truncated = start > 0 or len(data) > max_chars
+    if len(data) > max_chars:
+        data = data[-max_chars:]
+
+    newlines = raw.count(b"\n") if newlines_total is None else newlines_total
+    if start == 0 or newlines_total is not None:
+        # 전체를 훑었으면(파일이 작거나 압축 스트림) 정확한 줄 수
+        lines_estimate = newlines + (1 if raw and not raw.endswith(b"\n") else 0)
+    else:
+        lines_estimate = int(round(newlines * (file_size / max(1, len(raw)))))
+
+    stats = {"file_size": int(file_size), "lines_estimate": int(lines_estimate)}
+    return data, truncated, stats
+
+
+def _read_tail_stream(p: Path, *, window: int) -> tuple[bytes, int, int]:
+    """
+    압축 스트림을 블록 단위로 끝까지 해제하며 마지막 window 바이트만 유지한다(메모리 = window + 블록).
+    반환: (tail bytes, 해제 후 전체 크기, 전체 개행 수)
+    """
+    tail = b""
+    total = 0
+    newlines = 0
+    with open_stream(p) as f:
+        while True:
+            block = f.read(_COUNT_BLOCK_BYTES)
+            if not block:
+                break
+            total += len(block)
+            newlines += block.count(b"\n")
+            tail = (tail + block)[-window:] if window > 0 else b""
+    return tail, total, newlines
+
+
+def _scan_buffer(
+    buf: Any,
+    base: int,
+    pattern: re.Pattern,
+    kws: list[str],
+    counts: dict[str, int],
+    matches: list[dict],
+    *,
+    max_matches: int,
+    max_line_chars: int,
+    encoding: str = "utf-8",
+) -> int:
+    """
+    buf(bytes/mmap)에서 키워드가 포함된 라인을 찾아 counts/matches를 갱신한다.
+    - base: buf 시작의 파일 내 byte offset
+    반환: 매칭 라인 수
+    """
+    size = len(buf)
+    lines_matched = 0
+    pos = 0
+    while True:
+        m = pattern.search(buf, pos)
+        if m is None:
+            break
+        line_start = buf.rfind(b"\n", 0, m.start()) + 1
+        line_end = buf.find(b"\n", m.end())
+        if line_end < 0:
+            line_end = size
+
+        line = buf[line_start:line_end]
+        lowered = line.lower()
+        for k in kws:
+            if k.encode("utf-8") in lowered:
+                counts[k] += 1
+        lines_matched += 1
+
+        if len(matches) < max_matches:
+            text = line.decode(encoding, errors="replace").rstrip("\r")
+            matches.append({"offset": int(base + line_start), "line": text[:max_line_chars]})
+
+        pos = line_end + 1
+    return lines_matched
+
+
+def scan_log_file(
     path: str,
     *,
-    max_rows: int = 5000,
-    pdf_max_pages: int = 1,
-    text_max_chars: int = 20000,
+    keywords: list[str] | None = None,
+    max_matches: int = 200,
+    max_line_chars: int = 500,
+    encoding: Optional[str] = None,
 ) -> ToolResult:
     """
-    범용 파일 로더 (Phase2-1 표준 Tool).
-    - CSV/XLSX/PDF + TEXT(.log/.txt/.out) 지원
-    - 반환은 ToolResult로 통일
+    로그 파일 전체를 mmap으로 스캔하여 키워드가 포함된 라인과 byte offset을 수집한다.
+    - encoding=None이면 앞부분 샘플로 판별(UTF-8/CP949 등 ASCII 호환 인코딩 전제, UTF-16 등은 unsupported_encoding)
+    - 파일 전체를 Python str로 만들지 않음(bytes 정규식이 mmap 버퍼를 직접 탐색)
+    - 매칭된 라인만 잘라서 디코딩하므로 RSS는 파일 크기와 무관
+    - keyword_counts는 max_matches와 무관하게 파일 전체 기준(라인 단위)으로 집계
+    - 압축 파일은 mmap 대신 블록 단위 스트리밍 해제로 스캔(offset은 해제 후 기준)
     """
     p = Path(path)
     if not p.exists():
         return ToolResult(ok=False, summary="file not found", error="file_not_found", last_error=str(p))
 
-    ext = p.suffix.lower()
+    encoding = encoding or detect_encoding(p)
+    if not is_ascii_compatible(encoding):
+        return _unsupported_encoding(encoding)
+
+    kws = [k.lower() for k in (keywords or LOG_SCAN_KEYWORDS) if k]
+    counts = {k: 0 for k in kws}
+    matches: list[dict] = []
+    lines_matched = 0
 
     try:
-        # 0) TEXT (log/txt/out)
-        if ext in {".log", ".txt", ".out"}:
-            text, truncated = _read_tail_text(p, max_chars=text_max_chars)
-            return ToolResult(
-                ok=True,
-                summary=f"loaded text: chars={len(text)} truncated={truncated}",
-                data={
-                    "kind": "text",
-                    "path": str(p),
-                    "ext": ext,
-                    "text": text,
-                    "text_truncated": truncated,
-                    "text_max_chars": int(text_max_chars),
-                },
-            )
+        pattern = re.compile(b"|".join(re.escape(k.encode("utf-8")) for k in kws), re.IGNORECASE) if kws else None
+        scan = functools.partial(
+            _scan_buffer,
+            kws=kws,
+            counts=counts,
+            matches=matches,
+            max_matches=max_matches,
+            max_line_chars=max_line_chars,
+            encoding=encoding,
+        )
 
-        # 1) CSV
-        if ext == ".csv":
-            df_full = pd.read_csv(p)
-            truncated = len(df_full) > max_rows
-            df = df_full.head(max_rows) if truncated else df_full
-
-            return ToolResult(
-                ok=True,
-                summary=f"loaded csv: shape={df.shape[0]}x{df.shape[1]} truncated={truncated}",
-                data={
-                    "kind": "csv",
-                    "path": str(p),
-                    "columns": [str(c) for c in df.columns.tolist()],
-                    "shape": [int(df.shape[0]), int(df.shape[1])],
-                    "preview_csv": df.head(10).to_csv(index=False),
-                    "max_rows": int(max_rows),
-                    "truncated": truncated,
-                    "rows_total": int(len(df_full)),
-                    # ✅ Agent가 직접 파일을 다시 읽지 않도록 df 제공
-                    "df": df,
-                },
-            )
+        if detect_compression(p) is not None:
+            # 완결된 라인까지만 스캔하고 나머지는 다음 블록과 이어 붙인다
+            file_size = 0
+            carry = b""
+            with open_stream(p) as f:
+                while True:
+                    block = f.read(_COUNT_BLOCK_BYTES)
+                    buf = carry + block
+                    cut = len(buf) if not block or len(buf) >= _SCAN_MAX_CARRY_BYTES else buf.rfind(b"\n") + 1
+                    if pattern is not None and cut > 0:
+                        lines_matched += scan(buf[:cut], file_size, pattern)
+                    file_size += cut
+                    carry = buf[cut:]
+                    if not block:
+                        break
+        else:
+            file_size = p.stat().st_size
+            if file_size > 0 and pattern is not None:
+                with p.open("rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    lines_matched = scan(mm, 0, pattern)
 
-        # 2) Excel
-        if ext in {".xlsx", ".xls"}:
-            df_full = pd.read_excel(p)
-            truncated = len(df_full) > max_rows
-            df = df_full.head(max_rows) if truncated else df_full
-
-            return ToolResult(
-                ok=True,
-                summary=f"loaded excel: shape={df.shape[0]}x{df.shape[1]} truncated={truncated}",
-                data={
-                    "kind": "excel",
-                    "path": str(p),
-                    "columns": [str(c) for c in df.columns.tolist()],
-                    "shape": [int(df.shape[0]), int(df.shape[1])],
-                    "preview_csv": df.head(10).to_csv(index=False),
-                    "max_rows": int(max_rows),
-                    "truncated": truncated,
-                    "rows_total": int(len(df_full)),
-                    # ✅ Agent가 직접 파일을 다시 읽지 않도록 df 제공
-                    "df": df,
-                },
-            )
+        return ToolResult(
+            ok=True,
+            summary=f"scanned log: bytes={file_size} lines_matched={lines_matched}",
+            data={
+                "kind": "log_scan",
+                "path": str(p),
+                "file_size": int(file_size),
+                "keywords": kws,
+                "keyword_counts": counts,
+                "lines_matched": int(lines_matched),
+                "matches": matches,
+                "matches_truncated": lines_matched > len(matches),
+            },
+        )
+    except Exception as e:
+        return ToolResult(
+            ok=False,
+            summary="log scan failed",
+            error="scan_failed",
+            last_error=f"{type(e).__name__}: {e}",
+        )
+
+
+def _extract_pdf_pages(path: str, page_indices: list[int]) -> list[tuple[int, str, float]]:
+    """
+    PDF의 지정 페이지(0-based)를 추출한다. 프로세스 풀 워커에서도 호출되므로 모듈 최상위 함수로 둔다.
+    반환: [(page_index, text, elapsed_sec), ...]
+    """
+    import pdfplumber
+
+    out: list[tuple[int, str, float]] = []
+    with pdfplumber.open(path) as pdf:
+        for i in page_indices:
+            t0 = time.perf_counter()
+            text = (pdf.pages[i].extract_text() or "").strip()
+            out.append((i, text, round(time.perf_counter() - t0, 4)))
+    return out
+
+
+def _process_pool(n_workers: int) -> ProcessPoolExecutor:
+    # 로더 스레드 풀 안에서 호출되므로 fork 대신 spawn(스레드가 있는 프로세스의 fork는 락 상태까지 복제됨)
+    return ProcessPoolExecutor(max_workers=n_workers, mp_context=multiprocessing.get_context("spawn"))
+
+
+def _chunk_pages(page_indices: list[int], n_chunks: int) -> list[list[int]]:
+    # 연속 페이지 묶음으로 분할(워커당 PDF open 횟수 최소화)
+    size = max(1, -(-len(page_indices) // max(1, n_chunks)))
+    return [page_indices[i : i + size] for i in range(0, len(page_indices), size)]
+
+
+def _read_pdf_pages(
+    p: Path,
+    *,
+    max_pages: Optional[int],
+    page_range: Optional[tuple[int, int]],
+    workers: Optional[int],
+) -> tuple[list[tuple[int, str, float]], int, bool]:
+    """
+    PDF 페이지 텍스트를 추출한다.
+    - page_range(1-based, 양끝 포함)가 있으면 그 구간, 없으면 앞에서부터 max_pages(None=전체)
+    - 파일이 크고 페이지가 많으면 프로세스 풀(spawn)로 페이지 묶음을 병렬 추출
+    반환: (페이지 순서대로 정렬된 결과, 전체 페이지 수, 병렬 여부)
+    """
+    import pdfplumber
+
+    with pdfplumber.open(p) as pdf:
+        pages_total = len(pdf.pages)
+
+    if page_range is not None:
+        first = max(1, int(page_range[0]))
+        last = min(pages_total, int(page_range[1]))
+        page_indices = list(range(first - 1, last))
+    else:
+        n = pages_total if max_pages is None else min(pages_total, max(1, int(max_pages)))
+        page_indices = list(range(n))
+
+    # 기본 워커 수는 CPU 수와 로더 동시 실행 상한 중 작은 값(업로드마다 CPU 수만큼 인터프리터를 띄우지 않음)
+    n_workers = min(int(workers or min(os.cpu_count() or 1, _LOADER_MAX_WORKERS)), len(page_indices))
+    if (
+        n_workers <= 1
+        or len(page_indices) < _PDF_PARALLEL_MIN_PAGES
+        or p.stat().st_size < _PARALLEL_MIN_FILE_BYTES
+    ):
+        return _extract_pdf_pages(str(p), page_indices), pages_total, False
+
+    results: list[tuple[int, str, float]] = []
+    chunks = _chunk_pages(page_indices, n_workers * 2)
+    with _process_pool(n_workers) as ex:
+        for part in ex.map(_extract_pdf_pages, [str(p)] * len(chunks), chunks):
+            results.extend(part)
+    results.sort(key=lambda x: x[0])
+    return results, pages_total, True
+
+
+def _iter_byte_blocks(p: Path, encoding: Optional[str] = None) -> Iterator[bytes]:
+    # 개행 카운트용 블록. ASCII 비호환 인코딩(UTF-16 등)은 UTF-8로 변환해 b"\n" 탐색이 가능하게 함
+    with open_stream(p) as f:
+        if encoding and not is_ascii_compatible(encoding):
+            text = io.TextIOWrapper(f, encoding=encoding, newline="")
+            while True:
+                chunk = text.read(_COUNT_BLOCK_BYTES)
+                if not chunk:
+                    break
+                yield chunk.encode("utf-8")
+            return
+        while True:
+            block = f.read(_COUNT_BLOCK_BYTES)
+            if not block:
+                break
+            yield block
+
+
+def _count_csv_rows(p: Path, *, encoding: Optional[str] = None) -> int:
+    """
+    CSV 데이터 행 수(헤더 제외)를 개행 문자 카운트로 빠르게 추정한다.
+    - 파싱 없이 1 MiB 블록 단위로 읽으므로 메모리는 블록 크기로 고정(압축 파일은 스트리밍 해제)
+    - 공백만 있는 줄은 세지 않음(pandas skip_blank_lines=True와 동일)
+    - 따옴표 안에 개행이 있는 셀은 별도 행으로 세어진다(근사치)
+    """
+    lines = 0
+    partial = False  # 블록 경계에 걸친 마지막 줄에 공백 외 문자가 있었는지
+    for block in _iter_byte_blocks(p, encoding):
+        first = block.find(b"\n")
+        if first < 0:
+            partial = partial or bool(block.strip())
+            continue
+        # 앞 블록에서 이어진 줄을 마감하고, 블록 안의 완결된 줄은 개행 수 - 빈 줄 수
+        lines += int(partial or bool(block[:first].strip()))
+        last = block.rfind(b"\n")
+        lines += block.count(b"\n", first + 1, last + 1) - len(_BLANK_LINE_RE.findall(block, first + 1, last + 1))
+        partial = bool(block[last + 1 :].strip())
+
+    # 마지막 줄에 개행이 없으면 1줄 추가
+    lines += int(partial)
+    return max(0, lines - 1)
+
+
+def _read_csv_head(p: Path, *, max_rows: int, encoding: Optional[str] = None) -> tuple[pd.DataFrame, bool, int]:
+    """
+    CSV를 max_rows까지만 파싱한다(전체 read 후 head 하지 않음).
+    반환: (df, truncated, rows_total)
+    - max_rows 미만으로 읽혔으면 파일 끝까지 읽은 것이므로 rows_total = len(df)
+    - 그 외에는 개행 카운트 패스로 rows_total을 구한다
+    """
+    import pandas as pd
+
+    with open_stream(p) as f:
+        df = pd.read_csv(f, nrows=max_rows, encoding=encoding)
+    if len(df) < max_rows:
+        return df, False, int(len(df))
+
+    rows_total = max(_count_csv_rows(p, encoding=encoding), int(len(df)))
+    return df, rows_total > max_rows, rows_total
+
+
+def read_csv_header(path: str, *, encoding: Optional[str] = None) -> list[str]:
+    """
+    CSV 헤더(컬럼명)만 읽는다(데이터 행은 파싱하지 않음, 압축 파일은 앞부분만 해제).
+    - encoding=None이면 앞부분 샘플로 판별(load_file과 동일 규칙)
+    """
+    import pandas as pd
+
+    p = Path(path)
+    with open_stream(p) as f:
+        head = pd.read_csv(f, nrows=0, encoding=encoding or detect_encoding(p))
+    return [str(c) for c in head.columns]
+
+
+def _bottom_k(df: pd.DataFrame, k: int) -> pd.DataFrame:
+    # 무작위 키(_key)가 가장 작은 k행 = 지금까지 본 행 전체에서의 균등 표본(비복원)
+    return df.nsmallest(k, "_key") if len(df) > k else df
+
+
+def _allocate_quota(counts: pd.Series, k: int) -> dict[Any, int]:
+    """
+    층별 표본 수를 비례 배분한다(최대 잔여 방식).
+    k가 층 수보다 크면 모든 층에 최소 1행을 보장한다.
+    """
+    total = int(counts.sum())
+    if total <= k:
+        return {key: int(v) for key, v in counts.items()}
+
+    exact = counts * (k / total)
+    quota = exact.astype(int)
+    if k >= len(counts):
+        quota = quota.clip(lower=1)
+    rest = k - int(quota.sum())
+    while rest < 0:
+        # 최소 1행 보장으로 초과한 만큼, 2행 이상인 층에서 잔여가 가장 작은(반올림 이득이 큰) 순으로 1행씩 회수
+        over = quota[quota > 1]
+        take = (exact[over.index] - over).sort_values().index[:-rest]
+        quota.loc[take] -= 1
+        rest = k - int(quota.sum())
+    while rest > 0:
+        # 남은 행은 잔여가 큰 순으로 1행씩(층 크기를 넘지 않는 층만)
+        room = quota[quota < counts]
+        give = (exact[room.index] - room).sort_values(ascending=False).index[:rest]
+        quota.loc[give] += 1
+        rest = k - int(quota.sum())
+    return {key: int(v) for key, v in quota.items() if v > 0}
+
+
+def _read_csv_sample(
+    p: Path,
+    *,
+    max_rows: int,
+    method: str = "reservoir",
+    stratify_by: Optional[str] = None,
+    seed: int = 0,
+    encoding: Optional[str] = None,
+) -> tuple[pd.DataFrame, bool, int]:
+    """
+    CSV 전체를 청크로 읽으며 max_rows 크기의 표본을 유지한다(앞부분 편향 제거).
+    - reservoir: 행마다 난수 키를 부여하고 키가 가장 작은 max_rows행을 유지(균등 표본)
+    - stratified: stratify_by 컬럼을 먼저 1회 집계해 층별 비례 할당 후, 층마다 같은 방식으로 유지
+    - 결과는 원래 행 순서로 정렬(시계열 순서 보존)
+    - 압축 파일도 같은 경로(open_stream)로 읽으므로 패스마다 스트리밍 해제
+    반환: (df, truncated, rows_total)
+    """
+    import numpy as np
+    import pandas as pd
+
+    rng = np.random.default_rng(seed)
+
+    quota: Optional[dict[Any, int]] = None
+    if method == "stratified":
+        if not stratify_by:
+            raise ValueError("stratified sampling requires stratify_by")
+        counts = pd.Series(dtype="int64")
+        with open_stream(p) as f:
+            for chunk in pd.read_csv(f, usecols=[stratify_by], chunksize=_SAMPLE_CHUNK_ROWS, encoding=encoding):
+                counts = counts.add(chunk[stratify_by].value_counts(dropna=False), fill_value=0)
+        quota = _allocate_quota(counts.astype("int64"), max_rows)
+
+    kept: Optional[pd.DataFrame] = None
+    rows_total = 0
+    with open_stream(p) as f:
+        for chunk in pd.read_csv(f, chunksize=_SAMPLE_CHUNK_ROWS, encoding=encoding):
+            chunk = chunk.assign(_row=np.arange(rows_total, rows_total + len(chunk)), _key=rng.random(len(chunk)))
+            rows_total += len(chunk)
+
+            pool = chunk if kept is None else pd.concat([kept, chunk], ignore_index=True)
+            if quota is None:
+                kept = _bottom_k(pool, max_rows)
+            else:
+                parts = [
+                    _bottom_k(g, quota[key])
+                    for key, g in pool.groupby(stratify_by, dropna=False, sort=False)
+                    if quota.get(key, 0) > 0
+                ]
+                kept = pd.concat(parts, ignore_index=True) if parts else pool.head(0)
+
+    if kept is None:
+        with open_stream(p) as f:
+            return pd.read_csv(f, nrows=0, encoding=encoding), False, 0
+
+    df = kept.sort_values("_row").drop(columns=["_row", "_key"]).reset_index(drop=True)
+    return df, rows_total > max_rows, rows_total
+
+
+def _excel_header(row: tuple) -> list[str]:
+    # pandas.read_excel과 같은 규칙: 빈 헤더는 "Unnamed: i", 중복은 ".1", ".2" 접미사
+    names: list[str] = []
+    seen: dict[str, int] = {}
+    for i, v in enumerate(row):
+        name = f"Unnamed: {i}" if v is None or str(v).strip() == "" else str(v)
+        if name in seen:
+            seen[name] += 1
+            name = f"{name}.{seen[name]}"
+        else:
+            seen[name] = 0
+        names.append(name)
+    return names
+
+
+def _read_excel_sheet(path: str, sheet: str, max_rows: int) -> tuple[str, pd.DataFrame, bool, int]:
+    """
+    xlsx 시트 1개를 openpyxl read-only 모드로 스트리밍 파싱한다(max_rows+1행에서 중단).
+    프로세스 풀 워커에서도 호출되므로 모듈 최상위 함수로 둔다.
+    - rows_total은 시트 dimension 메타데이터 기준(없으면 남은 행을 값 보관 없이 세어 구함)
+    반환: (sheet, df, truncated, rows_total)
+    """
+    import openpyxl
+    import pandas as pd
+
+    wb = openpyxl.load_workbook(path, read_only=True, data_only=True)
+    try:
+        ws = wb[sheet]
+        it = ws.iter_rows(values_only=True)
+        header_row = next(it, None)
+        if header_row is None:
+            return sheet, pd.DataFrame(), False, 0
+
+        columns = _excel_header(header_row)
+        width = len(columns)
+        rows: list[tuple] = []
+        truncated = False
+        for row in it:
+            if len(rows) >= max_rows:
+                truncated = True
+                break
+            rows.append(tuple(row[:width]) + (None,) * (width - len(row)))
+
+        if not truncated:
+            rows_total = len(rows)
+        elif ws.max_row:
+            rows_total = max(int(ws.max_row) - 1, len(rows) + 1)
+        else:
+            rows_total = len(rows) + 1 + sum(1 for _ in it)
+    finally:
+        wb.close()
+
+    df = pd.DataFrame.from_records(rows, columns=columns).infer_objects()
+    return sheet, df, truncated, int(rows_total)
+
+
+def _read_xls_sheets(
+    p: Path, *, max_rows: int, sheets: Optional[list[str]] = None
+) -> list[tuple[str, pd.DataFrame, bool, int]]:
+    # 구형 .xls(OLE)는 openpyxl 미지원 → pandas(xlrd)로 요청된 시트만 max_rows+1행까지 파싱
+    # rows_total은 xlrd 시트의 실제 행 수(nrows - 헤더 1행), 얻지 못하면 파싱한 행 수 기준
+    import pandas as pd
 
-        # 3) PDF
-        if ext == ".pdf":
-            if pdfplumber is None:
-                return ToolResult(
-                    ok=False,
-                    summary="pdfplumber not installed",
-                    error="missing_dependency",
-                    last_error="pdfplumber",
-                )
-
-            texts = []
-            with pdfplumber.open(p) as pdf:
-                for page in pdf.pages[: max(1, pdf_max_pages)]:
-                    text = (page.extract_text() or "").strip()
-                    texts.append(text)
-
-            joined = "\n\n".join([t for t in texts if t])
-            if not joined:
-                joined = "(텍스트 추출 실패: 스캔 PDF 가능)"
-
-            return ToolResult(
-                ok=True,
-                summary=f"loaded pdf: pages={min(pdf_max_pages, len(texts))}",
-                data={
-                    "kind": "pdf",
-                    "path": str(p),
-                    "pages_read": int(min(pdf_max_pages, len(texts))),
-                    "text": joined,
-                    "pdf_max_pages": int(pdf_max_pages),
-                },
+    out = []
+    with pd.ExcelFile(p) as xf:
+        names = list(sheets) if sheets is not None else [str(n) for n in xf.sheet_names]
+        frames = xf.parse(sheet_name=names, nrows=max_rows + 1)
+        for name in names:
+            df = frames[name]
+            truncated = len(df) > max_rows
+            try:
+                rows_total = max(int(xf.book.sheet_by_name(name).nrows) - 1, len(df))
+            except Exception:
+                rows_total = len(df)
+            out.append((str(name), df.head(max_rows), truncated, int(rows_total)))
+    return out
+
+
+def _read_excel_sheets(
+    p: Path,
+    *,
+    max_rows: int,
+    sheets: Optional[list[str]] = None,
+    workers: Optional[int] = None,
+) -> list[tuple[str, pd.DataFrame, bool, int]]:
+    """
+    엑셀 시트들을 파싱한다(sheets=None이면 전체 시트, 시트 순서 유지).
+    - 시트가 2개 이상이고 파일이 크면 프로세스 풀(spawn)로 시트별 병렬 파싱(시트끼리는 독립)
+    반환: [(sheet, df, truncated, rows_total), ...]
+    """
+    if p.suffix.lower() == ".xls":
+        return _read_xls_sheets(p, max_rows=max_rows, sheets=sheets)
+
+    names = list(sheets) if sheets is not None else _excel_sheet_names(p)
+    n_workers = min(int(workers or os.cpu_count() or 1), len(names))
+    if n_workers <= 1 or p.stat().st_size < _PARALLEL_MIN_FILE_BYTES:
+        return [_read_excel_sheet(str(p), name, max_rows) for name in names]
+
+    with _process_pool(n_workers) as ex:
+        return list(ex.map(_read_excel_sheet, [str(p)] * len(names), names, [max_rows] * len(names)))
+
+
+def _excel_sheet_names(p: Path) -> list[str]:
+    if p.suffix.lower() == ".xls":
+        import pandas as pd
+
+        with pd.ExcelFile(p) as xf:
+            return [str(n) for n in xf.sheet_names]
+
+    import openpyxl
+
+    wb = openpyxl.load_workbook(p, read_only=True)
+    try:
+        return list(wb.sheetnames)
+    finally:
+        wb.close()
+
+
+def _table_result(
+    p: Path,
+    kind: str,
+    df: pd.DataFrame,
+    *,
+    max_rows: int,
+    truncated: bool,
+    rows_total: int,
+    cache_status: str,
+    compact_stats: Optional[dict[str, Any]] = None,
+    sample: str = "head",
+    cache_key: Optional[str] = None,
+) -> ToolResult:
+    summary = f"loaded {kind}: shape={df.shape[0]}x{df.shape[1]} truncated={truncated} cache={cache_status}"
+    if sample != "head":
+        summary += f" sample={sample}"
+    if compact_stats:
+        summary += f" mem_saved={compact_stats.get('bytes_saved', 0)}B"
+    return ToolResult(
+        ok=True,
+        summary=summary,
+        data={
+            "kind": kind,
+            "path": str(p),
+            "columns": [str(c) for c in df.columns.tolist()],
+            "shape": [int(df.shape[0]), int(df.shape[1])],
+            "preview_csv": df.head(10).to_csv(index=False),
+            "max_rows": int(max_rows),
+            "truncated": truncated,
+            "rows_total": int(rows_total),
+            "sample": sample,
+            "compression": detect_compression(p),
+            "cache": cache_status,
+            # 파싱 캐시 key(파일 fingerprint+로드 옵션, 캐시 미사용이면 None): 같은 df를 식별하는 데 재사용
+            "cache_key": cache_key,
+            "memory_bytes": int(df.memory_usage(deep=True).sum()),
+            "compact": compact_stats,
+            # ✅ Agent가 직접 파일을 다시 읽지 않도록 df 제공
+            "df": df,
+        },
+    )
+
+
+def _load_table(
+    p: Path,
+    kind: str,
+    reader: Callable[..., tuple[pd.DataFrame, bool, int]],
+    *,
+    max_rows: int,
+    cache: Optional[ParseCache],
+    compact: bool = False,
+    variant: str = "",
+    sample: str = "head",
+) -> ToolResult:
+    """
+    표 형식(CSV/XLSX) 로딩 공통 경로.
+    - cache가 있으면 fingerprint(+kind/max_rows/variant/compact)로 sidecar를 먼저 조회
+      (variant: 샘플링 방식 등 같은 파일이라도 결과 df가 달라지는 옵션)
+    - miss면 reader로 파싱 → (옵션) dtype 압축 → sidecar 저장(best-effort)
+    """
+    from core.tools.data_analysis import compact_dataframe
+    use_cache = cache is not None and cache.available
+    key = f"{file_fingerprint(p)}__{kind}__{int(max_rows)}{variant}{'__c' if compact else ''}" if use_cache else ""
+
+    if use_cache:
+        hit = cache.get(key)
+        if hit is not None:
+            df, meta = hit
+            return _table_result(
+                p,
+                kind,
+                df,
+                max_rows=max_rows,
+                truncated=bool(meta.get("truncated", False)),
+                rows_total=int(meta.get("rows_total", len(df))),
+                cache_status="hit",
+                compact_stats=meta.get("compact"),
+                sample=sample,
+                cache_key=key,
             )
 
+    df, truncated, rows_total = reader(p, max_rows=max_rows)
+    compact_stats: Optional[dict[str, Any]] = None
+    if compact:
+        df, compact_stats = compact_dataframe(df)
+
+    if use_cache:
+        cache.put(key, df, {"truncated": truncated, "rows_total": int(rows_total), "compact": compact_stats})
+
+    return _table_result(
+        p,
+        kind,
+        df,
+        max_rows=max_rows,
+        truncated=truncated,
+        rows_total=rows_total,
+        cache_status="miss" if use_cache else "off",
+        compact_stats=compact_stats,
+        sample=sample,
+        cache_key=key or None,
+    )
+
+
+# ----------------------------
+# Loader registry
+# ----------------------------
+@dataclass(frozen=True)
+class LoadOptions:
+    """load_file() 옵션 묶음(각 로더가 필요한 값만 사용)."""
+
+    max_rows: int = 5000
+    pdf_max_pages: Optional[int] = 1
+    pdf_page_range: Optional[tuple[int, int]] = None
+    pdf_workers: Optional[int] = None
+    text_max_chars: int = 20000
+    cache_dir: Optional[str] = None
+    cache_max_bytes: int = 512 * 1024 * 1024
+    compact: bool = False
+    sample: str = "head"
+    stratify_by: Optional[str] = None
+    sample_seed: int = 0
+    excel_workers: Optional[int] = None
+    encoding: Optional[str] = None
+
+
+Loader = Callable[[Path, str, LoadOptions], ToolResult]
+
+
+@dataclass(frozen=True)
+class LoaderSpec:
+    kind: str
+    fn: Loader
+    extensions: tuple[str, ...] = ()
+    magic: tuple[bytes, ...] = ()
+    # True면 순차 스트림만으로 읽을 수 있어 압축 파일(.gz/.bz2/.zip) 안의 내용도 처리
+    streamable: bool = False
+
+
+_LOADERS_BY_EXT: dict[str, LoaderSpec] = {}
+_LOADERS_BY_MAGIC: list[tuple[bytes, LoaderSpec]] = []
+_MAGIC_SNIFF_BYTES = 8
+
+
+def register_loader(
+    kind: str,
+    *,
+    extensions: tuple[str, ...] = (),
+    magic: tuple[bytes, ...] = (),
+    streamable: bool = False,
+) -> Callable[[Loader], Loader]:
+    """
+    확장자/매직 바이트 → 로더 함수 등록 데코레이터.
+    - 같은 확장자를 다시 등록하면 나중 것이 우선
+    - 로더 시그니처: fn(path, ext, opts) -> ToolResult
+    - streamable=True인 로더는 압축 파일을 받으면 open_stream()으로 읽어야 함
+    """
+
+    def deco(fn: Loader) -> Loader:
+        spec = LoaderSpec(
+            kind=kind,
+            fn=fn,
+            extensions=tuple(e.lower() for e in extensions),
+            magic=tuple(magic),
+            streamable=streamable,
+        )
+        for e in spec.extensions:
+            _LOADERS_BY_EXT[e] = spec
+        for m in spec.magic:
+            _LOADERS_BY_MAGIC.append((m, spec))
+        return fn
+
+    return deco
+
+
+def resolve_loader(p: Path) -> Optional[LoaderSpec]:
+    """
+    확장자로 먼저 찾고, 없으면 파일 앞 몇 바이트(매직 넘버)로 판별한다.
+    - 압축 파일은 해제 후 이름("app.log.gz" → ".log")과 해제된 앞부분 바이트로 판별
+    - 확장자는 뒤에서부터 확인하므로 "app.log.1.gz"도 TEXT로 판별
+    """
+    compression = detect_compression(p)
+    name = inner_name(p, compression) if compression else p.name
+    # 로테이션 로그("app.log.1")처럼 숫자 접미사가 붙은 경우 앞쪽 확장자까지 확인
+    for suffix in reversed(Path(name).suffixes):
+        spec = _LOADERS_BY_EXT.get(suffix.lower())
+        if spec is not None:
+            return spec
+
+    try:
+        with open_stream(p) as f:
+            head = f.read(_MAGIC_SNIFF_BYTES)
+    except (OSError, EOFError, ValueError):
+        return None
+    for magic, spec in _LOADERS_BY_MAGIC:
+        if head.startswith(magic):
+            return spec
+    return None
+
+
+def _encoding_note(encoding: str) -> str:
+    # UTF-8 계열이 아니면 summary에 표시(사용자가 자동 판별 결과를 확인할 수 있도록)
+    return "" if encoding.startswith("utf-8") else f" encoding={encoding}"
+
+
+def _unsupported_encoding(encoding: str) -> ToolResult:
+    # tail seek/mmap 스캔은 바이트 단위 개행 탐색에 의존하므로 UTF-16 등은 명시적으로 거부(깨진 텍스트 반환 방지)
+    return ToolResult(
+        ok=False,
+        summary=f"unsupported text encoding: {encoding}",
+        error="unsupported_encoding",
+        last_error=f"{encoding} is not ASCII-compatible; re-save the file as UTF-8",
+    )
+
+
+def _parse_cache(opts: LoadOptions) -> Optional[ParseCache]:
+    if not opts.cache_dir:
+        return None
+    from core.tools.parse_cache import ParseCache
+
+    return ParseCache(opts.cache_dir, max_bytes=opts.cache_max_bytes)
+
+
+@register_loader("text", extensions=(".log", ".txt", ".out"), streamable=True)
+def _load_text(p: Path, ext: str, opts: LoadOptions) -> ToolResult:
+    encoding = opts.encoding or detect_encoding(p)
+    if not is_ascii_compatible(encoding):
+        return _unsupported_encoding(encoding)
+    text, truncated, stats = _read_tail_text(p, max_chars=opts.text_max_chars, encoding=encoding)
+    return ToolResult(
+        ok=True,
+        summary=(
+            f"loaded text: chars={len(text)} bytes={stats['file_size']} truncated={truncated}"
+            + _encoding_note(encoding)
+        ),
+        data={
+            "kind": "text",
+            "path": str(p),
+            "ext": ext,
+            "compression": detect_compression(p),
+            "encoding": encoding,
+            "text": text,
+            "text_truncated": truncated,
+            "text_max_chars": int(opts.text_max_chars),
+            "file_size": stats["file_size"],
+            "lines_estimate": stats["lines_estimate"],
+        },
+    )
+
+
+@register_loader("csv", extensions=(".csv",), streamable=True)
+def _load_csv(p: Path, ext: str, opts: LoadOptions) -> ToolResult:
+    if opts.sample not in _SAMPLE_MODES:
+        return ToolResult(ok=False, summary="invalid sample mode", error="invalid_option", last_error=opts.sample)
+
+    # 인코딩은 앞부분 샘플로 1회 판별해 파서에 전달(실패 후 재시도 파싱 없음)
+    # 판별 결과는 파일 내용으로 결정되므로, 직접 지정한 경우에만 캐시 key에 반영
+    encoding = opts.encoding or detect_encoding(p)
+    enc_variant = f"__{opts.encoding}" if opts.encoding else ""
+
+    cache = _parse_cache(opts)
+    if opts.sample == "head":
+        reader = functools.partial(_read_csv_head, encoding=encoding)
+        variant = enc_variant
+    else:
+        reader = functools.partial(
+            _read_csv_sample,
+            method=opts.sample,
+            stratify_by=opts.stratify_by,
+            seed=opts.sample_seed,
+            encoding=encoding,
+        )
+        variant = f"__{opts.sample}_{opts.stratify_by or ''}_{opts.sample_seed}{enc_variant}"
+
+    res = _load_table(
+        p,
+        "csv",
+        reader,
+        max_rows=opts.max_rows,
+        cache=cache,
+        compact=opts.compact,
+        variant=variant,
+        sample=opts.sample,
+    )
+    res.summary += _encoding_note(encoding)
+    res.data["encoding"] = encoding
+    return res
+
+
+@register_loader(
+    "excel",
+    extensions=(".xlsx", ".xls"),
+    magic=(b"PK\x03\x04", b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1"),
+)
+def _load_excel(p: Path, ext: str, opts: LoadOptions) -> ToolResult:
+    """
+    모든 시트를 로드한다. data.df/shape 등은 첫 시트 기준(기존 계약 유지), 시트별 결과는 data.sheets.
+    - 시트마다 캐시 key를 따로 두고, miss인 시트만 (병렬) 파싱
+    """
+    from core.tools.data_analysis import compact_dataframe
+    cache = _parse_cache(opts)
+    use_cache = cache is not None and cache.available
+    names = _excel_sheet_names(p)
+    if not names:
+        raise ValueError("workbook has no sheets")
+    fp = file_fingerprint(p) if use_cache else ""
+
+    def _key(i: int) -> str:
+        return f"{fp}__excel__{int(opts.max_rows)}__sheet{i}{'__c' if opts.compact else ''}"
+
+    sheets: dict[str, dict[str, Any]] = {}
+    missing: list[str] = []
+    for i, name in enumerate(names):
+        hit = cache.get(_key(i)) if use_cache else None
+        if hit is None:
+            missing.append(name)
+            continue
+        df, meta = hit
+        sheets[name] = {
+            "df": df,
+            "truncated": bool(meta.get("truncated", False)),
+            "rows_total": int(meta.get("rows_total", len(df))),
+            "compact": meta.get("compact"),
+            "cache": "hit",
+        }
+
+    if missing:
+        for name, df, truncated, rows_total in _read_excel_sheets(
+            p, max_rows=opts.max_rows, sheets=missing, workers=opts.excel_workers
+        ):
+            compact_stats: Optional[dict[str, Any]] = None
+            if opts.compact:
+                df, compact_stats = compact_dataframe(df)
+            if use_cache:
+                meta = {"truncated": truncated, "rows_total": int(rows_total), "compact": compact_stats}
+                cache.put(_key(names.index(name)), df, meta)
+            sheets[name] = {
+                "df": df,
+                "truncated": truncated,
+                "rows_total": int(rows_total),
+                "compact": compact_stats,
+                "cache": "miss" if use_cache else "off",
+            }
+
+    first = sheets[names[0]]
+    res = _table_result(
+        p,
+        "excel",
+        first["df"],
+        max_rows=opts.max_rows,
+        truncated=first["truncated"],
+        rows_total=first["rows_total"],
+        cache_status=first["cache"],
+        compact_stats=first["compact"],
+        cache_key=_key(0) if use_cache else None,
+    )
+    res.summary += f" sheets={len(names)}"
+    res.data["sheets"] = [
+        {
+            "name": name,
+            "columns": [str(c) for c in sheets[name]["df"].columns.tolist()],
+            "shape": [int(sheets[name]["df"].shape[0]), int(sheets[name]["df"].shape[1])],
+            "truncated": sheets[name]["truncated"],
+            "rows_total": sheets[name]["rows_total"],
+            "cache": sheets[name]["cache"],
+            "cache_key": _key(i) if use_cache else None,
+            "df": sheets[name]["df"],
+        }
+        for i, name in enumerate(names)
+    ]
+    return res
+
+
+@register_loader("pdf", extensions=(".pdf",), magic=(b"%PDF-",))
+def _load_pdf(p: Path, ext: str, opts: LoadOptions) -> ToolResult:
+    if _optional_module("pdfplumber") is None:
+        return ToolResult(
+            ok=False,
+            summary="pdfplumber not installed",
+            error="missing_dependency",
+            last_error="pdfplumber",
+        )
+
+    pages, pages_total, parallel = _read_pdf_pages(
+        p, max_pages=opts.pdf_max_pages, page_range=opts.pdf_page_range, workers=opts.pdf_workers
+    )
+    texts = [t for _, t, _ in pages]
+
+    joined = "\n\n".join([t for t in texts if t])
+    if not joined:
+        joined = "(텍스트 추출 실패: 스캔 PDF 가능)"
+
+    return ToolResult(
+        ok=True,
+        summary=f"loaded pdf: pages={len(pages)}/{pages_total} parallel={parallel}",
+        data={
+            "kind": "pdf",
+            "path": str(p),
+            "pages_read": int(len(pages)),
+            "pages_total": int(pages_total),
+            "text": joined,
+            "page_texts": texts,
+            "page_timings": [{"page": i + 1, "sec": sec} for i, _, sec in pages],
+            "pdf_max_pages": opts.pdf_max_pages,
+            "parallel": parallel,
+        },
+    )
+
+
+def load_file(
+    path: str,
+    *,
+    max_rows: int = 5000,
+    pdf_max_pages: Optional[int] = 1,
+    pdf_page_range: Optional[tuple[int, int]] = None,
+    pdf_workers: Optional[int] = None,
+    text_max_chars: int = 20000,
+    cache_dir: str | None = None,
+    cache_max_bytes: int = 512 * 1024 * 1024,
+    compact: bool = False,
+    sample: str = "head",
+    stratify_by: Optional[str] = None,
+    sample_seed: int = 0,
+    excel_workers: Optional[int] = None,
+    encoding: Optional[str] = None,
+) -> ToolResult:
+    """
+    범용 파일 로더 (Phase2-1 표준 Tool).
+    - CSV/XLSX/PDF + TEXT(.log/.txt/.out) 지원 (register_loader로 확장 가능)
+    - 반환은 ToolResult로 통일
+    - PDF: pdf_max_pages=None이면 전체, pdf_page_range=(시작, 끝)이면 해당 구간(1-based)을 추출
+      (페이지가 많으면 pdf_workers개(기본 min(CPU 수, _LOADER_MAX_WORKERS)) 프로세스로 병렬 추출)
+    - CSV sample: "head"(앞에서 max_rows) | "reservoir"(전체 균등 표본) | "stratified"(stratify_by 층화 표본)
+    - XLSX: read-only 스트리밍으로 시트별 max_rows까지만 파싱, 전체 시트를 data.sheets로 제공
+      (시트가 여러 개면 excel_workers개 프로세스로 병렬 파싱)
+    - compact=True면 CSV/XLSX DataFrame dtype 압축(정수/실수 downcast, 저카디널리티 문자열 → category)
+    - cache_dir 지정 시 CSV/XLSX 파싱 결과를 내용 해시 기준 Parquet sidecar로 캐시
+    - CSV/TEXT 인코딩은 encoding=None이면 앞부분 샘플로 자동 판별(BOM → UTF-8 → CP949/EUC-KR)
+    - .gz/.bz2/.zip 압축 파일은 디스크에 풀지 않고 스트리밍 해제(CSV/TEXT만, zip은 첫 번째 파일)
+    """
+    p = Path(path)
+    if not p.exists():
+        return ToolResult(ok=False, summary="file not found", error="file_not_found", last_error=str(p))
+
+    compression = detect_compression(p)
+    try:
+        ext = Path(inner_name(p, compression)).suffix.lower() if compression else p.suffix.lower()
+        spec = resolve_loader(p)
+    except Exception as e:
+        return ToolResult(
+            ok=False,
+            summary=f"{compression} file open failed" if compression else "file open failed",
+            error="load_failed",
+            last_error=f"{type(e).__name__}: {e}",
+        )
+    if spec is None:
         return ToolResult(ok=False, summary="unsupported file type", error="unsupported_type", last_error=ext)
+    if compression and not spec.streamable:
+        # PDF/Excel은 임의 접근(seek)이 필요해 압축 해제본을 통째로 만들어야 하므로 지원하지 않음
+        return ToolResult(
+            ok=False,
+            summary=f"compressed {spec.kind} is not supported",
+            error="unsupported_type",
+            last_error=f"{compression}:{ext}",
+        )
 
+    opts = LoadOptions(
+        max_rows=max_rows,
+        pdf_max_pages=pdf_max_pages,
+        pdf_page_range=pdf_page_range,
+        pdf_workers=pdf_workers,
+        text_max_chars=text_max_chars,
+        cache_dir=cache_dir,
+        cache_max_bytes=cache_max_bytes,
+        compact=compact,
+        sample=sample,
+        stratify_by=stratify_by,
+        sample_seed=sample_seed,
+        excel_workers=excel_workers,
+        encoding=encoding,
+    )
+
+    try:
+        return spec.fn(p, ext, opts)
     except Exception as e:
         return ToolResult(
             ok=False,
@@ -146,3 +1109,29 @@ def load_file(
             error="load_failed",
             last_error=f"{type(e).__name__}: {e}",
         )
+
+
+def _get_loader_executor() -> ThreadPoolExecutor:
+    global _loader_executor
+    if _loader_executor is None:
+        _loader_executor = ThreadPoolExecutor(max_workers=_LOADER_MAX_WORKERS, thread_name_prefix="file_loader")
+    return _loader_executor
+
+
+async def _run_in_loader(fn: Callable[..., ToolResult], *args: Any, **kwargs: Any) -> ToolResult:
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_get_loader_executor(), functools.partial(fn, *args, **kwargs))
+
+
+async def aload_file(path: str, **kwargs: Any) -> ToolResult:
+    """
+    load_file()의 비동기 버전.
+    - 파싱은 공유 스레드 풀(최대 _LOADER_MAX_WORKERS)에서 수행되어 이벤트 루프를 막지 않음
+    - 인자/반환은 load_file()과 동일
+    """
+    return await _run_in_loader(load_file, path, **kwargs)
+
+
+async def ascan_log_file(path: str, **kwargs: Any) -> ToolResult:
+    """scan_log_file()의 비동기 버전(공유 로더 스레드 풀에서 실행)."""
+    return await _run_in_loader(scan_log_file, path, **kwargs)
@@ -0,0 +1,25 @@
+# core/tools/fingerprint.py
+from __future__ import annotations
+
+import hashlib
+from pathlib import Path
+
+
+# 파일 내용 해시는 파싱 캐시 key 등에 쓰이므로 pandas/pyarrow 없이 import 가능해야 함
+_HASH_BLOCK_BYTES = 1 << 20  # 1 MiB
+
+
+def file_fingerprint(path: str | Path) -> str:
+    """
+    파일 내용의 blake2b 해시(hex)를 스트리밍으로 계산한다.
+    - 1 MiB 블록 단위로 읽으므로 메모리는 파일 크기와 무관
+    - 업로드 때마다 경로/파일명이 바뀌어도 내용이 같으면 동일한 값
+    """
+    h = hashlib.blake2b(digest_size=16)
+    with Path(path).open("rb") as f:
+        while True:
+            block = f.read(_HASH_BLOCK_BYTES)
+            if not block:
+                break
+            h.update(block)
+    return h.hexdigest()
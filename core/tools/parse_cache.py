@@ -0,0 +1,106 @@
+# core/tools/parse_cache.py
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Optional
+
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except Exception:  # pragma: no cover
+    pa = None
+    pq = None
+
+from core.tools.fingerprint import file_fingerprint  # noqa: F401 (기존 import 경로 유지)
+from core.utils.fs import ensure_dir
+
+
+_META_KEY = b"dia_parse_meta"
+
+# 캐시 파일 형식 버전(Parquet 스키마/메타데이터 구성이 바뀌면 올림 → 이전 항목은 miss 후 LRU로 제거)
+_FORMAT_VERSION = 1
+
+
+class ParseCache:
+    """
+    파싱된 DataFrame을 Parquet sidecar로 보관하는 디스크 캐시.
+    - key: 파일 fingerprint + 파싱 옵션(호출자가 조합), 파일명에는 형식 버전이 앞에 붙음
+    - 부가 정보(rows_total/truncated 등)는 Parquet schema metadata에 함께 저장
+    - 전체 크기가 max_bytes를 넘으면 가장 오래 안 쓴 파일(mtime 기준)부터 제거(LRU)
+    - pyarrow가 없거나 읽기/쓰기에 실패하면 조용히 miss로 처리(best-effort)
+    """
+
+    def __init__(self, cache_dir: str | Path, *, max_bytes: int = 512 * 1024 * 1024):
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = int(max_bytes)
+
+    @property
+    def available(self) -> bool:
+        return pq is not None
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"v{_FORMAT_VERSION}__{key}.parquet"
+
+    def get(self, key: str) -> Optional[tuple[pd.DataFrame, dict[str, Any]]]:
+        if not self.available:
+            return None
+        p = self._path(key)
+        if not p.exists():
+            return None
+        try:
+            table = pq.read_table(p)
+            raw_meta = (table.schema.metadata or {}).get(_META_KEY, b"{}")
+            meta = json.loads(raw_meta.decode("utf-8"))
+            df = table.to_pandas()
+            # LRU: 최근 사용 시각 갱신
+            os.utime(p, None)
+            return df, meta
+        except Exception:
+            return None
+
+    def put(self, key: str, df: pd.DataFrame, meta: Optional[dict[str, Any]] = None) -> Optional[Path]:
+        if not self.available:
+            return None
+        try:
+            ensure_dir(self.cache_dir)
+            table = pa.Table.from_pandas(df, preserve_index=False)
+            schema_meta = dict(table.schema.metadata or {})
+            schema_meta[_META_KEY] = json.dumps(meta or {}, ensure_ascii=False).encode("utf-8")
+            table = table.replace_schema_metadata(schema_meta)
+
+            p = self._path(key)
+            # 같은 key를 동시에 쓰는 작성자끼리 임시 파일이 겹치지 않도록 고유 이름에 쓴 뒤 교체
+            with tempfile.NamedTemporaryFile(dir=self.cache_dir, prefix=f"{p.name}.", suffix=".tmp", delete=False) as f:
+                tmp = Path(f.name)
+            try:
+                pq.write_table(table, tmp)
+                os.replace(tmp, p)
+            except Exception:
+                tmp.unlink(missing_ok=True)
+                raise
+        except Exception:
+            return None
+
+        self._evict()
+        return p
+
+    def _evict(self) -> None:
+        try:
+            entries = [(e.stat().st_mtime, e.stat().st_size, e) for e in self.cache_dir.glob("*.parquet")]
+        except Exception:
+            return
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, e in sorted(entries, key=lambda x: x[0]):
+            if total <= self.max_bytes:
+                break
+            try:
+                e.unlink()
+                total -= size
+            except Exception:
+                continue
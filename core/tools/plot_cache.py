@@ -0,0 +1,104 @@
+# core/tools/plot_cache.py
+from __future__ import annotations
+
+import dataclasses
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Optional
+
+import pandas as pd
+
+from core.utils.fs import ensure_dir
+
+
+# 캐시 키에서 빼는 표시용 사양 필드(차트 내용에는 영향 없음)
+_LABEL_FIELDS = frozenset({"title"})
+
+def chart_fingerprint(spec: Any, df: pd.DataFrame) -> str:
+    """
+    차트 1장의 캐시 키: 그릴 컬럼의 값 해시(pd.util.hash_pandas_object) + 차트 모양을 정하는 사양의 blake2b(hex).
+    - spec: ChartSpec(dataclass). kind/columns/dpi/크기/다운샘플/bins 중 하나라도 다르면 다른 키
+    - title은 표시용 라벨이라 키에서 제외(업로드 파일명이 달라도 같은 데이터면 hit)
+    - spec.columns가 비어 있으면 df 전체 컬럼 기준(렌더러 기본 동작과 동일)
+    - 선 차트는 인덱스를 x축으로 쓰므로 인덱스도 해시에 포함
+    """
+    cols = [c for c in spec.columns if c in df.columns] or list(df.columns)
+    frame = df[cols]
+
+    h = hashlib.blake2b(digest_size=16)
+    shape = {k: v for k, v in dataclasses.asdict(spec).items() if k not in _LABEL_FIELDS}
+    h.update(json.dumps(shape, sort_keys=True, default=str).encode("utf-8"))
+    h.update(json.dumps([str(c) for c in cols] + [str(t) for t in frame.dtypes]).encode("utf-8"))
+    h.update(pd.util.hash_pandas_object(frame, index=True).to_numpy().tobytes())
+    return h.hexdigest()
+
+
+class PlotCache:
+    """
+    차트 아티팩트 캐시(키 → 이미 렌더링된 PNG 경로).
+    - 같은 데이터/사양이면 PNG를 다시 그리거나 인코딩하지 않고 기존 아티팩트 경로를 반환
+    - 인덱스는 cache_dir/{key}.json 포인터 파일(PNG 자체는 아티팩트 폴더에 그대로 둠)
+    - 가리키는 PNG가 삭제됐거나 포인터를 읽지 못하면 miss로 처리(best-effort)
+    - 포인터가 max_entries개를 넘으면 가장 오래 안 쓴 것(mtime 기준)부터 제거(LRU)
+    """
+
+    def __init__(self, cache_dir: str | Path, *, max_entries: int = 1024):
+        self.cache_dir = Path(cache_dir)
+        self.max_entries = int(max_entries)
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+
+    def get(self, key: str) -> Optional[Path]:
+        p = self._path(key)
+        if not p.exists():
+            return None
+        try:
+            target = Path(json.loads(p.read_text(encoding="utf-8"))["path"])
+        except Exception:
+            return None
+        if not target.is_file():
+            return None
+        try:
+            # LRU: 최근 사용 시각 갱신
+            os.utime(p, None)
+        except Exception:
+            pass
+        return target
+
+    def put(self, key: str, artifact_path: str | Path) -> Optional[Path]:
+        try:
+            ensure_dir(self.cache_dir)
+            p = self._path(key)
+            # 같은 차트를 동시에 그린 작성자끼리 임시 파일이 겹치지 않도록 고유 이름에 쓴 뒤 교체
+            with tempfile.NamedTemporaryFile(
+                "w", encoding="utf-8", dir=self.cache_dir, prefix=f"{p.name}.", suffix=".tmp", delete=False
+            ) as f:
+                f.write(json.dumps({"path": str(artifact_path)}, ensure_ascii=False))
+                tmp = Path(f.name)
+            try:
+                os.replace(tmp, p)
+            except Exception:
+                tmp.unlink(missing_ok=True)
+                raise
+        except Exception:
+            return None
+
+        self._evict()
+        return p
+
+    def _evict(self) -> None:
+        try:
+            entries = [(e.stat().st_mtime, e) for e in self.cache_dir.glob("*.json")]
+        except Exception:
+            return
+
+        excess = len(entries) - self.max_entries
+        for _, e in sorted(entries, key=lambda x: x[0])[: max(excess, 0)]:
+            try:
+                e.unlink()
+            except Exception:
+                continue
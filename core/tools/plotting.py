@@ -0,0 +1,328 @@
+# core/tools/plotting.py
+from __future__ import annotations
+
+import asyncio
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Optional
+
+import numpy as np
+
+from core.tools.plot_cache import PlotCache, chart_fingerprint
+
+if TYPE_CHECKING:  # pragma: no cover
+    import pandas as pd
+
+# NOTE: pyplot(전역 상태 머신)은 사용하지 않는다.
+#       차트마다 독립된 Figure + Agg 캔버스를 만들어 그리므로 여러 차트를 동시에 렌더링해도 서로 섞이지 않음.
+#       matplotlib은 렌더링 워커가 처음 뜰 때 1회 import/warm-up(폰트 캐시 로드) 한다.
+
+# 렌더링 전용 스레드 수(이벤트 루프/로더 풀과 분리)
+_PLOT_MAX_WORKERS = 2
+_plot_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+_warm_lock = threading.Lock()
+_warmed = False
+
+
+@dataclass(frozen=True)
+class ChartSpec:
+    """
+    차트 1개의 사양(렌더러 선택 + 공통 옵션).
+    - kind: register_renderer로 등록된 렌더러 이름(기본 "line")
+    - columns: 그릴 컬럼(비어 있으면 렌더러가 결정)
+    - downsample/max_points: 선 차트 점 수 상한과 방식("lttb" | "minmax" | "none")
+    - bins: 집계형 차트(histogram/hist2d/quantile_bands)의 구간 수
+    """
+
+    kind: str
+    title: str
+    columns: tuple[str, ...] = ()
+    dpi: int = 150
+    width: float = 6.4
+    height: float = 4.8
+    downsample: str = "lttb"
+    max_points: int = 2000
+    bins: int = 50
+
+
+Renderer = Callable[[Any, "pd.DataFrame", ChartSpec], None]
+_RENDERERS: dict[str, Renderer] = {}
+
+
+def register_renderer(kind: str) -> Callable[[Renderer], Renderer]:
+    """차트 종류 → 렌더러 함수 등록 데코레이터. 시그니처: fn(ax, df, spec) -> None"""
+
+    def deco(fn: Renderer) -> Renderer:
+        _RENDERERS[kind] = fn
+        return fn
+
+    return deco
+
+
+def _warm_up() -> None:
+    # matplotlib import + 작은 Figure 1회 렌더링(폰트 캐시/Agg 초기화 비용을 첫 차트에서 분리)
+    global _warmed
+    if _warmed:
+        return
+    with _warm_lock:
+        if _warmed:
+            return
+        import io
+
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        from matplotlib.figure import Figure
+
+        fig = Figure(figsize=(1, 1), dpi=10)
+        FigureCanvasAgg(fig)
+        ax = fig.add_subplot()
+        ax.plot([0, 1], [0, 1])
+        ax.set_title("warm-up")
+        fig.savefig(io.BytesIO(), format="png")
+        _warmed = True
+
+
+# ----------------------------
+# Downsampling (선 차트 점 수를 고정 예산으로 축소)
+# ----------------------------
+def lttb_indices(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    """
+    Largest-Triangle-Three-Buckets: 모양을 가장 잘 보존하는 n_out개 점의 인덱스(오름차순).
+    - 첫/마지막 점은 항상 포함, 나머지는 n_out-2개 버킷에서 1개씩 선택
+    - 버킷 평균은 np.add.reduceat로 한 번에 계산하고, 버킷 내부 면적 계산/선택도 벡터 연산
+      (버킷 간에는 직전 선택점에 의존하므로 버킷 수만큼만 반복)
+    """
+    n = len(y)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    x = np.asarray(x, dtype="float64")
+    y = np.asarray(y, dtype="float64")
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    sizes = np.diff(edges)
+    avg_x = np.add.reduceat(x[1 : n - 1], edges[:-1] - 1) / sizes
+    avg_y = np.add.reduceat(y[1 : n - 1], edges[:-1] - 1) / sizes
+    # 마지막 버킷의 "다음 버킷 평균"은 마지막 점
+    next_x = np.append(avg_x[1:], x[-1])
+    next_y = np.append(avg_y[1:], y[-1])
+
+    out = np.empty(n_out, dtype=np.int64)
+    out[0], out[-1] = 0, n - 1
+    a = 0
+    for i in range(n_out - 2):
+        lo, hi = edges[i], edges[i + 1]
+        area = np.abs((x[a] - next_x[i]) * (y[lo:hi] - y[a]) - (x[a] - x[lo:hi]) * (next_y[i] - y[a]))
+        a = lo + int(np.argmax(area))
+        out[i + 1] = a
+    return out
+
+
+def minmax_indices(y: np.ndarray, n_out: int) -> np.ndarray:
+    """
+    구간별 최소/최대 점 인덱스(오름차순). 스파이크를 놓치지 않는 가장 단순한 방식.
+    - 길이를 n_out/2개 버킷으로 나눠 2차원으로 reshape 후 argmin/argmax (완전 벡터 연산)
+    """
+    n = len(y)
+    n_buckets = max(1, n_out // 2)
+    if n_out >= n:
+        return np.arange(n)
+
+    size = -(-n // n_buckets)
+    y = np.asarray(y, dtype="float64")
+    pad = size * n_buckets - n
+    lo = np.pad(y, (0, pad), constant_values=np.inf).reshape(n_buckets, size)
+    hi = np.pad(y, (0, pad), constant_values=-np.inf).reshape(n_buckets, size)
+    base = np.arange(n_buckets) * size
+    idx = np.concatenate([base + lo.argmin(axis=1), base + hi.argmax(axis=1), [0, n - 1]])
+    return np.unique(idx[idx < n])
+
+
+def _downsample(x: np.ndarray, y: np.ndarray, spec: ChartSpec) -> np.ndarray:
+    if spec.downsample == "minmax":
+        return minmax_indices(y, spec.max_points)
+    if spec.downsample == "lttb":
+        return lttb_indices(x, y, spec.max_points)
+    return np.arange(len(y))
+
+
+def _numeric_axis(index: pd.Index) -> np.ndarray:
+    # 날짜/숫자 index는 값 간격을 반영, 그 외(문자열 등)는 위치 사용
+    if index.dtype.kind == "M":
+        return index.asi8.astype("float64")
+    if index.dtype.kind in "iuf":
+        return index.to_numpy(dtype="float64")
+    return np.arange(len(index), dtype="float64")
+
+
+@register_renderer("line")
+def _draw_line(ax: Any, df: pd.DataFrame, spec: ChartSpec) -> None:
+    cols = list(spec.columns) or [str(c) for c in df.columns]
+    x_all = _numeric_axis(df.index)
+    for col in cols:
+        y_all = df[col].to_numpy(dtype="float64", na_value=np.nan)
+        valid = np.flatnonzero(~np.isnan(y_all))
+        idx = valid[_downsample(x_all[valid], y_all[valid], spec)]
+        ax.plot(df.index[idx], y_all[idx], label=str(col))
+    if df.index.name:
+        ax.set_xlabel(str(df.index.name))
+    if cols:
+        ax.legend()
+
+
+# ----------------------------
+# Aggregate renderers (NumPy로 먼저 집계 → 집계 결과만 그림, 행 수와 무관한 렌더링 비용)
+# ----------------------------
+_BAND_QUANTILES = (0.1, 0.25, 0.5, 0.75, 0.9)
+
+
+def _finite(values: Any) -> np.ndarray:
+    arr = np.asarray(values, dtype="float64")
+    return arr[np.isfinite(arr)]
+
+
+@register_renderer("histogram")
+def _draw_histogram(ax: Any, df: pd.DataFrame, spec: ChartSpec) -> None:
+    # 컬럼 1개 분포(첫 번째 컬럼). 값 배열을 np.histogram으로 bins개 막대로 집계
+    col = (list(spec.columns) or [str(df.columns[0])])[0]
+    values = _finite(df[col].to_numpy(dtype="float64", na_value=np.nan))
+    if not len(values):
+        return
+    counts, edges = np.histogram(values, bins=spec.bins)
+    ax.stairs(counts, edges, fill=True, alpha=0.6)
+    ax.axvline(float(np.median(values)), color="black", linewidth=1, linestyle="--", label="median")
+    ax.set_xlabel(str(col))
+    ax.set_ylabel("count")
+    ax.legend()
+
+
+@register_renderer("hist2d")
+def _draw_hist2d(ax: Any, df: pd.DataFrame, spec: ChartSpec) -> None:
+    # 두 컬럼의 결합 분포(산점도 대체): np.histogram2d 격자를 log(1+count) 래스터 1장으로 그림
+    x_col, y_col = (list(spec.columns) or [str(c) for c in df.columns[:2]])[:2]
+    x = df[x_col].to_numpy(dtype="float64", na_value=np.nan)
+    y = df[y_col].to_numpy(dtype="float64", na_value=np.nan)
+    mask = np.isfinite(x) & np.isfinite(y)
+    x, y = x[mask], y[mask]
+    if not len(x):
+        return
+    grid, x_edges, y_edges = np.histogram2d(x, y, bins=spec.bins)
+    im = ax.imshow(
+        np.log1p(grid.T),
+        origin="lower",
+        aspect="auto",
+        extent=(x_edges[0], x_edges[-1], y_edges[0], y_edges[-1]),
+        cmap="viridis",
+    )
+    ax.figure.colorbar(im, ax=ax, label="log(1+count)")
+    ax.set_xlabel(str(x_col))
+    ax.set_ylabel(str(y_col))
+    if len(x) > 1 and np.std(x) > 0 and np.std(y) > 0:
+        r = float(np.corrcoef(x, y)[0, 1])
+        ax.text(0.02, 0.97, f"r={r:.3f}", transform=ax.transAxes, va="top", color="white")
+
+
+@register_renderer("quantile_bands")
+def _draw_quantile_bands(ax: Any, df: pd.DataFrame, spec: ChartSpec) -> None:
+    # 행 순서를 bins개 구간으로 나눠 구간별 10/25/50/75/90% 분위수 밴드(2차원 reshape 후 nanquantile 1회)
+    col = (list(spec.columns) or [str(df.columns[0])])[0]
+    y = df[col].to_numpy(dtype="float64", na_value=np.nan)
+    n = len(y)
+    if not n:
+        return
+    n_bins = max(1, min(spec.bins, n))
+    size = -(-n // n_bins)
+    n_bins = -(-n // size)
+    grid = np.pad(y, (0, size * n_bins - n), constant_values=np.nan).reshape(n_bins, size)
+    valid = ~np.all(np.isnan(grid), axis=1)
+    centers = (np.arange(n_bins) * size + size / 2.0)[valid]
+    q = np.nanquantile(grid[valid], _BAND_QUANTILES, axis=1)
+    ax.fill_between(centers, q[0], q[4], alpha=0.25, label="p10-p90")
+    ax.fill_between(centers, q[1], q[3], alpha=0.4, label="p25-p75")
+    ax.plot(centers, q[2], linewidth=1.2, label="median")
+    ax.set_xlabel("row")
+    ax.set_ylabel(str(col))
+    ax.legend()
+
+
+@register_renderer("timeseries")
+def _draw_timeseries(ax: Any, df: pd.DataFrame, spec: ChartSpec) -> None:
+    # 기간별 집계 결과(index=기간, "{col}" 평균 + "{col}_mean"/"{col}_std" 이동 통계)만 그림 → 점 수 = 기간 수
+    x = df.index.to_numpy()
+    for col in spec.columns:
+        y = df[col].to_numpy(dtype="float64", na_value=np.nan)
+        (line,) = ax.plot(x, y, linewidth=0.8, alpha=0.5, label=f"{col}")
+        mean_col, std_col = f"{col}_mean", f"{col}_std"
+        if mean_col in df.columns:
+            m = df[mean_col].to_numpy(dtype="float64", na_value=np.nan)
+            ax.plot(x, m, linewidth=1.6, color=line.get_color(), label=f"{col} (rolling)")
+            if std_col in df.columns:
+                sd = np.nan_to_num(df[std_col].to_numpy(dtype="float64", na_value=np.nan))
+                ax.fill_between(x, m - sd, m + sd, color=line.get_color(), alpha=0.15)
+    ax.legend()
+    ax.figure.autofmt_xdate()
+
+
+def render_chart(
+    spec: ChartSpec,
+    df: pd.DataFrame,
+    out_path: str | Path,
+    *,
+    cache: Optional[PlotCache] = None,
+) -> Path:
+    """
+    차트를 PNG로 저장한다(동기, 호출 스레드에서 실행).
+    - 차트마다 새 Figure/캔버스를 사용하므로 스레드 간 상태 공유 없음
+    - cache 지정 시 (데이터 해시 + 사양)이 같은 차트가 이미 있으면 렌더링 없이 기존 경로 반환
+    """
+    key = chart_fingerprint(spec, df) if cache is not None else ""
+    if cache is not None:
+        hit = cache.get(key)
+        if hit is not None:
+            return hit
+
+    _warm_up()
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+
+    renderer = _RENDERERS.get(spec.kind)
+    if renderer is None:
+        raise ValueError(f"unknown chart kind: {spec.kind}")
+
+    out = Path(out_path)
+    fig = Figure(figsize=(spec.width, spec.height), dpi=spec.dpi)
+    FigureCanvasAgg(fig)
+    ax = fig.add_subplot()
+    renderer(ax, df, spec)
+    ax.set_title(spec.title)
+    fig.tight_layout()
+    fig.savefig(out, dpi=spec.dpi)
+    if cache is not None:
+        cache.put(key, out)
+    return out
+
+
+def _get_plot_executor() -> ThreadPoolExecutor:
+    global _plot_executor
+    with _executor_lock:
+        if _plot_executor is None:
+            _plot_executor = ThreadPoolExecutor(max_workers=_PLOT_MAX_WORKERS, thread_name_prefix="plotting")
+            _plot_executor.submit(_warm_up)
+    return _plot_executor
+
+
+async def arender_chart(
+    spec: ChartSpec,
+    df: pd.DataFrame,
+    out_path: str | Path,
+    *,
+    cache: Optional[PlotCache] = None,
+) -> Path:
+    """render_chart()의 비동기 버전(해시 계산/렌더링 모두 전용 스레드 풀에서 실행, 이벤트 루프를 막지 않음)."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        _get_plot_executor(), functools.partial(render_chart, spec, df, out_path, cache=cache)
+    )
@@ -0,0 +1,201 @@
+# core/tools/report_writer.py
+from __future__ import annotations
+
+import asyncio
+import io
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Optional, TextIO
+
+import numpy as np
+import pandas as pd
+from pandas.api.types import is_bool_dtype, is_float_dtype, is_integer_dtype, is_numeric_dtype
+
+
+# 보고서 표 렌더러(tabulate/to_markdown 대체)
+# - 컬럼 단위로 한 번에 문자열화(셀마다 포맷 함수를 부르지 않음)
+# - 넓은 표는 max_cols개씩 여러 표로 나누고(페이지), max_pages를 넘는 컬럼은 생략 안내만 남김
+# - 행은 _ROW_CHUNK개씩 바로 출력 스트림에 씀(전체 표 문자열을 메모리에 만들지 않음)
+DEFAULT_MAX_COLS = 20
+DEFAULT_MAX_PAGES = 5
+_MAX_CELL_CHARS = 80
+_ROW_CHUNK = 1000
+
+
+def _format_scalar(v: Any) -> str:
+    # object 컬럼(describe(include="all") 등 숫자/문자 혼재)용
+    if v is None or (isinstance(v, float) and np.isnan(v)) or v is pd.NA or v is pd.NaT:
+        return ""
+    if isinstance(v, (float, np.floating)):
+        return f"{v:g}"
+    return str(v)
+
+
+def _escape(cells: np.ndarray) -> np.ndarray:
+    # 파이프/줄바꿈은 표를 깨뜨리므로 치환, 너무 긴 셀은 잘라서 표 폭을 제한
+    s = pd.Series(cells, dtype="object").str.replace("|", "\\|", regex=False)
+    s = s.str.replace("\r\n", " ", regex=False).str.replace("\n", " ", regex=False)
+    long = s.str.len() > _MAX_CELL_CHARS
+    if bool(long.any()):
+        s[long] = s[long].str.slice(0, _MAX_CELL_CHARS - 1) + "…"
+    return s.to_numpy(dtype=object)
+
+
+def _format_column(s: pd.Series) -> np.ndarray:
+    """컬럼 1개를 셀 문자열 배열로(숫자는 %g, 결측은 빈 칸)."""
+    if is_bool_dtype(s.dtype) and not s.hasnans:
+        return s.to_numpy().astype(str).astype(object)
+    if is_float_dtype(s.dtype):
+        arr = s.to_numpy(dtype="float64", na_value=np.nan)
+        out = np.char.mod("%g", arr).astype(object)
+        out[np.isnan(arr)] = ""
+        return out
+    if is_integer_dtype(s.dtype):
+        out = s.astype(str).to_numpy(dtype=object)
+        if s.hasnans:
+            out[s.isna().to_numpy()] = ""
+        return out
+    return _escape(s.map(_format_scalar).to_numpy(dtype=object))
+
+
+def _align(dtype: Any) -> str:
+    return "---:" if is_numeric_dtype(dtype) and not is_bool_dtype(dtype) else ":---"
+
+
+def _write_page(
+    out: TextIO,
+    df: pd.DataFrame,
+    cols: list[int],
+    *,
+    index: bool,
+    max_rows: int,
+) -> None:
+    names = [str(df.columns[i]) for i in cols]
+    cells = [_format_column(df.iloc[:max_rows, i]) for i in cols]
+    aligns = [_align(df.dtypes.iloc[i]) for i in cols]
+    if index:
+        idx = df.index[:max_rows]
+        names = [str(df.index.name or "")] + names
+        cells = [_format_column(idx.to_series(index=None))] + cells
+        aligns = [_align(idx.dtype)] + aligns
+
+    header = _escape(np.array(names, dtype=object))
+    out.write("| " + " | ".join(header) + " |\n")
+    out.write("|" + "|".join(aligns) + "|\n")
+    if not cells or not len(cells[0]):
+        return
+
+    # 행 문자열을 컬럼 배열끼리 원소별로 이어 붙여 한 번에 만든 뒤, 청크 단위로 스트림에 씀
+    rows = "| " + cells[0]
+    for c in cells[1:]:
+        rows = rows + " | " + c
+    rows = rows + " |"
+    for start in range(0, len(rows), _ROW_CHUNK):
+        out.write("\n".join(rows[start : start + _ROW_CHUNK]) + "\n")
+
+
+def write_table(
+    out: TextIO,
+    df: pd.DataFrame,
+    *,
+    index: bool = True,
+    max_cols: int = DEFAULT_MAX_COLS,
+    max_pages: int = DEFAULT_MAX_PAGES,
+    max_rows: Optional[int] = None,
+) -> None:
+    """
+    DataFrame을 Markdown 표로 out(텍스트 스트림/파일)에 바로 쓴다.
+    - 컬럼이 max_cols를 넘으면 max_cols개씩 나눈 표를 순서대로 출력(각 표 위에 컬럼 범위 표시)
+    - max_cols * max_pages를 넘는 컬럼은 출력하지 않고 생략된 개수만 안내
+    - max_rows: 출력 행 상한(None이면 전체)
+    """
+    n_rows = len(df) if max_rows is None else min(len(df), int(max_rows))
+    n_cols = df.shape[1]
+    max_cols = max(1, int(max_cols))
+    shown = min(n_cols, max_cols * max(1, int(max_pages)))
+
+    if n_cols <= max_cols:
+        _write_page(out, df, list(range(n_cols)), index=index, max_rows=n_rows)
+    else:
+        for start in range(0, shown, max_cols):
+            end = min(start + max_cols, shown)
+            if start:
+                out.write("\n")
+            out.write(f"_컬럼 {start + 1}-{end} / {n_cols}_\n\n")
+            _write_page(out, df, list(range(start, end)), index=index, max_rows=n_rows)
+        if shown < n_cols:
+            out.write(f"\n_나머지 {n_cols - shown}개 컬럼 생략(최대 {shown}개 표시)_\n")
+
+    if n_rows < len(df):
+        out.write(f"\n_상위 {n_rows}행만 표시(전체 {len(df)}행)_\n")
+
+
+def render_table(df: pd.DataFrame, **kwargs: Any) -> str:
+    """write_table()의 문자열 반환 버전(끝 줄바꿈 제외)."""
+    buf = io.StringIO()
+    write_table(buf, df, **kwargs)
+    return buf.getvalue().rstrip("\n")
+
+
+# 섹션 수신자(UI 등): sink(report_name, section_md)
+SectionSink = Callable[[str, str], Awaitable[None]]
+
+
+class SectionWriter:
+    """
+    섹션 단위 스트리밍 보고서 작성기.
+    - emit()마다 섹션을 파일 끝에 이어 쓰고 flush(생산자가 끝나는 즉시 디스크에 반영)
+    - emit_stream(write)는 큰 표 섹션용: write(fh)가 파일 핸들에 직접 씀(write_table 등, 섹션 문자열을 만들지 않음)
+    - sink가 있으면 같은 섹션을 바로 전달(UI가 LLM 등 느린 단계를 기다리지 않고 먼저 표시)
+    - sink 실패는 보고서 작성에 영향을 주지 않음(best-effort)
+    """
+
+    def __init__(self, path: str | Path, *, name: Optional[str] = None, sink: Optional[SectionSink] = None):
+        self.path = Path(path)
+        self.name = name or self.path.stem
+        self.sink = sink
+        self.sections = 0
+        self.path.write_text("", encoding="utf-8")
+        # 동시 생산자끼리 섹션(파일 쓰기 + sink 전달)이 섞이거나 순서가 바뀌지 않도록 섹션 단위로 직렬화
+        self._lock = asyncio.Lock()
+
+    async def emit(self, section_md: str) -> None:
+        if not section_md:
+            return
+        async with self._lock:
+            with self.path.open("a", encoding="utf-8") as f:
+                f.write(section_md if section_md.endswith("\n") else section_md + "\n")
+            self.sections += 1
+            await self._send(section_md)
+
+    async def emit_stream(self, write: Callable[[TextIO], None]) -> None:
+        """
+        write(fh)로 섹션을 파일에 직접 쓴다(표 렌더링은 스레드 풀에서 실행, 이벤트 루프를 막지 않음).
+        - sink가 있을 때만 방금 쓴 구간을 파일에서 다시 읽어 전달
+        """
+        async with self._lock:
+            start = self.path.stat().st_size
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(None, self._append, write)
+            end = self.path.stat().st_size
+            if end == start:
+                return
+            self.sections += 1
+            if self.sink is not None:
+                with self.path.open("rb") as f:
+                    f.seek(start)
+                    await self._send(f.read(end - start).decode("utf-8"))
+
+    def _append(self, write: Callable[[TextIO], None]) -> None:
+        with self.path.open("a", encoding="utf-8") as f:
+            write(f)
+
+    async def _send(self, section_md: str) -> None:
+        if self.sink is None:
+            return
+        try:
+            await self.sink(self.name, section_md)
+        except Exception:
+            pass
+
+    def read_text(self) -> str:
+        return self.path.read_text(encoding="utf-8")
@@ -29,6 +29,10 @@ def main() -> int:
     from core.tests.smoke_route import smoke_route
     from core.tests.smoke_meta import smoke_meta
     from core.tests.smoke_audit import smoke_audit
+    from core.tests.smoke_data_analysis import smoke_data_analysis
+    from core.tests.smoke_plotting import smoke_plotting
+    from core.tests.smoke_report_writer import smoke_report_writer
+    from core.tests.smoke_dia import smoke_dia
 
 
     ok = True
@@ -37,6 +41,10 @@ def main() -> int:
     ok &= _run_one("smoke_route", smoke_route)
     ok &= _run_one("smoke_meta", smoke_meta)
     ok &= _run_one("smoke_audit", smoke_audit)
+    ok &= _run_one("smoke_data_analysis", smoke_data_analysis)
+    ok &= _run_one("smoke_plotting", smoke_plotting)
+    ok &= _run_one("smoke_report_writer", smoke_report_writer)
+    ok &= _run_one("smoke_dia", smoke_dia)
 
     print("----")
     if ok: